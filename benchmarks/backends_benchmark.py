@@ -0,0 +1,31 @@
+from argparse import ArgumentParser
+from time import perf_counter
+
+from src.recursive_math import DecimalBackend, FractionBackend, FixedPointBackend, BallBackend, set_decimal_precision
+from src.recursive_math.examples import readme_loop
+
+
+def main():
+    parser = ArgumentParser(description="Compare arithmetic backends on the README recurrence.")
+    parser.add_argument("--terms", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--precision", type=int, default=1000, help="Decimal digits for the decimal backend.")
+    parser.add_argument("--bits", type=int, default=256, help="Fractional bits for the fixed point and ball backends.")
+    args = parser.parse_args()
+
+    set_decimal_precision(args.precision)
+    backends = [DecimalBackend(), FractionBackend(), FixedPointBackend(bits=args.bits), BallBackend(bits=args.bits)]
+
+    print(f"{'N':>5} {'backend':>28} {'seconds':>10} {'speedup':>8}")
+    for N in args.terms:
+        baseline = None
+        for backend in backends:
+            start = perf_counter()
+            readme_loop(N, backend)
+            elapsed = perf_counter() - start
+            if baseline is None:
+                baseline = elapsed
+            print(f"{N:>5} {repr(backend):>28} {elapsed:>10.3f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+from argparse import ArgumentParser
+from time import perf_counter
+
+from numpy import array, abs as np_abs
+from numpy.random import default_rng
+
+from src.recursive_math import ChebyshevTable, DecimalBackend, set_decimal_precision, warmup
+from src.recursive_math.examples import readme_solver
+from .series_benchmark import best_of
+
+
+def main():
+    parser = ArgumentParser(description="Compare reduce and evaluate per (B, x) pair with a Chebyshev table.")
+    parser.add_argument("--terms", type=int, default=100)
+    parser.add_argument("--points", type=int, default=10 ** 6)
+    parser.add_argument("--tolerance", type=float, nargs="+", default=[1e-6, 1e-10])
+    parser.add_argument("--degree", type=int, default=8)
+    parser.add_argument("--precision", type=int, default=100, help="Decimal digits for the decimal backend.")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    warmup()
+    set_decimal_precision(args.precision)
+    tensor = readme_solver(args.terms, DecimalBackend()).freeze()
+    rng = default_rng(0)
+    b, x = rng.uniform(-1, 1, args.points), rng.uniform(-0.5, 0.5, args.points)
+
+    # Every query reduces the tensor at its own B, so the per point cost is timed on a sample
+    sample = min(args.points, 10 ** 4)
+    start = perf_counter()
+    expected = array([tensor.reduce(b_i).evaluate(x_i) for b_i, x_i in zip(b[:sample], x[:sample])])
+    per_point = (perf_counter() - start) / sample
+
+    print(f"{args.points} points, {args.terms} terms")
+    print(f"{'method':>18} {'build':>8} {'cells':>10} {'query':>10} {'per point':>10} {'speedup':>8} {'error':>9}")
+    print(f"{'reduce/evaluate':>18} {'-':>8} {'-':>10} {per_point * args.points:>10.3f} "
+          f"{per_point * 1e9:>8.0f}ns {1:>7.0f}x {'-':>9}")
+    for tolerance in args.tolerance:
+        start = perf_counter()
+        table = ChebyshevTable.from_tensor(tensor, (-1, 1), (-0.5, 0.5), tolerance=tolerance, degree=args.degree)
+        build = perf_counter() - start
+
+        table.evaluate(b[:2], x[:2])
+        query = best_of(args.repeats, lambda: table.evaluate(b, x))
+        error = np_abs(table.evaluate(b[:sample], x[:sample]) - expected).max()
+        cells = "x".join(str(cells) for cells in table.cells)
+        print(f"{f'table/{tolerance:.0e}':>18} {build:>8.3f} {cells:>10} {query:>10.3f} "
+              f"{query / args.points * 1e9:>8.0f}ns {per_point * args.points / query:>7.0f}x {error:>9.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+from argparse import ArgumentParser
+from time import perf_counter
+
+from src.recursive_math import DecimalBackend, FractionBackend, FixedPointBackend
+from src.recursive_math.examples import readme_loop
+
+
+def main():
+    parser = ArgumentParser(description="Compare IterativeConstant.conv with the online Convolution.")
+    parser.add_argument("--terms", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--block-sizes", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--backend", choices=["decimal", "fraction", "fixed"], default="fixed")
+    args = parser.parse_args()
+
+    backend = {"decimal": DecimalBackend, "fraction": FractionBackend, "fixed": FixedPointBackend}[args.backend]()
+
+    print(f"{'N':>5} {'method':>12} {'seconds':>10} {'speedup':>8}")
+    for N in args.terms:
+        start = perf_counter()
+        readme_loop(N, backend)
+        baseline = perf_counter() - start
+        print(f"{N:>5} {'conv':>12} {baseline:>10.3f} {1:>7.2f}x")
+
+        for block_size in args.block_sizes:
+            start = perf_counter()
+            readme_loop(N, backend, block_size=block_size)
+            elapsed = perf_counter() - start
+            print(f"{N:>5} {f'online/{block_size}':>12} {elapsed:>10.3f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
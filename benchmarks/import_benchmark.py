@@ -0,0 +1,36 @@
+from argparse import ArgumentParser
+from time import perf_counter
+import subprocess
+import sys
+
+
+def run(code: str) -> float:
+    start = perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)
+    return perf_counter() - start
+
+
+def best_of(repeats: int, code: str) -> float:
+    return min(run(code) for _ in range(repeats))
+
+
+def main():
+    parser = ArgumentParser(description="Time importing recursive_math and compiling its kernels in a fresh process.")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ("python", "pass"),
+        ("import", "import src.recursive_math"),
+        ("import + warmup", "import src.recursive_math as r; r.warmup()"),
+    ]
+
+    # The first warmup fills the on-disk cache, later processes only load from it
+    first = run(cases[2][1])
+    print(f"{'first warmup':>16} {first:>8.3f} s")
+    for name, code in cases:
+        print(f"{name:>16} {best_of(args.repeats, code):>8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
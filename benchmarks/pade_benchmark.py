@@ -0,0 +1,38 @@
+from argparse import ArgumentParser
+
+from numpy import linspace, log1p, abs as np_abs
+
+from src.recursive_math import Series, Log1p, warmup
+from .series_benchmark import best_of
+
+
+def main():
+    parser = ArgumentParser(description="Compare a long Series with its Pade approximant on log(1 + x).")
+    parser.add_argument("--points", type=int, default=10 ** 6)
+    parser.add_argument("--terms", type=int, default=200)
+    parser.add_argument("--orders", type=int, nargs="+", default=[4, 8, 12])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    warmup()
+    series = Series(Log1p(name="f", holder_name="B").float_coefficients(args.terms))
+    # Up to the radius of convergence, where the series needs every term, and past it
+    inside = linspace(-0.95, 0.95, args.points)
+    outside = linspace(-0.95, 3.0, args.points)
+
+    approximants = [(f"series/{args.terms}", series)]
+    approximants += [(f"pade/{order}/{order}", series.to_pade(order, order)) for order in args.orders]
+
+    baseline = None
+    print(f"{'method':>14} {'seconds':>10} {'speedup':>8} {'error |x|<1':>12} {'error x<=3':>12}")
+    for name, approximant in approximants:
+        elapsed = best_of(args.repeats, lambda: approximant.evaluate(inside))
+        if baseline is None:
+            baseline = elapsed
+        error_inside = np_abs(approximant.evaluate(inside) - log1p(inside)).max()
+        error_outside = np_abs(approximant.evaluate(outside) - log1p(outside)).max()
+        print(f"{name:>14} {elapsed:>10.4f} {baseline / elapsed:>7.2f}x {error_inside:>12.2e} {error_outside:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
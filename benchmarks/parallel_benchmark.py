@@ -0,0 +1,58 @@
+from argparse import ArgumentParser
+from os import cpu_count
+from time import perf_counter
+
+from src.recursive_math import IterativeConstant, DecimalBackend, ParallelExecutor, set_decimal_precision
+from src.recursive_math.examples import readme_solver
+
+
+def decimal_solver(N: int) -> IterativeConstant:
+    return readme_solver(N, DecimalBackend())
+
+
+def main():
+    parser = ArgumentParser(description="Compare serial and process pool generation of coefficients.")
+    parser.add_argument("--terms", type=int, nargs="+", default=[300])
+    parser.add_argument("--precision", type=int, default=1000, help="Decimal digits for the decimal backend.")
+    parser.add_argument("--workers", type=int, default=None, help="Processes in the pool, defaults to every core.")
+    parser.add_argument("--chunk-size", type=int, default=16)
+    parser.add_argument("--convolutions", type=int, default=10, help="Convolution terms timed for each N.")
+    parser.add_argument("--series", type=int, default=8, help="Independent series generated for each N.")
+    args = parser.parse_args()
+
+    set_decimal_precision(args.precision)
+    print(f"cores: {cpu_count()}")
+    print(f"{'N':>5} {'work':>12} {'serial':>10} {'parallel':>10} {'speedup':>8}")
+    with ParallelExecutor(max_workers=args.workers, chunk_size=args.chunk_size) as executor:
+        # The first submissions pay for spawning the workers
+        executor.generate(decimal_solver, [2])
+
+        for N in args.terms:
+            a_n = decimal_solver(N)
+            indices = range(N - args.convolutions, N)
+
+            start = perf_counter()
+            for n in indices:
+                a_n.conv(a_n, i=0, n=n, n_index=n)
+            serial = perf_counter() - start
+
+            start = perf_counter()
+            for n in indices:
+                a_n.conv(a_n, i=0, n=n, n_index=n, executor=executor)
+            parallel = perf_counter() - start
+            print(f"{N:>5} {'convolution':>12} {serial:>10.3f} {parallel:>10.3f} {serial / parallel:>7.2f}x")
+
+            sizes = [N - i for i in range(args.series)]
+            start = perf_counter()
+            for size in sizes:
+                decimal_solver(size)
+            serial = perf_counter() - start
+
+            start = perf_counter()
+            executor.generate(decimal_solver, sizes)
+            parallel = perf_counter() - start
+            print(f"{N:>5} {'series':>12} {serial:>10.3f} {parallel:>10.3f} {serial / parallel:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
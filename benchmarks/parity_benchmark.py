@@ -0,0 +1,45 @@
+from argparse import ArgumentParser
+from time import perf_counter
+
+from src.recursive_math import IterativeConstant, ScalerHolder, Sin, Cos, FractionBackend, FixedPointBackend
+
+
+def dense_conv(a: IterativeConstant, b: IterativeConstant, n: int) -> ScalerHolder:
+    # IterativeConstant.conv before zero terms were skipped
+    holder = b.get(0).zero()
+    for i in range(n + 1):
+        holder = holder.add(a.get(i).multiply(b.get(n - i)))
+    return holder
+
+
+def main():
+    parser = ArgumentParser(description="Convolve sin(x) with cos(x) with and without skipping the zero terms.")
+    parser.add_argument("--terms", type=int, nargs="+", default=[100, 200])
+    parser.add_argument("--backend", choices=["fraction", "fixed"], default="fraction")
+    args = parser.parse_args()
+
+    backend = {"fraction": FractionBackend, "fixed": FixedPointBackend}[args.backend]()
+
+    print(f"{'N':>5} {'dense':>10} {'sparse':>10} {'speedup':>8} {'holders':>8} {'dense bytes':>12} {'bytes':>8}")
+    for N in args.terms:
+        sin_x = Sin(name="f", holder_name="B", max_n=N, backend=backend).generate(N)
+        cos_x = Cos(name="g", holder_name="B", max_n=N, backend=backend).generate(N)
+
+        start = perf_counter()
+        for n in range(N):
+            dense_conv(sin_x, cos_x, n)
+        dense = perf_counter() - start
+
+        start = perf_counter()
+        for n in range(N):
+            sin_x.conv(cos_x, i=0, n=n, n_index=n)
+        sparse = perf_counter() - start
+
+        holders = len({id(holder) for holder in sin_x.holders})
+        dense_bytes = IterativeConstant(initial_holders=sin_x.holders, name="f").freeze().constants.nbytes
+        nbytes = sin_x.freeze().constants.nbytes
+        print(f"{N:>5} {dense:>10.3f} {sparse:>10.3f} {dense / sparse:>7.2f}x {holders:>8} {dense_bytes:>12} {nbytes:>8}")
+
+
+if __name__ == "__main__":
+    main()
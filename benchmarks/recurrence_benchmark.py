@@ -0,0 +1,57 @@
+from argparse import ArgumentParser
+from time import perf_counter
+
+from numpy import linspace
+
+from src.recursive_math import DecimalBackend, FractionBackend, FixedPointBackend, set_decimal_precision
+from src.recursive_math.examples import readme_equation, readme_loop
+
+
+def main():
+    parser = ArgumentParser(description="Compare the Recurrence solver with the hand written README loop.")
+    parser.add_argument("--terms", type=int, nargs="+", default=[50, 100])
+    parser.add_argument("--precision", type=int, default=1000, help="Decimal digits for the decimal backend.")
+    parser.add_argument("--bits", type=int, default=256, help="Fractional bits for the fixed point backend.")
+    parser.add_argument("--scalers", type=int, default=100, help="B values for the numeric comparison.")
+    args = parser.parse_args()
+
+    set_decimal_precision(args.precision)
+    backends = [DecimalBackend(), FractionBackend(), FixedPointBackend(bits=args.bits)]
+
+    print(f"{'N':>5} {'backend':>28} {'loop':>10} {'solver':>10} {'resume':>10} {'speedup':>8}")
+    for N in args.terms:
+        for backend in backends:
+            start = perf_counter()
+            readme_loop(N, backend, block_size=1)
+            loop = perf_counter() - start
+
+            recurrence = readme_equation(backend)
+            start = perf_counter()
+            recurrence.solve(N + 2)
+            solver = perf_counter() - start
+
+            # Extending to 2N only computes the new terms
+            start = perf_counter()
+            recurrence.solve(2 * N + 2)
+            resume = perf_counter() - start
+
+            print(f"{N:>5} {repr(backend):>28} {loop:>10.3f} {solver:>10.3f} {resume:>10.3f} {loop / solver:>7.2f}x")
+
+    # Symbolic generation followed by reducing at every B value, against running the recurrence in float64
+    scalers = linspace(-2, 2, args.scalers)
+    print(f"{'N':>5} {'B values':>10} {'symbolic':>10} {'numeric':>10} {'speedup':>8}")
+    for N in args.terms:
+        start = perf_counter()
+        tensor = readme_equation(DecimalBackend()).solve(N).freeze()
+        for scaler in scalers:
+            tensor.reduce(scaler)
+        symbolic = perf_counter() - start
+
+        start = perf_counter()
+        readme_equation(DecimalBackend()).solve_numeric(N, scalers)
+        numeric = perf_counter() - start
+        print(f"{N:>5} {len(scalers):>10} {symbolic:>10.3f} {numeric:>10.3f} {symbolic / numeric:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numba
+from numpy import empty, empty_like, float32, linspace
+from numpy.random import default_rng
+
+from src.recursive_math import Series
+
+
+@numba.jit(nopython=True)
+def allocating_horner(x, constants):
+    constants = constants[::-1]
+
+    value = empty_like(x)
+    value[:] = constants[0]
+
+    for i in range(1, len(constants)):
+        value = value * x + constants[i]
+    return value
+
+
+def best_of(repeats: int, function) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main():
+    parser = ArgumentParser(description="Compare Series.evaluate with the previous allocating Horner kernel.")
+    parser.add_argument("--points", type=int, default=10 ** 7)
+    parser.add_argument("--terms", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    series = Series(default_rng(0).normal(size=args.terms) / 10)
+    x = linspace(-1, 1, args.points)
+    out = empty(args.points)
+    out_32 = empty(args.points, dtype=float32)
+    x_32 = x.astype(float32)
+
+    allocating_horner(x[:2], series.constants)
+    series.evaluate(x[:2])
+    series.evaluate(x_32[:2], dtype=float32)
+
+    baseline = best_of(args.repeats, lambda: allocating_horner(x, series.constants))
+    cases = [
+        ("allocating", baseline),
+        ("evaluate", best_of(args.repeats, lambda: series.evaluate(x))),
+        ("evaluate out=", best_of(args.repeats, lambda: series.evaluate(x, out=out))),
+        ("float32 out=", best_of(args.repeats, lambda: series.evaluate(x_32, out=out_32))),
+    ]
+
+    print(f"{args.points} points, {args.terms} terms, {numba.get_num_threads()} threads")
+    for name, elapsed in cases:
+        print(f"{name:>14} {elapsed:>10.4f} s {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+import gc
+import json
+import platform
+import tracemalloc
+from argparse import ArgumentParser
+from itertools import product
+from os import cpu_count
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+
+import numba
+import numpy
+from numpy import linspace
+from numpy.random import default_rng
+
+from src.recursive_math import IterativeConstant, ScalerHolder, DecimalBackend, warmup
+from src.recursive_math.examples import readme_solver
+from .series_benchmark import best_of
+
+
+def measure(function: Callable[[], object], repeats: int, minimum: float = 0.01) -> float:
+    # Fast cases are looped until one measurement takes at least ``minimum`` seconds, then timed per call
+    start = perf_counter()
+    function()
+    number = max(1, int(minimum / max(perf_counter() - start, 1e-9)))
+    return best_of(repeats, lambda: [function() for _ in range(number)]) / number
+
+
+def allocated(build: Callable[[], object]) -> int:
+    # Bytes held by what build returns, freed again before the next case
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def random_holder(degree: int, backend: DecimalBackend, rng) -> ScalerHolder:
+    # Quotients of random integers fill every digit of the precision, like generated coefficients do
+    constants = []
+    for _ in range(degree + 1):
+        numerator, denominator = (backend.convert(int(value)) for value in rng.integers(1, 997, size=2))
+        constants.append(backend.divide(numerator, denominator))
+    return ScalerHolder._from_native(constants, name="B", backend=backend)
+
+
+def random_constant(terms: int, degree: int, backend: DecimalBackend, rng) -> IterativeConstant:
+    return IterativeConstant([random_holder(degree, backend, rng) for _ in range(terms)], name="a")
+
+
+def multiply_case(degree: int, precision: int) -> Callable[[], object]:
+    backend, rng = DecimalBackend(precision=precision), default_rng(0)
+    a, b = random_holder(degree, backend, rng), random_holder(degree, backend, rng)
+    return lambda: a.multiply(b)
+
+
+def conv_case(terms: int, degree: int, precision: int) -> Callable[[], object]:
+    a_n = random_constant(terms, degree, DecimalBackend(precision=precision), default_rng(0))
+    return lambda: a_n.conv(a_n, i=0, n=terms - 1, n_index=terms - 1)
+
+
+def freeze_case(terms: int, degree: int) -> Callable[[], object]:
+    a_n = random_constant(terms, degree, DecimalBackend(precision=100), default_rng(0))
+    return a_n.freeze
+
+
+def freeze_double_double_case(terms: int, degree: int) -> Callable[[], object]:
+    a_n = random_constant(terms, degree, DecimalBackend(precision=100), default_rng(0))
+    return lambda: a_n.freeze(precision="double-double")
+
+
+def reduce_case(terms: int, degree: int) -> Callable[[], object]:
+    tensor = random_constant(terms, degree, DecimalBackend(precision=100), default_rng(0)).freeze()
+    return lambda: tensor.reduce(0.5)
+
+
+def reduce_cached_case(terms: int, degree: int) -> Callable[[], object]:
+    # The same few B values over and over, as a service sees them
+    tensor = random_constant(terms, degree, DecimalBackend(precision=100), default_rng(0)).freeze().enable_cache()
+    values = [0.25 * i for i in range(8)]
+    return lambda: [tensor.reduce(value) for value in values]
+
+
+def evaluate_case(terms: int, points: int) -> Callable[[], object]:
+    series = random_constant(terms, 0, DecimalBackend(precision=100), default_rng(0)).freeze().reduce(0.5)
+    x = linspace(-1, 1, points)
+    return lambda: series.evaluate(x)
+
+
+def evaluate_double_double_case(terms: int, points: int) -> Callable[[], object]:
+    tensor = random_constant(terms, 0, DecimalBackend(precision=100), default_rng(0)).freeze(precision="double-double")
+    series = tensor.reduce(0.5)
+    x = linspace(-1, 1, points)
+    return lambda: series.evaluate(x)
+
+
+def readme_case(terms: int, points: int, precision: int) -> Callable[[], object]:
+    # The README equation from generation to evaluation
+    backend = DecimalBackend(precision=precision)
+    x = linspace(-1, 1, points)
+    return lambda: readme_solver(terms, backend).freeze().reduce(1.0).evaluate(x)
+
+
+def holder_memory_case(degree: int, precision: int) -> Tuple[Callable[[], object], int]:
+    # Products, like the intermediate results of generation
+    backend, rng = DecimalBackend(precision=precision), default_rng(0)
+    a, b = random_holder(degree // 2, backend, rng), random_holder(degree - degree // 2, backend, rng)
+    return lambda: [a.multiply(b) for _ in range(1000)], 1000
+
+
+def term_memory_case(terms: int, precision: int) -> Tuple[Callable[[], object], int]:
+    # Everything a solved README series keeps, the recurrence included
+    backend = DecimalBackend(precision=precision)
+    return lambda: readme_solver(terms, backend), terms
+
+
+CASES = {
+    "multiply": (multiply_case, ["degree", "precision"]),
+    "conv": (conv_case, ["terms", "degree", "precision"]),
+    "freeze": (freeze_case, ["terms", "degree"]),
+    "freeze_double_double": (freeze_double_double_case, ["terms", "degree"]),
+    "reduce": (reduce_case, ["terms", "degree"]),
+    "reduce_cached": (reduce_cached_case, ["terms", "degree"]),
+    "evaluate": (evaluate_case, ["terms", "points"]),
+    "evaluate_double_double": (evaluate_double_double_case, ["terms", "points"]),
+    "readme": (readme_case, ["terms", "points", "precision"]),
+}
+
+# Measured in bytes per object instead of seconds
+MEMORY_CASES = {
+    "holder_memory": (holder_memory_case, ["degree", "precision"]),
+    "term_memory": (term_memory_case, ["terms", "precision"]),
+}
+
+
+def environment() -> Dict[str, object]:
+    return {"python": platform.python_version(), "numpy": numpy.__version__, "numba": numba.__version__,
+            "machine": platform.machine(), "system": platform.system(), "cores": cpu_count(),
+            "threads": numba.get_num_threads()}
+
+
+def key(result: Dict[str, object]) -> str:
+    params = ", ".join(f"{name}={value}" for name, value in sorted(result["params"].items()))
+    return f"{result['case']}({params})"
+
+
+def run(cases: List[str], sizes: Dict[str, List[int]], repeats: int) -> List[Dict[str, object]]:
+    results = []
+    for case in cases:
+        build, names = CASES[case] if case in CASES else MEMORY_CASES[case]
+        for values in product(*(sizes[name] for name in names)):
+            params = dict(zip(names, values))
+            if case in MEMORY_CASES:
+                function, count = build(**params)
+                size = allocated(function) / count
+                results.append({"case": case, "params": params, "bytes": size})
+                print(f"{key(results[-1]):>60} {size:>12.0f} B")
+                continue
+            seconds = measure(build(**params), repeats)
+            results.append({"case": case, "params": params, "seconds": seconds, "repeats": repeats})
+            print(f"{key(results[-1]):>60} {seconds:>12.6f} s")
+    return results
+
+
+def metric(result: Dict[str, object]) -> float:
+    return result["seconds"] if "seconds" in result else result["bytes"]
+
+
+def compare(results: List[Dict[str, object]], baseline: List[Dict[str, object]], tolerance: float) -> bool:
+    # Returns False when any case is slower or larger than its baseline by more than the tolerance
+    baseline = {key(result): metric(result) for result in baseline}
+    passed = True
+    print(f"{'case':>60} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for result in results:
+        name = key(result)
+        if name not in baseline:
+            print(f"{name:>60} {'-':>12} {metric(result):>12.6g} {'new':>8}")
+            continue
+        ratio = metric(result) / baseline[name]
+        status = (" slower" if "seconds" in result else " larger") if ratio > 1 + tolerance else ""
+        passed = passed and not status
+        print(f"{name:>60} {baseline[name]:>12.6g} {metric(result):>12.6g} {ratio:>7.2f}x{status}")
+    return passed
+
+
+def main():
+    parser = ArgumentParser(description="Time generation, freeze, reduce and evaluate over a grid of sizes, "
+                                        "and measure the memory of holders and generated terms.")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES) + list(MEMORY_CASES),
+                        default=list(CASES) + list(MEMORY_CASES))
+    parser.add_argument("--terms", type=int, nargs="+", default=[20, 50])
+    parser.add_argument("--degree", type=int, nargs="+", default=[5, 20])
+    parser.add_argument("--points", type=int, nargs="+", default=[10 ** 5])
+    parser.add_argument("--precision", type=int, nargs="+", default=[100, 1000], help="Decimal digits.")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--compare", help="JSON file from an earlier --output run to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown or growth before a case fails.")
+    args = parser.parse_args()
+
+    warmup()
+    sizes = {"terms": args.terms, "degree": args.degree, "points": args.points, "precision": args.precision}
+    results = run(args.cases, sizes, args.repeats)
+
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump({"environment": environment(), "results": results}, file, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if baseline["environment"] != environment():
+            print(f"Baseline was recorded on {baseline['environment']}")
+        if not compare(results, baseline["results"], args.tolerance):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,15 @@
 from .progress import Progress
-from .common_functions import Sin, Cos
-from .iterative_constants import IterativeConstant, ScalerHolder, set_decimal_precision
-from .series import Series, Tensor
+from .instrumentation import Profiler
+from .backends import (Backend, DecimalBackend, FractionBackend, FixedPointBackend, BallBackend, Ball, set_backend,
+                       get_backend)
+from .common_functions import TaylorSource, FunctionSource, Sin, Cos, Exp, Sinh, Cosh, Log1p, Binomial
+from .iterative_constants import IterativeConstant, ScalerHolder, MultiScalerHolder, set_decimal_precision
+from .convolution import Convolution
+from .series import Series, Tensor, RationalSeries, warmup
+from .chebyshev import ChebyshevTable
+from .storage import save, load, load_frozen
+from .numeric import NumericConstant
+from .streaming import Term, ConvergenceMonitor
+from .recurrence import Recurrence
+from .adaptive import generate_adaptive, is_accurate
+from .parallel import ParallelExecutor
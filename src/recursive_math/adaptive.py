@@ -0,0 +1,39 @@
+from __future__ import annotations
+from typing import Callable
+from fractions import Fraction
+
+from .backends import BallBackend
+from .iterative_constants import IterativeConstant
+
+
+# Half an ulp of float64, the error freeze() adds on its own
+FLOAT64_TOLERANCE = 2.0 ** -53
+
+
+def is_accurate(iterator: IterativeConstant, rel_tol: float = FLOAT64_TOLERANCE, abs_tol: float = 0.0) -> bool:
+    # Every radius has to be below rel_tol times the largest coefficient of its holder, or below abs_tol
+    rel_tol, abs_tol = Fraction(rel_tol), Fraction(abs_tol)
+    for holder in iterator.holders:
+        backend = holder.backend
+        if not isinstance(backend, BallBackend):
+            raise TypeError(f"Error bounds need a BallBackend, got {backend}")
+
+        one = backend.one
+        # A holder whose midpoints are all zero has no scale of its own, its radii are compared with one
+        norm = max((abs(value.mid) for value in holder.constants), default=0) or one
+        bound = max(rel_tol * norm, abs_tol * one)
+        for value in holder.constants:
+            if value.rad > bound:
+                return False
+    return True
+
+
+def generate_adaptive(build: Callable[[BallBackend], IterativeConstant], bits: int = 64, max_bits: int = 8192,
+                      rel_tol: float = FLOAT64_TOLERANCE, abs_tol: float = 0.0) -> IterativeConstant:
+    # Starts cheap and only doubles the working precision while the bounds are too wide for the float64 output
+    while bits <= max_bits:
+        iterator = build(BallBackend(bits=bits))
+        if is_accurate(iterator, rel_tol=rel_tol, abs_tol=abs_tol):
+            return iterator
+        bits *= 2
+    raise ValueError(f"Error bounds were not met with {max_bits} bits")
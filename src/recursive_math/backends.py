@@ -0,0 +1,505 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple, Union
+from decimal import Decimal, Context, MAX_EMAX, MIN_EMIN, MAX_PREC, getcontext
+from fractions import Fraction
+from math import lcm, log10, ceil
+
+from numpy import ndarray, fromiter, float64
+
+from .polynomial import schoolbook, multiply_integers
+
+
+Number = Union[int, float, Decimal, Fraction]
+
+# Below this operand length the native values are multiplied directly, giving the same result as before
+SCHOOLBOOK_CUTOFF = 8
+
+LOG10_2 = log10(2)
+
+# Rounding to 40 digits first is much cheaper than converting every digit, and only double rounds
+# when a value lies within 10^-40 of halfway between two floats
+_FLOAT_CONTEXT = Context(prec=40, Emax=MAX_EMAX, Emin=MIN_EMIN)
+_EPSILONS: Dict[int, Decimal] = {}
+
+
+def _integer_digits(value: int) -> int:
+    # Estimated from the bit length, converting large integers to strings is quadratic
+    return max(1, ceil(abs(value).bit_length() * LOG10_2))
+
+
+class Backend:
+    name: str = "backend"
+    zero: Any = 0
+
+    def __eq__(self, backend: Backend) -> bool:
+        if isinstance(backend, Backend):
+            return repr(self) == repr(backend)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(repr(self))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def config(self) -> dict:
+        return {"name": self.name}
+
+    def epsilon(self) -> Any:
+        return self.zero
+
+    def convert(self, value: Number) -> Any:
+        raise NotImplementedError
+
+    def add(self, a: Any, b: Any) -> Any:
+        return a + b
+
+    def negate(self, a: Any) -> Any:
+        return -a
+
+    def multiply(self, a: Any, b: Any) -> Any:
+        return a * b
+
+    def multiply_integer(self, a: Any, n: int) -> Any:
+        return a * n
+
+    def divide(self, a: Any, b: Any) -> Any:
+        return a / b
+
+    def power(self, value: Any, exponent: int) -> Any:
+        return value ** exponent
+
+    def to_float(self, value: Any) -> float:
+        return float(value)
+
+    def to_floats(self, values: list) -> ndarray:
+        to_float = self.to_float
+        return fromiter((to_float(value) for value in values), dtype=float64, count=len(values))
+
+    def to_double_doubles(self, values: list) -> Tuple[ndarray, ndarray]:
+        # hi is the nearest float and lo the nearest float to the remainder
+        hi = self.to_floats(values)
+        to_fraction = self.to_fraction
+        lo = fromiter((float(to_fraction(value) - Fraction(value_hi)) for value, value_hi in zip(values, hi.tolist())),
+                      dtype=float64, count=len(values))
+        return hi, lo
+
+    def to_decimal(self, value: Any) -> Decimal:
+        raise NotImplementedError
+
+    def exact(self, value: Any) -> Union[Number, Fraction]:
+        # A number that compares and hashes equal to any other exact representation of the same value
+        return value
+
+    def to_fraction(self, value: Any) -> Fraction:
+        return Fraction(value)
+
+    def digits(self, value: Any) -> int:
+        return _integer_digits(int(value))
+
+    def to_exact(self, value: Any) -> Tuple[int, int]:
+        raise NotImplementedError
+
+    def from_exact(self, a: int, b: int) -> Any:
+        raise NotImplementedError
+
+    def to_integers(self, values: list) -> Tuple[List[int], Any]:
+        raise NotImplementedError
+
+    def from_integers(self, values: List[int], a_scale: Any, b_scale: Any) -> list:
+        raise NotImplementedError
+
+    def multiply_polynomials(self, a: list, b: list) -> list:
+        if min(len(a), len(b)) < SCHOOLBOOK_CUTOFF:
+            return schoolbook(a, b, self.multiply, self.add, self.zero)
+
+        a_integers, a_scale = self.to_integers(a)
+        b_integers, b_scale = self.to_integers(b)
+        return self.from_integers(multiply_integers(a_integers, b_integers), a_scale, b_scale)
+
+
+class DecimalBackend(Backend):
+    name = "decimal"
+    zero = Decimal(0)
+
+    def __init__(self, precision: int = None):
+        # Without a precision the global decimal context is used, see set_decimal_precision
+        self.precision: Optional[int] = precision
+        self.context: Optional[Context] = None
+        if precision is not None:
+            self.context = Context(prec=precision, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+    def __repr__(self) -> str:
+        if self.precision is None:
+            return f"{type(self).__name__}()"
+        return f"{type(self).__name__}(precision={self.precision})"
+
+    def config(self) -> dict:
+        if self.precision is None:
+            return {"name": self.name}
+        return {"name": self.name, "precision": self.precision}
+
+    def epsilon(self) -> Decimal:
+        # Holders ask for this on every comparison, so it is built once per precision
+        precision = getcontext().prec if self.precision is None else self.precision
+        epsilon = _EPSILONS.get(precision)
+        if epsilon is None:
+            epsilon = _EPSILONS[precision] = Decimal((0, (1,), -precision))
+        return epsilon
+
+    def convert(self, value: Number) -> Decimal:
+        context = self.context
+        if isinstance(value, Fraction):
+            if context is None:
+                return Decimal(value.numerator) / Decimal(value.denominator)
+            return context.divide(Decimal(value.numerator), Decimal(value.denominator))
+        if context is None:
+            return Decimal(value)
+        return context.create_decimal(value)
+
+    def add(self, a: Decimal, b: Decimal) -> Decimal:
+        if self.context is None:
+            return a + b
+        return self.context.add(a, b)
+
+    def negate(self, a: Decimal) -> Decimal:
+        if self.context is None:
+            return -a
+        return self.context.minus(a)
+
+    def multiply(self, a: Decimal, b: Decimal) -> Decimal:
+        if self.context is None:
+            return a * b
+        return self.context.multiply(a, b)
+
+    def multiply_integer(self, a: Decimal, n: int) -> Decimal:
+        if self.context is None:
+            return a * n
+        return self.context.multiply(a, n)
+
+    def divide(self, a: Decimal, b: Decimal) -> Decimal:
+        if self.context is None:
+            return a / b
+        return self.context.divide(a, b)
+
+    def power(self, value: Decimal, exponent: int) -> Decimal:
+        if self.context is None:
+            return value ** Decimal(exponent)
+        return self.context.power(value, Decimal(exponent))
+
+    def to_float(self, value: Decimal) -> float:
+        return float(_FLOAT_CONTEXT.plus(value))
+
+    def to_floats(self, values: list) -> ndarray:
+        plus = _FLOAT_CONTEXT.plus
+        return fromiter((float(plus(value)) for value in values), dtype=float64, count=len(values))
+
+    def to_double_doubles(self, values: list) -> Tuple[ndarray, ndarray]:
+        hi = self.to_floats(values)
+        subtract = _FLOAT_CONTEXT.subtract
+        lo = fromiter((float(subtract(value, Decimal(value_hi))) for value, value_hi in zip(values, hi.tolist())),
+                      dtype=float64, count=len(values))
+        return hi, lo
+
+    def to_decimal(self, value: Decimal) -> Decimal:
+        return value
+
+    def digits(self, value: Decimal) -> int:
+        return len(value.as_tuple().digits)
+
+    def to_exact(self, value: Decimal) -> Tuple[int, int]:
+        exponent = value.as_tuple().exponent
+        return int(value.scaleb(-exponent, _exact_context)), exponent
+
+    def from_exact(self, a: int, b: int) -> Decimal:
+        return Decimal(a).scaleb(b, _exact_context)
+
+    def to_integers(self, values: List[Decimal]) -> Tuple[List[int], int]:
+        exponent = min((value.as_tuple().exponent for value in values if value), default=0)
+        return [int(value.scaleb(-exponent, _exact_context)) for value in values], exponent
+
+    def from_integers(self, values: List[int], a_scale: int, b_scale: int) -> List[Decimal]:
+        exponent = a_scale + b_scale
+        return [Decimal(value).scaleb(exponent, self.context) for value in values]
+
+
+class FractionBackend(Backend):
+    name = "fraction"
+    zero = Fraction(0)
+
+    def convert(self, value: Number) -> Fraction:
+        return Fraction(value)
+
+    def to_decimal(self, value: Fraction) -> Decimal:
+        return Decimal(value.numerator) / Decimal(value.denominator)
+
+    def digits(self, value: Fraction) -> int:
+        return _integer_digits(value.numerator) + _integer_digits(value.denominator)
+
+    def to_exact(self, value: Fraction) -> Tuple[int, int]:
+        return value.numerator, value.denominator
+
+    def from_exact(self, a: int, b: int) -> Fraction:
+        return Fraction(a, b)
+
+    def to_integers(self, values: List[Fraction]) -> Tuple[List[int], int]:
+        denominator = lcm(*(value.denominator for value in values))
+        return [value.numerator * (denominator // value.denominator) for value in values], denominator
+
+    def from_integers(self, values: List[int], a_scale: int, b_scale: int) -> List[Fraction]:
+        denominator = a_scale * b_scale
+        return [Fraction(value, denominator) for value in values]
+
+
+class FixedPointBackend(Backend):
+    name = "fixed"
+    zero = 0
+
+    def __init__(self, bits: int = 256):
+        if bits < 1:
+            raise ValueError(f"Fixed point backend needs at least one fractional bit, got {bits}")
+        self.bits: int = bits
+        self.one: int = 1 << bits
+        self.half: int = 1 << (bits - 1)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(bits={self.bits})"
+
+    def convert(self, value: Number) -> int:
+        if isinstance(value, int):
+            return value << self.bits
+        return round(Fraction(value) * self.one)
+
+    def multiply(self, a: int, b: int) -> int:
+        return (a * b + self.half) >> self.bits
+
+    def divide(self, a: int, b: int) -> int:
+        if b < 0:
+            a, b = -a, -b
+        return (2 * (a << self.bits) + b) // (2 * b)
+
+    def power(self, value: int, exponent: int) -> int:
+        result = self.one
+        for _ in range(exponent):
+            result = self.multiply(result, value)
+        return result
+
+    def to_float(self, value: int) -> float:
+        return value / self.one
+
+    def to_decimal(self, value: int) -> Decimal:
+        return Decimal(value) / Decimal(self.one)
+
+    def exact(self, value: int) -> Fraction:
+        return Fraction(value, self.one)
+
+    def to_fraction(self, value: int) -> Fraction:
+        return Fraction(value, self.one)
+
+    def digits(self, value: int) -> int:
+        return _integer_digits(value)
+
+    def config(self) -> dict:
+        return {"name": self.name, "bits": self.bits}
+
+    def to_exact(self, value: int) -> Tuple[int, int]:
+        return value, self.bits
+
+    def from_exact(self, a: int, b: int) -> int:
+        if b != self.bits:
+            raise ValueError(f"Value has {b} fractional bits, backend uses {self.bits}")
+        return a
+
+    def to_integers(self, values: List[int]) -> Tuple[List[int], int]:
+        return values, self.bits
+
+    def from_integers(self, values: List[int], a_scale: int, b_scale: int) -> List[int]:
+        bits = a_scale + b_scale - self.bits
+        half = 1 << (bits - 1)
+        return [(value + half) >> bits for value in values]
+
+
+class Ball:
+    # Midpoint and radius in units of 2**-bits of a BallBackend, the exact value lies in [mid - rad, mid + rad]
+    __slots__ = ("mid", "rad")
+
+    def __init__(self, mid: int, rad: int = 0):
+        self.mid: int = mid
+        self.rad: int = rad
+
+    def __repr__(self) -> str:
+        return f"Ball({self.mid}, {self.rad})"
+
+    def __add__(self, other: Ball) -> Ball:
+        if isinstance(other, Ball):
+            return Ball(self.mid + other.mid, self.rad + other.rad)
+        if other == 0:
+            return self
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Ball) -> Ball:
+        return self + (-other)
+
+    def __neg__(self) -> Ball:
+        return Ball(-self.mid, self.rad)
+
+    def __abs__(self) -> Ball:
+        return Ball(abs(self.mid), self.rad)
+
+    def __mul__(self, other: int) -> Ball:
+        # Only integer factors are exact, products of balls go through BallBackend.multiply
+        if isinstance(other, int):
+            return Ball(self.mid * other, self.rad * abs(other))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __bool__(self) -> bool:
+        return bool(self.mid or self.rad)
+
+    def __eq__(self, other: Ball) -> bool:
+        if isinstance(other, Ball):
+            return self.mid == other.mid and self.rad == other.rad
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.mid, self.rad))
+
+    # Orderings only hold when they are certain for every value in the balls
+    def __lt__(self, other: Ball) -> bool:
+        return self.mid + self.rad < other.mid - other.rad
+
+    def __gt__(self, other: Ball) -> bool:
+        return self.mid - self.rad > other.mid + other.rad
+
+    def __le__(self, other: Ball) -> bool:
+        return not self > other
+
+    def __ge__(self, other: Ball) -> bool:
+        return not self < other
+
+
+def _ceil_shift(value: int, bits: int) -> int:
+    return -((-value) >> bits)
+
+
+class BallBackend(Backend):
+    name = "ball"
+    zero = Ball(0)
+
+    def __init__(self, bits: int = 128):
+        if bits < 1:
+            raise ValueError(f"Ball backend needs at least one fractional bit, got {bits}")
+        self.bits: int = bits
+        self.one: int = 1 << bits
+        self.half: int = 1 << (bits - 1)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(bits={self.bits})"
+
+    def config(self) -> dict:
+        return {"name": self.name, "bits": self.bits}
+
+    def epsilon(self) -> Ball:
+        return self.zero
+
+    def convert(self, value: Number) -> Ball:
+        if isinstance(value, Ball):
+            return value
+        if isinstance(value, int):
+            return Ball(value << self.bits)
+        scaled = Fraction(value) * self.one
+        return Ball(round(scaled), 0 if scaled.denominator == 1 else 1)
+
+    def _round(self, product: int, propagated: int) -> Ball:
+        mid = (product + self.half) >> self.bits
+        rounding = 0 if product == mid << self.bits else 1
+        return Ball(mid, _ceil_shift(propagated, self.bits) + rounding)
+
+    def multiply(self, a: Ball, b: Ball) -> Ball:
+        propagated = abs(a.mid) * b.rad + abs(b.mid) * a.rad + a.rad * b.rad
+        return self._round(a.mid * b.mid, propagated)
+
+    def divide(self, a: Ball, b: Ball) -> Ball:
+        b_mid = abs(b.mid)
+        if b_mid <= b.rad:
+            raise ZeroDivisionError(f"Ball {b} contains zero")
+        sign = -1 if b.mid < 0 else 1
+        numerator = sign * (a.mid << self.bits)
+        mid = (2 * numerator + b_mid) // (2 * b_mid)
+        rounding = 0 if mid * b_mid == numerator else 1
+        # |a / b - a.mid / b.mid| <= (a.rad + |a.mid / b.mid| b.rad) / (|b.mid| - b.rad)
+        propagated = self.one * (a.rad * b_mid + abs(a.mid) * b.rad)
+        bound = b_mid * (b_mid - b.rad)
+        return Ball(mid, -((-propagated) // bound) + rounding)
+
+    def power(self, value: Ball, exponent: int) -> Ball:
+        result = Ball(self.one)
+        for _ in range(exponent):
+            result = self.multiply(result, value)
+        return result
+
+    def to_float(self, value: Ball) -> float:
+        return value.mid / self.one
+
+    def to_decimal(self, value: Ball) -> Decimal:
+        return Decimal(value.mid) / Decimal(self.one)
+
+    def digits(self, value: Ball) -> int:
+        return _integer_digits(value.mid)
+
+    def exact(self, value: Ball) -> Fraction:
+        return Fraction(value.mid, self.one)
+
+    def to_fraction(self, value: Ball) -> Fraction:
+        return Fraction(value.mid, self.one)
+
+    def radius(self, value: Ball) -> Fraction:
+        return Fraction(value.rad, self.one)
+
+    def to_exact(self, value: Ball) -> Tuple[int, int]:
+        return value.mid, value.rad
+
+    def from_exact(self, a: int, b: int) -> Ball:
+        return Ball(a, b)
+
+    def multiply_polynomials(self, a: List[Ball], b: List[Ball]) -> List[Ball]:
+        if min(len(a), len(b)) < SCHOOLBOOK_CUTOFF:
+            return schoolbook(a, b, self.multiply, self.add, self.zero)
+
+        products = multiply_integers([value.mid for value in a], [value.mid for value in b])
+        propagated = [0] * len(products)
+        a_rad = [value.rad for value in a]
+        b_rad = [value.rad for value in b]
+        if any(a_rad) or any(b_rad):
+            a_abs = [abs(value.mid) for value in a]
+            b_abs = [abs(value.mid) for value in b]
+            for x, y in [(a_abs, b_rad), (a_rad, b_abs), (a_rad, b_rad)]:
+                for i, value in enumerate(multiply_integers(x, y)):
+                    propagated[i] += value
+        return [self._round(product, bound) for product, bound in zip(products, propagated)]
+
+
+_exact_context = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+default_backend: Backend = DecimalBackend()
+
+
+def from_config(config: dict) -> Backend:
+    backends = {backend.name: backend for backend in (DecimalBackend, FractionBackend, FixedPointBackend, BallBackend)}
+    config = dict(config)
+    name = config.pop("name")
+    if name not in backends:
+        raise ValueError(f"Unknown backend: {name}")
+    return backends[name](**config)
+
+
+def set_backend(backend: Backend):
+    global default_backend
+    default_backend = backend
+
+
+def get_backend() -> Backend:
+    return default_backend
@@ -0,0 +1,137 @@
+from __future__ import annotations
+from typing import Tuple, Union
+
+from numba import prange
+from numpy import ndarray, arange, asarray, cos, pi, nan, einsum, empty, float64, abs as np_abs, broadcast_arrays
+
+from .series import Tensor, cached_jit
+
+
+Interval = Tuple[float, float]
+
+
+def chebyshev_nodes(degree: int) -> ndarray:
+    # Chebyshev points of the first kind on [-1, 1]
+    return cos(pi * (arange(degree + 1) + 0.5) / (degree + 1))
+
+
+def _transform(degree: int) -> ndarray:
+    # Maps values at the nodes to Chebyshev coefficients
+    n = degree + 1
+    k = arange(n)[:, None]
+    matrix = 2.0 / n * cos(pi * k * (arange(n)[None, :] + 0.5) / n)
+    matrix[0] /= 2
+    return matrix
+
+
+def _cell_nodes(interval: Interval, cells: int, degree: int) -> ndarray:
+    start, stop = interval
+    width = (stop - start) / cells
+    middles = start + width * (arange(cells) + 0.5)
+    return (middles[:, None] + width / 2 * chebyshev_nodes(degree)[None, :]).reshape(-1)
+
+
+@cached_jit(nopython=True, parallel=True)
+def chebyshev_query_into(b: ndarray, x: ndarray, coefficients: ndarray, b_start: float, b_width: float,
+                         x_start: float, x_width: float, out: ndarray) -> ndarray:
+    b_cells, x_cells, n, _ = coefficients.shape
+    for p in prange(len(b)):
+        s = (b[p] - b_start) / b_width
+        t = (x[p] - x_start) / x_width
+        i = int(s)
+        j = int(t)
+        # The last edge belongs to the last cell, anything further out has no value
+        if i == b_cells and s == b_cells:
+            i -= 1
+        if j == x_cells and t == x_cells:
+            j -= 1
+        if s < 0 or t < 0 or i >= b_cells or j >= x_cells:
+            out[p] = nan
+            continue
+        u = 2 * (s - i) - 1
+        v = 2 * (t - j) - 1
+
+        # Clenshaw in B, with each coefficient summed over x by its own Clenshaw recurrence
+        outer_1 = 0.0
+        outer_2 = 0.0
+        for k in range(n - 1, -1, -1):
+            inner_1 = 0.0
+            inner_2 = 0.0
+            for m in range(n - 1, 0, -1):
+                inner_1, inner_2 = coefficients[i, j, k, m] + 2 * v * inner_1 - inner_2, inner_1
+            c_k = coefficients[i, j, k, 0] + v * inner_1 - inner_2
+            if k > 0:
+                outer_1, outer_2 = c_k + 2 * u * outer_1 - outer_2, outer_1
+            else:
+                out[p] = c_k + u * outer_1 - outer_2
+    return out
+
+
+class ChebyshevTable:
+
+    def __init__(self, coefficients: ndarray, b_interval: Interval, x_interval: Interval):
+        # coefficients[i, j, k, m] multiplies T_k(u) T_m(v) in cell (i, j), u and v are the coordinates in the cell
+        self.coefficients: ndarray = asarray(coefficients, dtype=float64)
+        self.b_interval: Interval = (float(b_interval[0]), float(b_interval[1]))
+        self.x_interval: Interval = (float(x_interval[0]), float(x_interval[1]))
+
+    @property
+    def cells(self) -> Tuple[int, int]:
+        return self.coefficients.shape[0], self.coefficients.shape[1]
+
+    @property
+    def degree(self) -> int:
+        return self.coefficients.shape[2] - 1
+
+    @classmethod
+    def fit(cls, tensor: Tensor, b_interval: Interval, x_interval: Interval, degree: int = 8,
+            cells: Tuple[int, int] = (1, 1)) -> ChebyshevTable:
+        b_cells, x_cells = cells
+        values = tensor.evaluate_grid(_cell_nodes(b_interval, b_cells, degree),
+                                      _cell_nodes(x_interval, x_cells, degree))
+        values = values.reshape(b_cells, degree + 1, x_cells, degree + 1).transpose(0, 2, 1, 3)
+        transform = _transform(degree)
+        return cls(einsum("kj,abjl,ml->abkm", transform, values, transform), b_interval, x_interval)
+
+    @classmethod
+    def from_tensor(cls, tensor: Tensor, b_interval: Interval, x_interval: Interval, tolerance: float = 1e-10,
+                    degree: int = 8, max_cells: int = 4096) -> ChebyshevTable:
+        # Cells are doubled along the direction whose last coefficients are largest until both are below tolerance
+        if tensor.constants.ndim != 2:
+            raise ValueError(f"Tensor has scalers {tensor.names}, only a single scaler is supported")
+
+        cells = (1, 1)
+        while True:
+            table = cls.fit(tensor, b_interval, x_interval, degree=degree, cells=cells)
+            b_tail, x_tail = table.tails()
+            if max(b_tail, x_tail) <= tolerance:
+                return table
+
+            cells = (2 * cells[0], cells[1]) if b_tail >= x_tail else (cells[0], 2 * cells[1])
+            if cells[0] * cells[1] > max_cells:
+                raise ValueError(f"Tolerance {tolerance} was not reached with {max_cells} cells of degree {degree}, "
+                                 f"the last coefficients are {b_tail:.2e} in B and {x_tail:.2e} in x")
+
+    def tails(self) -> Tuple[float, float]:
+        # Sizes of the two highest order coefficients in each direction, an estimate of the truncation error
+        coefficients = np_abs(self.coefficients)
+        b_tail = coefficients[:, :, -2:, :].sum(axis=(2, 3)).max()
+        x_tail = coefficients[:, :, :, -2:].sum(axis=(2, 3)).max()
+        return float(b_tail), float(x_tail)
+
+    def evaluate(self, b: Union[float, ndarray], x: Union[float, ndarray],
+                 out: ndarray = None) -> Union[float, ndarray]:
+        # Points outside the intervals are nan
+        scalar = not isinstance(b, ndarray) and not isinstance(x, ndarray)
+        b, x = broadcast_arrays(asarray(b, dtype=float64), asarray(x, dtype=float64))
+        if out is None:
+            out = empty(b.shape, dtype=float64)
+        elif out.shape != b.shape or out.dtype != float64 or not out.flags.c_contiguous:
+            raise ValueError("Output array has to be float64, C-contiguous and of the shape of the points")
+
+        b_cells, x_cells = self.cells
+        b_start, b_stop = self.b_interval
+        x_start, x_stop = self.x_interval
+        chebyshev_query_into(b.reshape(-1), x.reshape(-1), self.coefficients, b_start, (b_stop - b_start) / b_cells,
+                             x_start, (x_stop - x_start) / x_cells, out.reshape(-1))
+        return float(out) if scalar else out
@@ -1,65 +1,190 @@
 from __future__ import annotations
-from typing import List
+from typing import Callable, Dict, List, Optional, Union
+from copy import copy
 
 from decimal import Decimal
+from fractions import Fraction
 
+from numpy import ndarray, array, float64
+
+from .backends import Backend, Number, get_backend
 from .iterative_constants import IterativeConstant, ScalerHolder
 
 
+_factorials: List[int] = [1]
+
+
+def integer_factorial(n: int) -> int:
+    while len(_factorials) <= n:
+        _factorials.append(_factorials[-1] * len(_factorials))
+    return _factorials[n]
+
+
 def factorial(n: int) -> Decimal:
-    value = Decimal(1)
-    for i in range(1, n + 1):
-        value *= Decimal(i)
-    return value
+    return Decimal(integer_factorial(n))
 
 
-class Sin(IterativeConstant):
+class TaylorSource(IterativeConstant):
+    # Parity of the nonzero coefficients, if the function is even or odd
+    source_parity: Optional[int] = None
 
-    def __init__(self, name: str, holder_name: str, max_n: int = 27, holders: List[ScalerHolder] = None):
+    def __init__(self, name: str, holder_name: str, max_n: int = None, holders: List[ScalerHolder] = None,
+                 backend: Backend = None):
         self.max_n: int = max_n
         self.holder_name: str = holder_name
+        self._coefficients: List[Fraction] = []
+        self._zeros: Dict[Backend, ScalerHolder] = {}
         if holders is None:
-            holder = ScalerHolder(initial_constants=[0], name=holder_name)
-            super().__init__(initial_holders=[holder], name=name)
-        else:
-            super().__init__(initial_holders=holders, name=name)
+            holders = [self.holder(0, backend=get_backend() if backend is None else backend)]
+        super().__init__(initial_holders=holders, name=name, parity=self.source_parity)
 
-    def next_term(self) -> Sin:
-        n_p_1 = len(self)
-        if n_p_1 % 2 == 0 or n_p_1 > self.max_n:
-            value = 0
-        else:
-            value = Decimal(1) / factorial(n_p_1)
-            sign = float((-1) ** ((n_p_1 - 1) / 2))
-            value = Decimal(sign) * value
+    def term(self, n: int, previous: List[Fraction]) -> Fraction:
+        raise NotImplementedError
 
-        holder = ScalerHolder(initial_constants=[value], name=self.holders[0].name)
-        holders = self.holders
-        holders.append(holder)
-        return Sin(name=self.name, holder_name=self.holder_name, max_n=self.max_n, holders=holders)
+    def coefficient(self, n: int) -> Fraction:
+        if self.max_n is not None and n > self.max_n:
+            return Fraction(0)
 
+        coefficients = self._coefficients
+        while len(coefficients) <= n:
+            coefficients.append(Fraction(self.term(len(coefficients), coefficients)))
+        return coefficients[n]
 
-class Cos(IterativeConstant):
+    def coefficients(self, N: int) -> List[Fraction]:
+        return [self.coefficient(n) for n in range(N)]
 
-    def __init__(self, name: str, holder_name: str, max_n: int = 26, holders: List[ScalerHolder] = None):
-        self.max_n: int = max_n
-        self.holder_name: str = holder_name
-        if holders is None:
-            holder = ScalerHolder(initial_constants=[1], name=holder_name)
-            super().__init__(initial_holders=[holder], name=name)
-        else:
-            super().__init__(initial_holders=holders, name=name)
-
-    def next_term(self) -> Cos:
-        n_p_1 = len(self)
-        if n_p_1 % 2 != 0 or n_p_1 > self.max_n:
-            value = 0
-        else:
-            value = Decimal(1) / factorial(n_p_1)
-            sign = float((-1) ** (n_p_1 / 2))
-            value = Decimal(sign) * value
-
-        holder = ScalerHolder(initial_constants=[value], name=self.holders[0].name)
-        holders = self.holders
-        holders.append(holder)
-        return Cos(name=self.name, holder_name=self.holder_name, max_n=self.max_n, holders=holders)
+    def float_coefficients(self, N: int) -> ndarray:
+        return array([float(c) for c in self.coefficients(N)], dtype=float64)
+
+    def _zero(self, backend: Backend) -> ScalerHolder:
+        # Every zero term shares one holder
+        if backend not in self._zeros:
+            self._zeros[backend] = ScalerHolder(initial_constants=[0], name=self.holder_name, backend=backend)
+        return self._zeros[backend]
+
+    def holder(self, n: int, backend: Backend = None) -> ScalerHolder:
+        if backend is None:
+            backend = self.get(0).backend
+
+        coefficient = self.coefficient(n)
+        if coefficient:
+            return ScalerHolder._from_native([backend.convert(coefficient)], name=self.holder_name, backend=backend)
+        return self._zero(backend)
+
+    def _extend(self, holders: List[ScalerHolder]) -> TaylorSource:
+        # The source grows in place as it always has, and the returned copy owns the storage,
+        # so this one keeps its length and a later append or next_term on either of them branches
+        length = len(self)
+        storage = self._holders if self._length is None else self._holders[:length]
+        storage.extend(holders)
+        self._holders = storage
+        self._length = len(storage)
+
+        source = copy(self)
+        source._length = None
+        return source
+
+    def next_term(self) -> TaylorSource:
+        return self._extend([self.holder(len(self))])
+
+    def generate(self, N: int) -> TaylorSource:
+        # The exact coefficients are computed in one pass and converted without building a holder for each zero
+        backend = self.get(0).backend
+        zero = self._zero(backend)
+        convert = backend.convert
+        name = self.holder_name
+        holders = [ScalerHolder._from_native([convert(c)], name=name, backend=backend) if c else zero
+                   for c in (self.coefficient(n) for n in range(len(self), N))]
+        return self._extend(holders)
+
+
+class FunctionSource(TaylorSource):
+
+    def __init__(self, function: Callable[[int], Number], name: str, holder_name: str, max_n: int = None,
+                 holders: List[ScalerHolder] = None, backend: Backend = None):
+        self.function: Callable[[int], Number] = function
+        super().__init__(name=name, holder_name=holder_name, max_n=max_n, holders=holders, backend=backend)
+
+    def term(self, n: int, previous: List[Fraction]) -> Fraction:
+        return Fraction(self.function(n))
+
+
+class Sin(TaylorSource):
+    source_parity = 1
+
+    def __init__(self, name: str, holder_name: str, max_n: int = 27, holders: List[ScalerHolder] = None,
+                 backend: Backend = None):
+        super().__init__(name=name, holder_name=holder_name, max_n=max_n, holders=holders, backend=backend)
+
+    def term(self, n: int, previous: List[Fraction]) -> Fraction:
+        if n % 2 == 0:
+            return Fraction(0)
+        if n == 1:
+            return Fraction(1)
+        return -previous[n - 2] / (n * (n - 1))
+
+
+class Cos(TaylorSource):
+    source_parity = 0
+
+    def __init__(self, name: str, holder_name: str, max_n: int = 26, holders: List[ScalerHolder] = None,
+                 backend: Backend = None):
+        super().__init__(name=name, holder_name=holder_name, max_n=max_n, holders=holders, backend=backend)
+
+    def term(self, n: int, previous: List[Fraction]) -> Fraction:
+        if n % 2 != 0:
+            return Fraction(0)
+        if n == 0:
+            return Fraction(1)
+        return -previous[n - 2] / (n * (n - 1))
+
+
+class Exp(TaylorSource):
+
+    def term(self, n: int, previous: List[Fraction]) -> Fraction:
+        if n == 0:
+            return Fraction(1)
+        return previous[n - 1] / n
+
+
+class Sinh(TaylorSource):
+    source_parity = 1
+
+    def term(self, n: int, previous: List[Fraction]) -> Fraction:
+        if n % 2 == 0:
+            return Fraction(0)
+        if n == 1:
+            return Fraction(1)
+        return previous[n - 2] / (n * (n - 1))
+
+
+class Cosh(TaylorSource):
+    source_parity = 0
+
+    def term(self, n: int, previous: List[Fraction]) -> Fraction:
+        if n % 2 != 0:
+            return Fraction(0)
+        if n == 0:
+            return Fraction(1)
+        return previous[n - 2] / (n * (n - 1))
+
+
+class Log1p(TaylorSource):
+
+    def term(self, n: int, previous: List[Fraction]) -> Fraction:
+        if n == 0:
+            return Fraction(0)
+        return Fraction((-1) ** (n + 1), n)
+
+
+class Binomial(TaylorSource):
+
+    def __init__(self, alpha: Union[Number, Fraction], name: str, holder_name: str, max_n: int = None,
+                 holders: List[ScalerHolder] = None, backend: Backend = None):
+        self.alpha: Fraction = Fraction(alpha)
+        super().__init__(name=name, holder_name=holder_name, max_n=max_n, holders=holders, backend=backend)
+
+    def term(self, n: int, previous: List[Fraction]) -> Fraction:
+        if n == 0:
+            return Fraction(1)
+        return previous[n - 1] * (self.alpha - n + 1) / n
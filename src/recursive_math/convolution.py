@@ -0,0 +1,111 @@
+from __future__ import annotations
+from typing import Any, Callable, List
+
+from .instrumentation import instrumented
+from .iterative_constants import IterativeConstant, ScalerHolder
+
+
+# Largest block of the relaxed scheme, products further out are grouped in square tiles of this size.
+# Blocks reach terms up to 2 * block_size past the requested one, which only pays off when whole blocks
+# multiply faster than their pairs. With CPython's integer multiplication they do not, so the default
+# computes every product exactly when its term is requested.
+BLOCK_SIZE = 1
+
+
+def _add_into(target: list, values: list, add: Callable[[Any, Any], Any]):
+    length = len(target)
+    for i, value in enumerate(values[:length]):
+        target[i] = add(target[i], value)
+    if len(values) > length:
+        target.extend(values[length:])
+
+
+def multiply_series(a: List[ScalerHolder], b: List[ScalerHolder]) -> List[list]:
+    multiply_polynomials = a[0].backend.multiply_polynomials
+    add = a[0].backend.add
+
+    products = [[] for _ in range(len(a) + len(b) - 1)]
+    for n, h1 in enumerate(a):
+        if h1.is_zero():
+            continue
+        for m, h2 in enumerate(b):
+            if not h2.is_zero():
+                _add_into(products[n + m], multiply_polynomials(h1.constants, h2.constants), add)
+    return products
+
+
+@instrumented
+class Convolution:
+
+    def __init__(self, a: IterativeConstant, b: IterativeConstant, i: int = 0, j: int = 0,
+                 block_size: int = BLOCK_SIZE):
+        if block_size < 1 or block_size & (block_size - 1):
+            raise ValueError(f"Block size has to be a power of two, got {block_size}")
+        self.a: IterativeConstant = a
+        self.b: IterativeConstant = b
+        self.i: int = i
+        self.j: int = j
+        self.block_size: int = block_size
+        self._partial: List[list] = []
+        self._applied: int = 0
+
+    def attach(self, a: IterativeConstant, b: IterativeConstant) -> Convolution:
+        # The new constants have to extend the ones already used, earlier terms are never recomputed
+        self.a = a
+        self.b = b
+        return self
+
+    def _a(self, start: int, end: int) -> List[ScalerHolder]:
+        return [self.a.get(p + self.i) for p in range(start, end)]
+
+    def _b(self, start: int, end: int) -> List[ScalerHolder]:
+        return [self.b.get(q + self.j) for q in range(start, end)]
+
+    def _accumulate(self, start: int, a: List[ScalerHolder], b: List[ScalerHolder]):
+        products = multiply_series(a, b)
+        end = start + len(products)
+        if len(self._partial) < end:
+            self._partial.extend([] for _ in range(end - len(self._partial)))
+        add = a[0].backend.add
+        for t, constants in enumerate(products, start=start):
+            _add_into(self._partial[t], constants, add)
+
+    def _apply_blocks(self, m: int):
+        # Products a_p b_q with p, q >= 1 are grouped so that every group only reaches terms t and above
+        # while only needing inputs below t, so it is multiplied as a whole the first time term t is requested.
+        # For k = 1, 2, 4, ... < block_size and t a multiple of k the groups are p in [k, 2k) with q in [t - k, t)
+        # and q in [k, 2k) with p in [t - k, t), which covers every product with min(p, q) < block_size.
+        # The remaining products are tiled by block_size squares that start at multiples of block_size.
+        size = self.block_size
+        for t in range(self._applied + 1, m + 1):
+            k = 1
+            while k < size and 2 * k <= t:
+                if t % k == 0:
+                    self._accumulate(t, self._a(k, 2 * k), self._b(t - k, t))
+                    if t >= 3 * k:
+                        self._accumulate(t, self._a(t - k, t), self._b(k, 2 * k))
+                k *= 2
+
+            if t % size == 0:
+                for u in range(size, t - size + 1, size):
+                    self._accumulate(t, self._a(u, u + size), self._b(t - u, t - u + size))
+            self._applied = t
+
+    @instrumented
+    def get(self, n: int) -> ScalerHolder:
+        m = n - self.i - self.j
+        base = self.a.get(self.i)
+        if m < 0:
+            return ScalerHolder(initial_constants=[0], name=base.name, backend=base.backend)
+
+        self._apply_blocks(m)
+
+        multiply_polynomials = base.backend.multiply_polynomials
+        add = base.backend.add
+        constants = multiply_polynomials(base.constants, self.b.get(m + self.j).constants)
+        if m > 0:
+            _add_into(constants, multiply_polynomials(self.a.get(m + self.i).constants, self.b.get(self.j).constants),
+                      add)
+        if m < len(self._partial):
+            _add_into(constants, self._partial[m], add)
+        return ScalerHolder._from_native(constants, name=base.name, backend=base.backend)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+from fractions import Fraction
+from typing import Optional
+
+from numpy import ndarray, array
+
+from .backends import Backend
+from .common_functions import Sin
+from .convolution import Convolution
+from .iterative_constants import IterativeConstant, ScalerHolder
+from .numeric import NumericConstant
+from .recurrence import Recurrence
+
+
+# The README equation y y'' + 2 y' = B sin(x) with y(0) = y'(0) = 1, shared by the tests and the benchmarks
+
+
+def readme_equation(backend: Backend) -> Recurrence:
+    sin_x = Sin(name="f", holder_name="B", backend=backend)
+    b = ScalerHolder(initial_constants=[0, 1], name="B", backend=backend)
+    recurrence = Recurrence(name="a", holder_name="B", initial=[1, 1], backend=backend)
+    return recurrence.product(0, 2).derivative(1, scale=2).source(sin_x, scale=b)
+
+
+def readme_solver(N: int, backend: Backend) -> IterativeConstant:
+    return readme_equation(backend).solve(N)
+
+
+def readme_loop(N: int, backend: Backend, block_size: Optional[int] = None) -> IterativeConstant:
+    # The hand written loop of the README, with IterativeConstant.conv when no block size is given
+    sin_x = Sin(name="f", holder_name="B", backend=backend)
+
+    a_0 = ScalerHolder(initial_constants=[1], name="B", backend=backend)
+    a_1 = ScalerHolder(initial_constants=[1], name="B", backend=backend)
+    a_n = IterativeConstant(initial_holders=[a_0, a_1], name="a")
+    b_n = IterativeConstant(initial_holders=[], name="b")
+    if block_size is not None:
+        g_conv = Convolution(a_n, b_n, i=1, block_size=block_size)
+
+    for n in range(N):
+        sin_x = sin_x.next_term()
+
+        c_i = a_n.get(n + 1).scale(2 * (n + 1))
+        h_i = sin_x.get(n).increase_scaler()
+
+        if n == 0:
+            g_i = ScalerHolder(initial_constants=[0], name="B", backend=backend)
+        elif block_size is not None:
+            g_i = g_conv.attach(a_n, b_n).get(n)
+        else:
+            empty_holder = ScalerHolder(initial_constants=[0], name="B", backend=backend)
+            b_n_ext = b_n.append(empty_holder)
+            g_i = a_n[:(n + 1)].conv(b_n_ext, i=1, n=n, n_index=n)
+
+        a_i_p_2 = h_i.add(c_i.scale(-1))
+        a_i_p_2 = a_i_p_2.add(g_i.scale(-1))
+        a_i_p_2 = a_i_p_2.scale(Fraction(1, (n + 1) * (n + 2))).drop_ending_zeros()
+        a_n = a_n.append(a_i_p_2)
+
+        b_i = a_n.get(n + 2).scale((n + 1) * (n + 2))
+        b_n = b_n.append(b_i)
+
+    return a_n
+
+
+def readme_numeric_loop(N: int, scalers: ndarray) -> NumericConstant:
+    # The same loop with NumericConstant in place of IterativeConstant
+    sin_x = Sin(name="f", holder_name="B")
+    for _ in range(N):
+        sin_x = sin_x.next_term()
+    sin_x = NumericConstant.from_iterative_constant(sin_x, scalers)
+
+    a_n = NumericConstant(array([[1.0, 1.0]] * len(scalers)), name="a", scalers=scalers)
+    b_n = NumericConstant(array([[]] * len(scalers)), name="b", scalers=scalers)
+    for n in range(N):
+        c_i = a_n.get(n + 1) * 2 * (n + 1)
+        h_i = sin_x.get(n) * a_n.scalers
+        g_i = a_n[:(n + 1)].conv(b_n.append(0.0), i=1, n=n, n_index=n)
+        a_n = a_n.append((h_i - c_i - g_i) / ((n + 1) * (n + 2)))
+        b_n = b_n.append(a_n.get(n + 2) * (n + 1) * (n + 2))
+    return a_n
+
+
+def exp_equation(backend: Backend) -> Recurrence:
+    # y' = y with y(0) = 1
+    return Recurrence(name="a", holder_name="B", initial=[1], backend=backend).derivative(1).derivative(0, scale=-1)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from functools import wraps
+from time import perf_counter
+import json
+
+
+_classes: List[type] = []
+_listeners: List[Any] = []
+_originals: Dict[Tuple[type, str], Any] = {}
+
+
+def instrumented(target):
+    # Marking is free, the methods are only wrapped while a listener is attached
+    if isinstance(target, type):
+        _classes.append(target)
+    else:
+        target.__instrumented__ = True
+    return target
+
+
+def _wrap(operation: str, function: Callable) -> Callable:
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        result = function(*args, **kwargs)
+        elapsed = perf_counter() - start
+        for listener in _listeners:
+            listener.record(operation, args, result, elapsed)
+        return result
+
+    return wrapper
+
+
+def _install():
+    for cls in _classes:
+        for name, attribute in list(vars(cls).items()):
+            is_classmethod = isinstance(attribute, classmethod)
+            function = attribute.__func__ if is_classmethod else attribute
+            if not getattr(function, "__instrumented__", False):
+                continue
+
+            _originals[(cls, name)] = attribute
+            wrapper = _wrap(f"{cls.__name__}.{name}", function)
+            setattr(cls, name, classmethod(wrapper) if is_classmethod else wrapper)
+
+
+def _uninstall():
+    for (cls, name), attribute in _originals.items():
+        setattr(cls, name, attribute)
+    _originals.clear()
+
+
+def attach(listener):
+    if listener in _listeners:
+        return
+    if not _listeners:
+        _install()
+    _listeners.append(listener)
+
+
+def detach(listener):
+    if listener not in _listeners:
+        return
+    _listeners.remove(listener)
+    if not _listeners:
+        _uninstall()
+
+
+def is_enabled() -> bool:
+    return bool(_listeners)
+
+
+class OperationRecord:
+
+    def __init__(self):
+        self.count: int = 0
+        self.seconds: float = 0.0
+        self.max_degree: int = 0
+        self.total_degree: int = 0
+        self.max_holders: int = 0
+        self.total_holders: int = 0
+        self.max_digits: int = 0
+
+    def to_dict(self) -> dict:
+        count = max(self.count, 1)
+        return {
+            "count": self.count,
+            "seconds": self.seconds,
+            "mean_seconds": self.seconds / count,
+            "max_degree": self.max_degree,
+            "mean_degree": self.total_degree / count,
+            "max_holders": self.max_holders,
+            "mean_holders": self.total_holders / count,
+            "max_digits": self.max_digits,
+        }
+
+
+class Profiler:
+
+    def __init__(self, digits: bool = True):
+        self.digits: bool = digits
+        self.records: Dict[str, OperationRecord] = {}
+
+    def __enter__(self) -> Profiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        attach(self)
+
+    def stop(self):
+        detach(self)
+
+    def reset(self):
+        self.records = {}
+
+    def _measure(self, value: Any) -> Tuple[int, int, int]:
+        constants = getattr(value, "constants", None)
+        if isinstance(constants, list):
+            digits = 0
+            if self.digits and constants:
+                digits = max(value.backend.digits(constant) for constant in constants)
+            return len(constants) - 1, 0, digits
+
+        holders = getattr(value, "_holders", None)
+        if isinstance(holders, list):
+            return 0, len(value), 0
+        return 0, 0, 0
+
+    def record(self, operation: str, args: tuple, result: Any, elapsed: float):
+        record = self.records.get(operation)
+        if record is None:
+            record = self.records[operation] = OperationRecord()
+
+        degree, holders, digits = 0, 0, 0
+        for value in (*args, result):
+            value_degree, value_holders, value_digits = self._measure(value)
+            degree = max(degree, value_degree)
+            holders = max(holders, value_holders)
+            digits = max(digits, value_digits)
+
+        record.count += 1
+        record.seconds += elapsed
+        record.total_degree += degree
+        record.max_degree = max(record.max_degree, degree)
+        record.total_holders += holders
+        record.max_holders = max(record.max_holders, holders)
+        record.max_digits = max(record.max_digits, digits)
+
+    def report(self) -> dict:
+        return {operation: record.to_dict() for operation, record in sorted(self.records.items())}
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        report = json.dumps(self.report(), indent=2)
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(report)
+        return report
+
+    def summary(self) -> str:
+        header = (f"{'operation':<36} {'count':>9} {'seconds':>10} {'mean us':>10} "
+                  f"{'max degree':>10} {'max holders':>11} {'max digits':>10}")
+        lines = [header, "-" * len(header)]
+        records = sorted(self.records.items(), key=lambda item: item[1].seconds, reverse=True)
+        for operation, record in records:
+            lines.append(f"{operation:<36} {record.count:>9} {record.seconds:>10.4f} "
+                         f"{1e6 * record.seconds / max(record.count, 1):>10.2f} {record.max_degree:>10} "
+                         f"{record.max_holders:>11} {record.max_digits:>10}")
+        return "\n".join(lines)
@@ -1,10 +1,13 @@
 from __future__ import annotations
-from typing import List, Union
-from decimal import Decimal, getcontext
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from decimal import getcontext
+from fractions import Fraction
+from hashlib import sha256
 
-from numpy import array, append
+from numpy import ndarray, array, zeros, zeros_like, arange, repeat, cumsum, concatenate, int64, float64
 
-from .progress import Progress
+from .backends import Backend, Number, get_backend
+from .instrumentation import instrumented
 from .series import Series, Tensor
 
 getcontext().prec = 1000
@@ -14,7 +17,22 @@ def set_decimal_precision(precision: int):
     getcontext().prec = precision
 
 
+def falling_factorial(n: int, k: int) -> int:
+    result = 1
+    for i in range(n - k + 1, n + 1):
+        result *= i
+    return result
+
+
+def _evaluate_integer_polynomial(constants: Sequence[int], n: int) -> int:
+    value = 0
+    for constant in reversed(constants):
+        value = value * n + constant
+    return value
+
+
 class Formatter:
+    __slots__ = ()
 
     @staticmethod
     def _i_to_script(i: int, subscript: bool = True) -> str:
@@ -33,6 +51,13 @@ class Formatter:
                 i_string += superscripts[character]
         return i_string
 
+    @staticmethod
+    def _format_value(value: Any, backend: Backend) -> str:
+        # Decimal zeros keep the exponent they were computed with, which would show up as 0.000e-1001
+        if not value:
+            return "0.000e+0"
+        return "{:.3e}".format(backend.to_decimal(value))
+
     @staticmethod
     def check_slice(item: slice):
         if not isinstance(item, slice):
@@ -43,23 +68,38 @@ class Formatter:
             raise IndexError("Step cannot be defined for slice.")
 
 
+@instrumented
 class ScalerHolder(Formatter):
+    __slots__ = ("backend", "name", "constants")
 
-    def __init__(self, initial_constants: List[Union[float, Decimal]], name: str):
-        super().__init__()
-        self.epsilon = Decimal(10) ** (-Decimal(getcontext().prec))
+    @instrumented
+    def __init__(self, initial_constants: List[Number], name: str, backend: Backend = None):
+        if backend is None:
+            backend = get_backend()
+        self.backend: Backend = backend
         self.name: str = name
-        self.constants: List[Decimal] = []
-        for initial_constant in initial_constants:
-            initial_constant = Decimal(initial_constant)
-            self.constants.append(initial_constant)
-        Progress.update()
+        self.constants: list = [backend.convert(initial_constant) for initial_constant in initial_constants]
+
+    @classmethod
+    def _from_native(cls, constants: list, name: str, backend: Backend) -> ScalerHolder:
+        # Trusted constructor for results of operations, the constants are already native values of the backend
+        holder = cls.__new__(cls)
+        holder.backend = backend
+        holder.name = name
+        holder.constants = constants
+        return holder
+
+    @property
+    def epsilon(self) -> Any:
+        return self.backend.epsilon()
 
     def condense(self) -> str:
         condensed_string = ""
-        num_constant = len(self.constants)
-        for i, value in enumerate(self.constants):
-            formatted_value = "{:.3e}".format(value)
+        # Trailing zeros are left out, as in equality and hashing
+        constants = self._significant_constants() or self.constants[:1]
+        num_constant = len(constants)
+        for i, value in enumerate(constants):
+            formatted_value = self._format_value(value, self.backend)
             i_string = self._i_to_script(i, subscript=False)
             condensed_string += f"{formatted_value} {self.name}{i_string}"
             if i != num_constant - 1:
@@ -69,49 +109,94 @@ class ScalerHolder(Formatter):
     def __str__(self) -> str:
         return self.condense()
 
+    def _significant_constants(self) -> list:
+        # Trailing zeros do not change the polynomial, so they are ignored by equality and hashing
+        constants = self.constants
+        end = len(constants)
+        while end > 0 and not constants[end - 1]:
+            end -= 1
+        return constants[:end]
+
+    def _exact_constants(self) -> tuple:
+        exact = self.backend.exact
+        return tuple(exact(constant) for constant in self._significant_constants())
+
     def __eq__(self, holder: ScalerHolder) -> bool:
-        if isinstance(holder, ScalerHolder):
-            return self.condense() == holder.condense()
-        return NotImplemented
+        if not isinstance(holder, ScalerHolder):
+            return NotImplemented
+        if holder.name != self.name:
+            return False
+        if holder.backend == self.backend:
+            return self._significant_constants() == holder._significant_constants()
+        return self._exact_constants() == holder._exact_constants()
+
+    def __hash__(self) -> int:
+        return hash((self.name, self._exact_constants()))
+
+    def digest(self) -> str:
+        # Unlike hash() this is stable between processes and backends
+        to_fraction = self.backend.to_fraction
+        digest = sha256(self.name.encode())
+        for constant in self._significant_constants():
+            constant = to_fraction(constant)
+            digest.update(f"|{constant.numerator}/{constant.denominator}".encode())
+        return digest.hexdigest()
+
+    def isclose(self, holder: ScalerHolder, rel_tol: float = 1e-9, abs_tol: float = 0.0) -> bool:
+        if holder.name != self.name:
+            return False
+
+        rel_tol, abs_tol = Fraction(rel_tol), Fraction(abs_tol)
+        a = [self.backend.to_fraction(constant) for constant in self.constants]
+        b = [holder.backend.to_fraction(constant) for constant in holder.constants]
+        length = max(len(a), len(b))
+        a += [Fraction(0)] * (length - len(a))
+        b += [Fraction(0)] * (length - len(b))
+        for c1, c2 in zip(a, b):
+            if abs(c1 - c2) > max(rel_tol * max(abs(c1), abs(c2)), abs_tol):
+                return False
+        return True
 
     def __getitem__(self, item: slice) -> ScalerHolder:
         self.check_slice(item)
 
         new_constants = self.constants[item]
-        return ScalerHolder(initial_constants=new_constants, name=self.name)
+        return ScalerHolder._from_native(new_constants, name=self.name, backend=self.backend)
 
     def __len__(self):
         return len(self.constants)
 
-    def get(self, i: int) -> Decimal:
-        Progress.update()
+    @instrumented
+    def get(self, i: int):
         return self.constants[i]
 
+    @instrumented
     def copy(self) -> ScalerHolder:
-        new_constants = []
-        for constant in self.constants:
-            new_constants.append(Decimal(constant))
-
-        Progress.update()
-        return ScalerHolder(initial_constants=self.constants.copy(), name=self.name)
+        return ScalerHolder._from_native(self.constants.copy(), name=self.name, backend=self.backend)
 
+    @instrumented
     def freeze(self) -> Series:
-        constants = []
-        for constant in self.constants:
-            constants.append(float(constant))
+        return Series(self.backend.to_floats(self.constants))
 
-        Progress.update()
-        return Series(array(constants))
+    @instrumented
+    def scale(self, value: Number) -> ScalerHolder:
+        return self._scale_native(self.backend.convert(value))
 
-    def scale(self, value: Union[float, Decimal]) -> ScalerHolder:
-        value = Decimal(value)
+    def _scale_native(self, value) -> ScalerHolder:
+        multiply = self.backend.multiply
         new_constants = []
         for constant in self.constants:
-            new_constants.append(value * constant)
+            new_constants.append(multiply(value, constant))
+
+        return ScalerHolder._from_native(new_constants, name=self.name, backend=self.backend)
 
-        Progress.update()
-        return ScalerHolder(initial_constants=new_constants, name=self.name)
+    def check_compatible(self, holder: ScalerHolder):
+        if holder.name != self.name:
+            raise TypeError("Scaler types do not match")
+        if holder.backend != self.backend:
+            raise TypeError(f"Scaler backends do not match: {self.backend} and {holder.backend}")
 
+    @instrumented
     def drop_ending_zeros(self) -> ScalerHolder:
         ending_slice = 0
         for i, c in enumerate(reversed(self.constants)):
@@ -120,20 +205,20 @@ class ScalerHolder(Formatter):
             ending_slice += 1
 
         if ending_slice == len(self):
-            new_holder = ScalerHolder(initial_constants=[self.get(0)], name=self.name)
+            new_holder = ScalerHolder._from_native([self.get(0)], name=self.name, backend=self.backend)
         else:
             new_holder = self[:(len(self) - ending_slice + 1)]
 
-        Progress.update()
         return new_holder
 
+    @instrumented
     def increase_scaler(self) -> ScalerHolder:
         holder = self.copy()
-        holder.constants.insert(0, Decimal(0))
+        holder.constants.insert(0, self.backend.zero)
 
-        Progress.update()
         return holder
 
+    @instrumented
     def decrease_scaler(self) -> ScalerHolder:
         holder = self.copy()
 
@@ -141,49 +226,244 @@ class ScalerHolder(Formatter):
             raise ValueError(f"Leading constant is not zero: {holder.constants[0]}")
 
         holder.constants.pop(0)
-        Progress.update()
         return holder
 
+    @instrumented
     def add(self, holder: ScalerHolder) -> ScalerHolder:
-        if holder.name != self.name:
-            raise TypeError("Scaler types do not match")
+        self.check_compatible(holder)
 
-        len_self_constants = len(self.constants)
-        len_holder_constants = len(holder.constants)
+        add = self.backend.add
+        a, b = self.constants, holder.constants
+        if len(a) < len(b):
+            a, b = b, a
+        new_constants = [add(c1, c2) for c1, c2 in zip(a, b)] + a[len(b):]
 
-        new_constants = [Decimal(0)] * max(len_self_constants, len_holder_constants)
-        for i in range(len(new_constants)):
-            if i < len_self_constants:
-                new_constants[i] += self.constants[i]
-            if i < len_holder_constants:
-                new_constants[i] += holder.constants[i]
-
-        Progress.update()
-        return ScalerHolder(initial_constants=new_constants, name=self.name)
+        return ScalerHolder._from_native(new_constants, name=self.name, backend=self.backend)
 
+    @instrumented
     def multiply(self, holder: ScalerHolder) -> ScalerHolder:
-        if holder.name != self.name:
-            raise TypeError("Scaler types do not match")
-        self_holder = self.copy()
+        self.check_compatible(holder)
+
+        new_constants = self.backend.multiply_polynomials(self.constants, holder.constants)
+
+        return ScalerHolder._from_native(new_constants, name=self.name, backend=self.backend)
+
+    def zero(self) -> ScalerHolder:
+        return ScalerHolder._from_native([self.backend.zero], name=self.name, backend=self.backend)
+
+    def is_zero(self) -> bool:
+        return not any(self.constants)
+
+
+@instrumented
+class MultiScalerHolder(Formatter):
+    __slots__ = ("backend", "names", "terms")
+
+    @instrumented
+    def __init__(self, initial_terms: Dict[Tuple[int, ...], Number], names: Sequence[str], backend: Backend = None):
+        if backend is None:
+            backend = get_backend()
+        self.backend: Backend = backend
+        self.names: Tuple[str, ...] = tuple(names)
+        # Sparse map from the exponent of every scaler to the coefficient of that monomial
+        self.terms: Dict[Tuple[int, ...], Any] = {}
+        for exponents, initial_constant in initial_terms.items():
+            exponents = tuple(exponents)
+            if len(exponents) != len(self.names):
+                raise ValueError(f"Monomial {exponents} does not match scalers {self.names}")
+            self.terms[exponents] = backend.convert(initial_constant)
+
+    @classmethod
+    def _from_native(cls, terms: Dict[Tuple[int, ...], Any], names: Tuple[str, ...],
+                     backend: Backend) -> MultiScalerHolder:
+        holder = cls.__new__(cls)
+        holder.backend = backend
+        holder.names = names
+        holder.terms = terms
+        return holder
 
-        max_length = max(len(self_holder), len(holder))
-        new_holder = ScalerHolder(initial_constants=[0] * (2*max_length - 1), name=self.name)
-        for n, c1 in enumerate(self_holder.constants):
-            for m, c2 in enumerate(holder.constants):
-                new_holder.constants[n + m] += c1 * c2
+    @property
+    def epsilon(self) -> Any:
+        return self.backend.epsilon()
+
+    @classmethod
+    def from_scaler_holder(cls, holder: ScalerHolder, names: Sequence[str]) -> MultiScalerHolder:
+        names = tuple(names)
+        axis = names.index(holder.name)
+        terms = {}
+        for i, constant in enumerate(holder.constants):
+            if constant:
+                exponents = [0] * len(names)
+                exponents[axis] = i
+                terms[tuple(exponents)] = constant
+        return cls._from_native(terms, names=names, backend=holder.backend)
+
+    @property
+    def name(self) -> Tuple[str, ...]:
+        return self.names
 
-        Progress.update()
-        return new_holder
+    def condense(self) -> str:
+        terms = []
+        for exponents, value in sorted(self._significant_terms().items()):
+            formatted_value = self._format_value(value, self.backend)
+            monomial = "".join(f"{name}{self._i_to_script(e, subscript=False)}"
+                               for name, e in zip(self.names, exponents))
+            terms.append(f"{formatted_value} {monomial}")
+        return " + ".join(terms) if terms else self._format_value(self.backend.zero, self.backend)
+
+    def __str__(self) -> str:
+        return self.condense()
+
+    def _significant_terms(self) -> Dict[Tuple[int, ...], Any]:
+        return {exponents: value for exponents, value in self.terms.items() if value}
 
+    def _exact_terms(self) -> frozenset:
+        exact = self.backend.exact
+        return frozenset((exponents, exact(value)) for exponents, value in self._significant_terms().items())
 
+    def __eq__(self, holder: MultiScalerHolder) -> bool:
+        if not isinstance(holder, MultiScalerHolder):
+            return NotImplemented
+        if holder.names != self.names:
+            return False
+        if holder.backend == self.backend:
+            return self._significant_terms() == holder._significant_terms()
+        return self._exact_terms() == holder._exact_terms()
+
+    def __hash__(self) -> int:
+        return hash((self.names, self._exact_terms()))
+
+    def __len__(self):
+        return len(self.terms)
+
+    def degree(self, name: str) -> int:
+        axis = self.names.index(name)
+        return max((exponents[axis] for exponents in self._significant_terms()), default=0)
+
+    @instrumented
+    def get(self, exponents: Tuple[int, ...]):
+        return self.terms.get(tuple(exponents), self.backend.zero)
+
+    @instrumented
+    def copy(self) -> MultiScalerHolder:
+        return MultiScalerHolder._from_native(dict(self.terms), names=self.names, backend=self.backend)
+
+    def zero(self) -> MultiScalerHolder:
+        return MultiScalerHolder._from_native({}, names=self.names, backend=self.backend)
+
+    def is_zero(self) -> bool:
+        return not any(self.terms.values())
+
+    @instrumented
+    def freeze(self, shape: Tuple[int, ...] = None) -> ndarray:
+        if shape is None:
+            shape = tuple(self.degree(name) + 1 for name in self.names)
+        constants = zeros(shape, dtype=float64)
+        for exponents, value in self.terms.items():
+            if value:
+                constants[exponents] = self.backend.to_float(value)
+        return constants
+
+    @instrumented
+    def scale(self, value: Number) -> MultiScalerHolder:
+        return self._scale_native(self.backend.convert(value))
+
+    def _scale_native(self, value) -> MultiScalerHolder:
+        multiply = self.backend.multiply
+        new_terms = {exponents: multiply(value, constant) for exponents, constant in self.terms.items()}
+        return MultiScalerHolder._from_native(new_terms, names=self.names, backend=self.backend)
+
+    def check_compatible(self, holder: MultiScalerHolder):
+        if not isinstance(holder, MultiScalerHolder) or holder.names != self.names:
+            raise TypeError("Scaler types do not match")
+        if holder.backend != self.backend:
+            raise TypeError(f"Scaler backends do not match: {self.backend} and {holder.backend}")
+
+    @instrumented
+    def drop_ending_zeros(self) -> MultiScalerHolder:
+        new_terms = {exponents: value for exponents, value in self.terms.items() if abs(value) > self.epsilon}
+        return MultiScalerHolder._from_native(new_terms, names=self.names, backend=self.backend)
+
+    @instrumented
+    def increase_scaler(self, name: str) -> MultiScalerHolder:
+        axis = self.names.index(name)
+        new_terms = {}
+        for exponents, value in self.terms.items():
+            exponents = exponents[:axis] + (exponents[axis] + 1,) + exponents[axis + 1:]
+            new_terms[exponents] = value
+        return MultiScalerHolder._from_native(new_terms, names=self.names, backend=self.backend)
+
+    @instrumented
+    def add(self, holder: MultiScalerHolder) -> MultiScalerHolder:
+        self.check_compatible(holder)
+
+        add = self.backend.add
+        new_terms = dict(self.terms)
+        for exponents, value in holder.terms.items():
+            if exponents in new_terms:
+                new_terms[exponents] = add(new_terms[exponents], value)
+            else:
+                new_terms[exponents] = value
+        return MultiScalerHolder._from_native(new_terms, names=self.names, backend=self.backend)
+
+    @instrumented
+    def multiply(self, holder: MultiScalerHolder) -> MultiScalerHolder:
+        self.check_compatible(holder)
+
+        multiply = self.backend.multiply
+        add = self.backend.add
+        new_terms = {}
+        for e1, c1 in self.terms.items():
+            if not c1:
+                continue
+            for e2, c2 in holder.terms.items():
+                if not c2:
+                    continue
+                exponents = tuple(a + b for a, b in zip(e1, e2))
+                product = multiply(c1, c2)
+                if exponents in new_terms:
+                    new_terms[exponents] = add(new_terms[exponents], product)
+                else:
+                    new_terms[exponents] = product
+        return MultiScalerHolder._from_native(new_terms, names=self.names, backend=self.backend)
+
+
+@instrumented
 class IterativeConstant(Formatter):
 
-    def __init__(self, initial_holders: List[ScalerHolder], name: str):
+    @instrumented
+    def __init__(self, initial_holders: List[ScalerHolder], name: str, parity: Optional[int] = None):
         super().__init__()
-        self.holders: List[ScalerHolder] = initial_holders
+        self._holders: List[ScalerHolder] = list(initial_holders)
+        self._length: Optional[int] = None
         self.name = name
+        # 0 when only even terms can be nonzero, 1 when only odd terms can, the others are never multiplied
+        self.parity: Optional[int] = parity
         self.verify_names(self)
-        Progress.update()
+        self.verify_parity(self)
+
+    @classmethod
+    @instrumented
+    def _from_storage(cls, holders: List[ScalerHolder], length: Optional[int], name: str,
+                      parity: Optional[int] = None) -> IterativeConstant:
+        # Holders are shared with other constants, only the first ``length`` of them belong to this one
+        iterator = cls.__new__(cls)
+        Formatter.__init__(iterator)
+        iterator._holders = holders
+        iterator._length = length
+        iterator.name = name
+        iterator.parity = parity
+        return iterator
+
+    @property
+    def holders(self) -> List[ScalerHolder]:
+        # A copy, the storage is shared with earlier versions and slices of this constant
+        return self._holders[:len(self)]
+
+    @holders.setter
+    def holders(self, holders: List[ScalerHolder]):
+        self._holders = list(holders)
+        self._length = None
 
     def condense(self) -> str:
         condensed_string = "["
@@ -197,6 +477,10 @@ class IterativeConstant(Formatter):
         condensed_string += "]"
         return condensed_string
 
+    def verify_holder(self, holder: ScalerHolder):
+        if len(self) > 0 and holder.name != self._holders[0].name:
+            raise ValueError("Names do not match in holders.")
+
     @staticmethod
     def verify_names(iterator: IterativeConstant):
         names = []
@@ -209,107 +493,267 @@ class IterativeConstant(Formatter):
                 if name != base_name:
                     raise ValueError("Names do not match in holders.")
 
+    @staticmethod
+    def verify_parity(iterator: IterativeConstant):
+        parity = iterator.parity
+        if parity is None:
+            return
+        if parity not in (0, 1):
+            raise ValueError(f"Parity has to be 0, 1 or None, got {parity}")
+        for i in range(1 - parity, len(iterator), 2):
+            if not iterator._holders[i].is_zero():
+                raise ValueError(f"Term {i} is not zero, which does not match parity {parity}")
+
+    def is_known_zero(self, i: int) -> bool:
+        return self.parity is not None and i % 2 != self.parity
+
+    def _keeps_parity(self, i: int, holder: ScalerHolder) -> Optional[int]:
+        if self.is_known_zero(i) and not holder.is_zero():
+            return None
+        return self.parity
+
     def __str__(self) -> str:
         return self.condense()
 
     def __eq__(self, iterator: IterativeConstant) -> bool:
-        if isinstance(iterator, IterativeConstant):
-            return self.condense() == iterator.condense()
-        return NotImplemented
+        if not isinstance(iterator, IterativeConstant):
+            return NotImplemented
+        if iterator.name != self.name or len(iterator) != len(self):
+            return False
+        return all(self.get(i) == iterator.get(i) for i in range(len(self)))
+
+    def __hash__(self) -> int:
+        return hash((self.name, tuple(hash(self.get(i)) for i in range(len(self)))))
+
+    def digest(self) -> str:
+        digest = sha256(self.name.encode())
+        for i in range(len(self)):
+            digest.update(self.get(i).digest().encode())
+        return digest.hexdigest()
+
+    def isclose(self, iterator: IterativeConstant, rel_tol: float = 1e-9, abs_tol: float = 0.0) -> bool:
+        if iterator.name != self.name or len(iterator) != len(self):
+            return False
+        return all(self.get(i).isclose(iterator.get(i), rel_tol=rel_tol, abs_tol=abs_tol) for i in range(len(self)))
 
     def __getitem__(self, item: slice) -> IterativeConstant:
         self.check_slice(item)
 
-        new_holders = self.holders[item]
-        return IterativeConstant(initial_holders=new_holders, name=self.name)
+        length = len(range(len(self))[item])
+        return IterativeConstant._from_storage(self._holders, length, name=self.name, parity=self.parity)
 
     def __len__(self):
-        return len(self.holders)
+        if self._length is None:
+            return len(self._holders)
+        return self._length
 
+    @instrumented
     def get(self, i: int) -> ScalerHolder:
-        Progress.update()
-        return self.holders[i]
+        if self._length is not None:
+            i = range(self._length)[i]
+        return self._holders[i]
 
+    @instrumented
     def copy(self) -> IterativeConstant:
         new_holders = []
         for holder in self.holders:
             new_holders.append(holder.copy())
 
-        Progress.update()
-        return IterativeConstant(initial_holders=new_holders, name=self.name)
-
-    def freeze(self) -> Tensor:
-
-        constants = []
-        for holder in self.holders:
-            constants.append(holder.freeze().constants)
+        return IterativeConstant(initial_holders=new_holders, name=self.name, parity=self.parity)
+
+    @instrumented
+    def freeze(self, precision: str = "double") -> Tensor:
+        if precision not in ("double", "double-double"):
+            raise ValueError(f"Precision has to be double or double-double, got {precision}")
+        # With a parity only the rows of the nonzero terms are kept
+        holders = self.holders
+        first = holders[0]
+        if self.parity is not None:
+            # A zero row stands in when no term of the parity has been generated yet
+            holders = holders[self.parity::2] or [first.zero()]
+
+        if isinstance(first, MultiScalerHolder):
+            if precision != "double":
+                raise ValueError("Several scalers can only be frozen in double precision")
+            names = first.names
+            shape = tuple(max(holder.degree(name) for holder in holders) + 1 for name in names)
+            return Tensor(array([holder.freeze(shape) for holder in holders]), names=names, parity=self.parity)
+
+        # Every coefficient is converted in one call and scattered into the zero padded rows
+        lengths = array([len(holder.constants) for holder in holders], dtype=int64)
+        rows = repeat(arange(len(holders)), lengths)
+        columns = arange(lengths.sum()) - repeat(cumsum(lengths) - lengths, lengths)
+        backend = holders[0].backend
+        if all(holder.backend == backend for holder in holders):
+            groups = [(backend, [constant for holder in holders for constant in holder.constants])]
+        else:
+            groups = [(holder.backend, holder.constants) for holder in holders]
 
-        max_length = max(len(sub_constants) for sub_constants in constants)
-        new_constants = []
-        for sub_constants in constants:
-            new_sub_constants = sub_constants.tolist()
-            while len(new_sub_constants) < max_length:
-                new_sub_constants.append(0)
-            new_constants.append(new_sub_constants)
+        hi = zeros((len(holders), lengths.max()), dtype=float64)
+        if precision == "double":
+            hi[rows, columns] = concatenate([backend.to_floats(constants) for backend, constants in groups])
+            return Tensor(hi, parity=self.parity)
 
-        Progress.update()
-        return Tensor(array(new_constants))
+        lo = zeros_like(hi)
+        pairs = [backend.to_double_doubles(constants) for backend, constants in groups]
+        hi[rows, columns] = concatenate([pair[0] for pair in pairs])
+        lo[rows, columns] = concatenate([pair[1] for pair in pairs])
+        return Tensor(hi, parity=self.parity, lo=lo)
 
-    def scale(self, value: Union[float, Decimal]) -> IterativeConstant:
+    @instrumented
+    def scale(self, value: Number) -> IterativeConstant:
         new_holders = []
         for holder in self.holders:
             new_holders.append(holder.scale(value))
 
-        Progress.update()
-        return IterativeConstant(initial_holders=new_holders, name=self.name)
+        return IterativeConstant(initial_holders=new_holders, name=self.name, parity=self.parity)
 
+    @instrumented
     def drop_ending_zeros(self) -> IterativeConstant:
         new_holders = []
         for holder in self.holders:
             new_holders.append(holder.drop_ending_zeros())
 
-        Progress.update()
-        return IterativeConstant(initial_holders=new_holders, name=self.name)
-
-    def poly_scale(self, value: Union[float, Decimal]) -> IterativeConstant:
-        value = Decimal(value)
+        return IterativeConstant(initial_holders=new_holders, name=self.name, parity=self.parity)
 
+    @instrumented
+    def poly_scale(self, value: Number) -> IterativeConstant:
         new_holders = []
         for i, holder in enumerate(self.holders):
-            p_value = value ** Decimal(i)
-            new_holders.append(holder.scale(p_value))
+            backend = holder.backend
+            p_value = backend.power(backend.convert(value), i)
+            new_holders.append(holder._scale_native(p_value))
+
+        return IterativeConstant(initial_holders=new_holders, name=self.name, parity=self.parity)
+
+    def _shifted_parity(self, k: int) -> Optional[int]:
+        return None if self.parity is None else (self.parity + k) % 2
+
+    @instrumented
+    def derivative(self, order: int = 1) -> IterativeConstant:
+        # Term m of the order-th derivative is a_(m + order) (m + order)! / m!
+        new_holders = []
+        for m in range(len(self) - order):
+            new_holders.append(self.get(m + order).scale(falling_factorial(m + order, order)))
+
+        return IterativeConstant(initial_holders=new_holders, name=self.name, parity=self._shifted_parity(-order))
+
+    @instrumented
+    def integral(self, order: int = 1) -> IterativeConstant:
+        # Integration constants are zero, term m + order is a_m m! / (m + order)!
+        zero = self.get(0).zero()
+        new_holders = [zero] * order
+        for m in range(len(self)):
+            new_holders.append(self.get(m).scale(Fraction(1, falling_factorial(m + order, order))))
+
+        return IterativeConstant(initial_holders=new_holders, name=self.name, parity=self._shifted_parity(order))
+
+    @instrumented
+    def shift(self, k: int) -> IterativeConstant:
+        # Term n becomes a_(n + k), a negative k multiplies by x^(-k) instead
+        if k >= 0:
+            return IterativeConstant._from_storage(self._holders[k:len(self)], None, name=self.name,
+                                                   parity=self._shifted_parity(-k))
+        zero = self.get(0).zero()
+        return IterativeConstant(initial_holders=[zero] * -k + self.holders, name=self.name,
+                                 parity=self._shifted_parity(-k))
+
+    @instrumented
+    def rational_scale(self, numerator: Sequence[int], denominator: Sequence[int] = (1,)) -> IterativeConstant:
+        # Term n is scaled by p(n) / q(n), both given by their integer coefficients from the constant term up
+        new_holders = []
+        for n, holder in enumerate(self.holders):
+            if self.is_known_zero(n):
+                new_holders.append(holder)
+                continue
+            q_n = _evaluate_integer_polynomial(denominator, n)
+            if q_n == 0:
+                raise ZeroDivisionError(f"Denominator of the scale is zero at term {n}")
+            new_holders.append(holder.scale(Fraction(_evaluate_integer_polynomial(numerator, n), q_n)))
 
-        Progress.update()
-        return IterativeConstant(initial_holders=new_holders, name=self.name)
+        return IterativeConstant(initial_holders=new_holders, name=self.name, parity=self.parity)
+
+    @staticmethod
+    def linear_combination(iterators: Sequence[IterativeConstant], scales: Sequence[Number],
+                           name: str = None) -> IterativeConstant:
+        # Termwise sum of scale_j * iterator_j, the shorter constants count as zero past their end
+        if len(iterators) != len(scales) or not iterators:
+            raise ValueError("Linear combination needs one scale for each of at least one constant")
 
+        new_holders = []
+        for n in range(max(len(iterator) for iterator in iterators)):
+            holder = None
+            for iterator, scale in zip(iterators, scales):
+                if n >= len(iterator) or iterator.is_known_zero(n):
+                    continue
+                term = iterator.get(n).scale(scale)
+                holder = term if holder is None else holder.add(term)
+            new_holders.append(holder if holder is not None else iterators[0].get(0).zero())
+
+        parities = {iterator.parity for iterator in iterators}
+        parity = parities.pop() if len(parities) == 1 else None
+        return IterativeConstant(initial_holders=new_holders, name=name or iterators[0].name, parity=parity)
+
+    @instrumented
     def update(self, i: int, holder: ScalerHolder) -> IterativeConstant:
-        if i >= len(self.holders):
-            raise ValueError(f"Update at index {i} out of range {len(self.holders)}")
+        length = len(self)
+        if i >= length:
+            raise ValueError(f"Update at index {i} out of range {length}")
+        if length > 1:
+            self.verify_holder(holder)
 
-        iterator = self.copy()
-        iterator.holders[i] = holder
-        self.verify_names(iterator)
+        holders = self._holders[:length]
+        holders[i] = holder
 
-        Progress.update()
-        return iterator
+        return IterativeConstant._from_storage(holders, None, name=self.name, parity=self._keeps_parity(i, holder))
 
+    @instrumented
     def append(self, holder: ScalerHolder) -> IterativeConstant:
-        iterator = self.copy()
-        iterator.holders.append(holder)
-        self.verify_names(iterator)
+        self.verify_holder(holder)
+
+        # Appending to the end of the storage leaves this constant's own holders untouched,
+        # so the storage is handed to the new constant and only copied when this one branches again
+        length = len(self)
+        if self._length is None:
+            holders = self._holders
+            self._length = length
+        else:
+            holders = self._holders[:length]
+        holders.append(holder)
 
-        Progress.update()
-        return iterator
+        return IterativeConstant._from_storage(holders, None, name=self.name, parity=self._keeps_parity(length, holder))
+
+    @instrumented
+    def add(self, iterator: IterativeConstant) -> IterativeConstant:
+        length = max(len(self), len(iterator))
+        new_holders = []
+        for i in range(length):
+            a_i = self.get(i) if i < len(self) else None
+            b_i = iterator.get(i) if i < len(iterator) else None
+            if a_i is None or self.is_known_zero(i):
+                new_holders.append(b_i if b_i is not None else a_i)
+            elif b_i is None or iterator.is_known_zero(i):
+                new_holders.append(a_i)
+            else:
+                new_holders.append(a_i.add(b_i))
+
+        parity = self.parity if self.parity == iterator.parity else None
+        return IterativeConstant(initial_holders=new_holders, name=self.name, parity=parity)
 
-    def conv(self, iterator: IterativeConstant, i: int, n: int, n_index: int) -> ScalerHolder:
-        self_iterator = self.copy()
+    @instrumented
+    def conv(self, iterator: IterativeConstant, i: int, n: int, n_index: int, executor=None) -> ScalerHolder:
+        if executor is not None:
+            return executor.conv(self, iterator, i=i, n=n, n_index=n_index)
 
-        holder = ScalerHolder(initial_constants=[0], name=iterator.holders[0].name)
+        holder = iterator._holders[0].zero()
         for i in range(i, n + 1):
-            a_i = self_iterator.get(i)
+            if self.is_known_zero(i) or iterator.is_known_zero(n_index - i):
+                continue
+            a_i = self.get(i)
             b_n_minus_i = iterator.get(n_index - i)
+            if a_i.is_zero() or b_n_minus_i.is_zero():
+                continue
             c_n_i = a_i.multiply(b_n_minus_i)
             holder = holder.add(c_n_i)
 
-        Progress.update()
         return holder
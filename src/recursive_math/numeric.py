@@ -0,0 +1,128 @@
+from __future__ import annotations
+from typing import List, Optional, Union
+
+from numpy import ndarray, asarray, zeros, full, float64, einsum
+
+from .backends import Backend
+from .iterative_constants import IterativeConstant
+from .series import Series
+
+
+Column = Union[float, ndarray]
+
+
+def evaluate_constants(constants: list, backend: Backend, scalers: ndarray) -> ndarray:
+    # Horner's rule for a holder's polynomial in the scaler, for every scaler value at once
+    result = zeros(len(scalers), dtype=float64)
+    for constant in reversed(constants):
+        result *= scalers
+        result += backend.to_float(constant)
+    return result
+
+
+class NumericConstant:
+
+    def __init__(self, values: ndarray, name: str, scalers: ndarray):
+        values = asarray(values, dtype=float64)
+        scalers = asarray(scalers, dtype=float64)
+        if values.ndim != 2 or values.shape[0] != len(scalers):
+            raise ValueError(f"Values of shape {values.shape} do not match {len(scalers)} scaler values")
+
+        # Columns are shared between constants like IterativeConstant holders,
+        # _used counts the columns written so far so only the newest constant appends in place
+        self._values: ndarray = values
+        self._length: int = values.shape[1]
+        self._used: List[int] = [values.shape[1]]
+        self.name: str = name
+        self.scalers: ndarray = scalers
+
+    @classmethod
+    def _from_storage(cls, values: ndarray, length: int, used: List[int], name: str,
+                      scalers: ndarray) -> NumericConstant:
+        constant = cls.__new__(cls)
+        constant._values = values
+        constant._length = length
+        constant._used = used
+        constant.name = name
+        constant.scalers = scalers
+        return constant
+
+    @classmethod
+    def from_iterative_constant(cls, iterator: IterativeConstant, scalers: ndarray) -> NumericConstant:
+        scalers = asarray(scalers, dtype=float64)
+        values = zeros((len(scalers), len(iterator)), dtype=float64)
+        for i in range(len(iterator)):
+            holder = iterator.get(i)
+            values[:, i] = evaluate_constants(holder.constants, holder.backend, scalers)
+        return cls(values, name=iterator.name, scalers=scalers)
+
+    @property
+    def values(self) -> ndarray:
+        return self._values[:, :self._length]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.values}"
+
+    def __getitem__(self, item: slice) -> NumericConstant:
+        if not isinstance(item, slice) or item.step not in (None, 1) or item.start not in (None, 0):
+            raise ValueError("Only slices from the start of the constant are supported")
+        length = len(range(self._length)[item])
+        return NumericConstant._from_storage(self._values, length, self._used, name=self.name, scalers=self.scalers)
+
+    def get(self, i: int) -> ndarray:
+        return self._values[:, range(self._length)[i]]
+
+    def _column(self, value: Column) -> ndarray:
+        return full(len(self.scalers), value, dtype=float64) if not isinstance(value, ndarray) else value
+
+    def append(self, value: Column) -> NumericConstant:
+        length = self._length
+        values = self._values
+        used = self._used
+
+        if used[0] != length or length == values.shape[1]:
+            # Another constant already wrote past this one, or the storage is full
+            capacity = max(2 * length, 8)
+            values = zeros((len(self.scalers), capacity), dtype=float64)
+            values[:, :length] = self._values[:, :length]
+            used = [length]
+
+        values[:, length] = self._column(value)
+        used[0] = length + 1
+        return NumericConstant._from_storage(values, length + 1, used, name=self.name, scalers=self.scalers)
+
+    def scale(self, value: Column) -> NumericConstant:
+        if isinstance(value, ndarray):
+            value = value[:, None]
+        return NumericConstant(self.values * value, name=self.name, scalers=self.scalers)
+
+    def increase_scaler(self) -> NumericConstant:
+        return self.scale(self.scalers)
+
+    def add(self, constant: NumericConstant) -> NumericConstant:
+        self.check_compatible(constant)
+        values = zeros((len(self.scalers), max(len(self), len(constant))), dtype=float64)
+        values[:, :len(self)] += self.values
+        values[:, :len(constant)] += constant.values
+        return NumericConstant(values, name=self.name, scalers=self.scalers)
+
+    def check_compatible(self, constant: NumericConstant):
+        if len(constant.scalers) != len(self.scalers) or (constant.scalers != self.scalers).any():
+            raise TypeError("Scaler values do not match")
+
+    def conv(self, constant: NumericConstant, i: int, n: int, n_index: int) -> ndarray:
+        # sum of a_k b_(n_index - k) for k from i to n, for every scaler value at once
+        self.check_compatible(constant)
+        if n < i:
+            return zeros(len(self.scalers), dtype=float64)
+        a = self.values[:, i:n + 1]
+        b = constant.values[:, n_index - n:n_index - i + 1][:, ::-1]
+        return einsum("ij,ij->i", a, b)
+
+    def series(self, index: Optional[int] = None) -> Union[Series, List[Series]]:
+        if index is not None:
+            return Series(self.values[index].copy())
+        return [Series(row.copy()) for row in self.values]
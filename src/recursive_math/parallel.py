@@ -0,0 +1,131 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from decimal import getcontext
+
+from .backends import Backend
+from .convolution import _add_into
+from .iterative_constants import IterativeConstant, ScalerHolder, set_decimal_precision
+
+
+# Holders are sent between processes as flat tuples of the integer pairs of Backend.to_exact
+Payload = Tuple[int, ...]
+
+
+def encode(constants: list, backend: Backend) -> Payload:
+    to_exact = backend.to_exact
+    return tuple(integer for constant in constants for integer in to_exact(constant))
+
+
+def decode(payload: Payload, backend: Backend) -> list:
+    from_exact = backend.from_exact
+    return [from_exact(a, b) for a, b in zip(payload[::2], payload[1::2])]
+
+
+def _initialize(precision: int):
+    set_decimal_precision(precision)
+
+
+def _multiply_sum(backend: Backend, pairs: List[Tuple[Payload, Payload]]) -> Payload:
+    multiply_polynomials = backend.multiply_polynomials
+    total = []
+    for a, b in pairs:
+        _add_into(total, multiply_polynomials(decode(a, backend), decode(b, backend)), backend.add)
+    return encode(total, backend)
+
+
+def _multiply_each(backend: Backend, pairs: List[Tuple[Payload, Payload]]) -> List[Payload]:
+    multiply_polynomials = backend.multiply_polynomials
+    return [encode(multiply_polynomials(decode(a, backend), decode(b, backend)), backend) for a, b in pairs]
+
+
+def _generate(build: Callable[[Any], IterativeConstant], argument: Any) -> Tuple[str, Optional[int], list]:
+    iterator = build(argument)
+    for holder in iterator.holders:
+        if not isinstance(holder, ScalerHolder):
+            raise TypeError(f"Parallel generation needs ScalerHolder terms, got {type(holder).__name__}")
+    holders = [(holder.name, holder.backend, encode(holder.constants, holder.backend)) for holder in iterator.holders]
+    return iterator.name, iterator.parity, holders
+
+
+class ParallelExecutor:
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 16):
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size has to be positive, got {chunk_size}")
+        self.chunk_size: int = chunk_size
+        # Workers are spawned, forking a parent that already runs tqdm or numba threads can deadlock,
+        # and they round decimals with the precision that was set when the executor was created
+        self.pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"),
+                                        initializer=_initialize, initargs=(getcontext().prec,))
+
+    def __enter__(self) -> ParallelExecutor:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def shutdown(self):
+        self.pool.shutdown()
+
+    def conv(self, a: IterativeConstant, b: IterativeConstant, i: int, n: int, n_index: int) -> ScalerHolder:
+        zero = b.get(0).zero()
+        if not isinstance(zero, ScalerHolder):
+            raise TypeError(f"Parallel convolution needs ScalerHolder terms, got {type(zero).__name__}")
+        backend = zero.backend
+
+        pairs = []
+        for k in range(i, n + 1):
+            if a.is_known_zero(k) or b.is_known_zero(n_index - k):
+                continue
+            a_k = a.get(k)
+            b_n_minus_k = b.get(n_index - k)
+            if a_k.is_zero() or b_n_minus_k.is_zero():
+                continue
+            a_k.check_compatible(b_n_minus_k)
+            pairs.append((encode(a_k.constants, backend), encode(b_n_minus_k.constants, backend)))
+
+        constants = []
+        futures = [self.pool.submit(_multiply_sum, backend, pairs[start:start + self.chunk_size])
+                   for start in range(0, len(pairs), self.chunk_size)]
+        for future in futures:
+            _add_into(constants, decode(future.result(), backend), backend.add)
+        return zero.add(ScalerHolder._from_native(constants, name=zero.name, backend=backend))
+
+    def multiply(self, pairs: Iterable[Tuple[ScalerHolder, ScalerHolder]]) -> List[ScalerHolder]:
+        pairs = list(pairs)
+        for a, b in pairs:
+            if not isinstance(a, ScalerHolder) or not isinstance(b, ScalerHolder):
+                raise TypeError("Parallel multiplication needs ScalerHolder terms")
+            a.check_compatible(b)
+
+        # Pairs may come from different backends, so each chunk is encoded with the backend of its own holders
+        chunks = []
+        for start in range(0, len(pairs), self.chunk_size):
+            chunk = pairs[start:start + self.chunk_size]
+            backend = chunk[0][0].backend
+            if any(a.backend != backend for a, _ in chunk):
+                chunks.extend([pair] for pair in chunk)
+            else:
+                chunks.append(chunk)
+
+        futures = [self.pool.submit(_multiply_each, chunk[0][0].backend,
+                                    [(encode(a.constants, a.backend), encode(b.constants, b.backend)) for a, b in chunk])
+                   for chunk in chunks]
+
+        results = []
+        for chunk, future in zip(chunks, futures):
+            for (a, _), product in zip(chunk, future.result()):
+                results.append(ScalerHolder._from_native(decode(product, a.backend), name=a.name, backend=a.backend))
+        return results
+
+    def generate(self, build: Callable[[Any], IterativeConstant], arguments: Iterable[Any]) -> List[IterativeConstant]:
+        # build has to be picklable, such as a function defined at module level
+        arguments = list(arguments)
+        results = []
+        for name, parity, holders in self.pool.map(_generate, [build] * len(arguments), arguments):
+            holders = [ScalerHolder._from_native(decode(payload, backend), name=holder_name, backend=backend)
+                       for holder_name, backend, payload in holders]
+            results.append(IterativeConstant._from_storage(holders, len(holders), name=name, parity=parity))
+        return results
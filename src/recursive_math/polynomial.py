@@ -0,0 +1,104 @@
+from __future__ import annotations
+from typing import Any, Callable, List
+
+
+# Minimum operand lengths at which the cheaper asymptotic methods take over
+KARATSUBA_CUTOFF = 12
+KRONECKER_CUTOFF = 24
+
+
+def schoolbook(a: list, b: list, multiply: Callable[[Any, Any], Any], add: Callable[[Any, Any], Any],
+               zero: Any) -> list:
+    if not a or not b:
+        return []
+
+    products = [zero] * (len(a) + len(b) - 1)
+    for n, c1 in enumerate(a):
+        for m, c2 in enumerate(b):
+            products[n + m] = add(products[n + m], multiply(c1, c2))
+    return products
+
+
+def _schoolbook_integers(a: List[int], b: List[int]) -> List[int]:
+    products = [0] * (len(a) + len(b) - 1)
+    for n, c1 in enumerate(a):
+        if c1:
+            for m, c2 in enumerate(b):
+                products[n + m] += c1 * c2
+    return products
+
+
+def _add_into(target: List[int], values: List[int], offset: int, sign: int = 1):
+    for i, value in enumerate(values):
+        target[offset + i] += sign * value
+
+
+def karatsuba(a: List[int], b: List[int]) -> List[int]:
+    if not a or not b:
+        return []
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) < KARATSUBA_CUTOFF:
+        return _schoolbook_integers(a, b)
+
+    m = len(a) // 2
+    products = [0] * (len(a) + len(b) - 1)
+    if len(b) <= m:
+        # The shorter operand fits in the lower half, so only the longer one is split
+        _add_into(products, karatsuba(a[:m], b), 0)
+        _add_into(products, karatsuba(a[m:], b), m)
+        return products
+
+    a0, a1 = a[:m], a[m:]
+    b0, b1 = b[:m], b[m:]
+    z0 = karatsuba(a0, b0)
+    z2 = karatsuba(a1, b1)
+    z1 = karatsuba([x + y for x, y in _zip_padded(a0, a1)], [x + y for x, y in _zip_padded(b0, b1)])
+    _add_into(z1, z0, 0, -1)
+    _add_into(z1, z2, 0, -1)
+
+    _add_into(products, z0, 0)
+    _add_into(products, z1[:len(products) - m], m)
+    _add_into(products, z2, 2 * m)
+    return products
+
+
+def _zip_padded(a: List[int], b: List[int]):
+    length = max(len(a), len(b))
+    a = a + [0] * (length - len(a))
+    b = b + [0] * (length - len(b))
+    return zip(a, b)
+
+
+def kronecker(a: List[int], b: List[int]) -> List[int]:
+    if not a or not b:
+        return []
+
+    length = len(a) + len(b) - 1
+    bound = max(abs(c) for c in a) * max(abs(c) for c in b) * min(len(a), len(b))
+    if not bound:
+        # One operand is all zeros, the slots would be too narrow to pack the other one
+        return [0] * length
+    width = (bound.bit_length() + 2 + 7) // 8
+    bits = 8 * width
+
+    product = _pack(a, width) * _pack(b, width)
+
+    # Shift every packed coefficient into [0, 2**bits) so the result unpacks byte by byte
+    half = 1 << (bits - 1)
+    bias = int.from_bytes((b"\x00" * (width - 1) + b"\x80") * length, "little")
+    packed = (product + bias).to_bytes(width * length, "little")
+
+    return [int.from_bytes(packed[i * width:(i + 1) * width], "little") - half for i in range(length)]
+
+
+def _pack(values: List[int], width: int) -> int:
+    positive = b"".join((c if c > 0 else 0).to_bytes(width, "little") for c in values)
+    negative = b"".join((-c if c < 0 else 0).to_bytes(width, "little") for c in values)
+    return int.from_bytes(positive, "little") - int.from_bytes(negative, "little")
+
+
+def multiply_integers(a: List[int], b: List[int]) -> List[int]:
+    if min(len(a), len(b)) < KRONECKER_CUTOFF:
+        return karatsuba(a, b)
+    return kronecker(a, b)
@@ -1,5 +1,10 @@
+from __future__ import annotations
+from typing import Any
+
 from tqdm import tqdm
 
+from .instrumentation import attach, detach
+
 
 class Progress:
     pbar: tqdm = None
@@ -7,7 +12,26 @@ class Progress:
 
     @classmethod
     def set_pbar(cls, pbar: tqdm):
+        # Operations are only counted while a bar is set, without one nothing is instrumented
         cls.pbar = pbar
+        if pbar is None:
+            detach(cls)
+        else:
+            attach(cls)
+
+    @classmethod
+    def enable(cls):
+        # Counts operations for get_counter without a bar
+        attach(cls)
+
+    @classmethod
+    def disable(cls):
+        cls.pbar = None
+        detach(cls)
+
+    @classmethod
+    def record(cls, operation: str, args: tuple, result: Any, elapsed: float):
+        cls.update()
 
     @classmethod
     def update(cls):
@@ -21,4 +45,4 @@ class Progress:
 
     @classmethod
     def reset_counter(cls):
-        cls.counter = 0
\ No newline at end of file
+        cls.counter = 0
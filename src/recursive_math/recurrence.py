@@ -0,0 +1,300 @@
+from __future__ import annotations
+from asyncio import get_running_loop
+from concurrent.futures import Executor
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+from numpy import ndarray, array, asarray, zeros, float64, einsum
+
+from .backends import Backend, Number, get_backend
+from .common_functions import TaylorSource
+from .convolution import _add_into
+from .iterative_constants import IterativeConstant, ScalerHolder, falling_factorial
+from .numeric import NumericConstant, evaluate_constants
+from .streaming import Term, ConvergenceMonitor
+
+
+Scale = Union[Number, ScalerHolder]
+
+
+def _times(constants: list, factor: int, backend: Backend) -> list:
+    multiply_integer = backend.multiply_integer
+    return [multiply_integer(c, factor) for c in constants]
+
+
+def _strip(constants: list) -> list:
+    end = len(constants)
+    while end > 1 and not constants[end - 1]:
+        end -= 1
+    return constants[:end]
+
+
+class Recurrence:
+
+    def __init__(self, name: str, holder_name: str,
+                 initial: Union[IterativeConstant, List[Union[ScalerHolder, Number]]], backend: Backend = None):
+        if isinstance(initial, IterativeConstant):
+            initial = initial.holders
+        if backend is None:
+            holders = [value for value in initial if isinstance(value, ScalerHolder)]
+            backend = holders[0].backend if holders else get_backend()
+
+        self.name: str = name
+        self.holder_name: str = holder_name
+        self.backend: Backend = backend
+
+        self._holders: List[ScalerHolder] = []
+        self._coefficients: List[list] = []
+        for value in initial:
+            if not isinstance(value, ScalerHolder):
+                value = ScalerHolder(initial_constants=[value], name=holder_name, backend=backend)
+            self._check_holder(value)
+            self._holders.append(value)
+            self._coefficients.append(value.constants)
+
+        self._derivatives: List[Tuple[int, list, int]] = []
+        self._products: List[Tuple[int, int, list, int]] = []
+        self._sources: List[Tuple[IterativeConstant, list, int]] = []
+        self._derived: Dict[int, List[list]] = {}
+
+    def _check_holder(self, holder: ScalerHolder):
+        if holder.name != self.holder_name:
+            raise TypeError("Scaler types do not match")
+        if holder.backend != self.backend:
+            raise TypeError(f"Scaler backends do not match: {self.backend} and {holder.backend}")
+
+    def _scale(self, scale: Scale) -> list:
+        if isinstance(scale, ScalerHolder):
+            self._check_holder(scale)
+            return scale.constants
+        return [self.backend.convert(scale)]
+
+    def derivative(self, order: int, scale: Scale = 1, power: int = 0) -> Recurrence:
+        # Adds scale * x^power * y^(order) to the left hand side
+        self._derivatives.append((order, self._scale(scale), power))
+        return self
+
+    def product(self, order_1: int, order_2: int, scale: Scale = 1, power: int = 0) -> Recurrence:
+        # Adds scale * x^power * y^(order_1) * y^(order_2) to the left hand side
+        self._products.append((order_1, order_2, self._scale(scale), power))
+        self._derived.setdefault(order_1, [])
+        self._derived.setdefault(order_2, [])
+        return self
+
+    def source(self, source: IterativeConstant, scale: Scale = 1, power: int = 0) -> Recurrence:
+        # Adds scale * x^power * f(x) to the right hand side
+        self._sources.append((source, self._scale(scale), power))
+        return self
+
+    @property
+    def order(self) -> int:
+        orders = [order for order, _, _ in self._derivatives]
+        orders += [max(order_1, order_2) for order_1, order_2, _, _ in self._products]
+        if not orders:
+            raise ValueError("Recurrence has no derivative or product terms")
+        return max(orders)
+
+    def _source_constants(self, source: IterativeConstant, n: int) -> list:
+        if isinstance(source, TaylorSource):
+            return source.holder(n, backend=self.backend).constants
+        return source.get(n).constants
+
+    def _derived_terms(self, order: int) -> List[list]:
+        # d_m = a_(m + order) (m + order)! / m!, the coefficients of the order-th derivative
+        derived = self._derived[order]
+        coefficients = self._coefficients
+        for m in range(len(derived), len(coefficients) - order):
+            factor = falling_factorial(m + order, order)
+            derived.append(_times(coefficients[m + order], factor, self.backend))
+        return derived
+
+    def _step(self, n: int, unknown: int) -> list:
+        backend = self.backend
+        multiply_polynomials = backend.multiply_polynomials
+        add = backend.add
+        coefficients = self._coefficients
+
+        known = []
+        leading = []
+
+        for order, scale, power in self._derivatives:
+            m = n - power
+            if m < 0:
+                continue
+            index = m + order
+            factor = falling_factorial(index, order)
+            if index == unknown:
+                _add_into(leading, _times(scale, factor, backend), add)
+            else:
+                _add_into(known, multiply_polynomials(scale, _times(coefficients[index], factor, backend)), add)
+
+        for order_1, order_2, scale, power in self._products:
+            m = n - power
+            if m < 0:
+                continue
+            d_1 = self._derived_terms(order_1)
+            d_2 = self._derived_terms(order_2)
+
+            products = []
+            for i in range(m + 1):
+                j = m - i
+                if order_1 == order_2 and j < i:
+                    break
+                unknown_1 = i + order_1 == unknown
+                unknown_2 = j + order_2 == unknown
+                if unknown_1 and unknown_2:
+                    raise ValueError(f"Term {unknown} of {self.name} appears squared in the product "
+                                     f"y^({order_1}) y^({order_2})")
+
+                count = 2 if order_1 == order_2 and i != j else 1
+                if unknown_1:
+                    factor = count * falling_factorial(unknown, order_1)
+                    _add_into(leading, multiply_polynomials(scale, _times(d_2[j], factor, backend)), add)
+                elif unknown_2:
+                    factor = count * falling_factorial(unknown, order_2)
+                    _add_into(leading, multiply_polynomials(scale, _times(d_1[i], factor, backend)), add)
+                else:
+                    product = multiply_polynomials(d_1[i], d_2[j])
+                    _add_into(products, product if count == 1 else [add(c, c) for c in product], add)
+            if products:
+                _add_into(known, multiply_polynomials(scale, products), add)
+
+        right = []
+        for source, scale, power in self._sources:
+            m = n - power
+            if m >= 0 and not source.is_known_zero(m):
+                _add_into(right, multiply_polynomials(scale, self._source_constants(source, m)), add)
+
+        leading = _strip(leading)
+        if len(leading) > 1:
+            raise ValueError(f"Leading coefficient of term {unknown} of {self.name} depends on {self.holder_name}")
+        if not leading or not leading[0]:
+            raise ValueError(f"Leading coefficient of term {unknown} of {self.name} is zero")
+
+        _add_into(right, [backend.negate(c) for c in known], add)
+        divide = backend.divide
+        return _strip([divide(c, leading[0]) for c in right] or [backend.zero])
+
+    def _check_initial(self) -> int:
+        order = self.order
+        if len(self._coefficients) < order:
+            raise ValueError(f"Recurrence of order {order} needs {order} initial values, "
+                             f"got {len(self._coefficients)}")
+        return order
+
+    def _extend(self, order: int):
+        unknown = len(self._coefficients)
+        constants = self._step(unknown - order, unknown)
+        self._coefficients.append(constants)
+        self._holders.append(ScalerHolder._from_native(constants, name=self.holder_name, backend=self.backend))
+
+    def solve(self, N: int) -> IterativeConstant:
+        # Solving is resumable, calling again with a larger N only computes the new terms
+        order = self._check_initial()
+        while len(self._coefficients) < N:
+            self._extend(order)
+        return IterativeConstant(initial_holders=self._holders[:N], name=self.name)
+
+    def current(self) -> IterativeConstant:
+        # Every term solved so far, safe to call while another thread is streaming
+        return IterativeConstant(initial_holders=list(self._holders), name=self.name)
+
+    def stream(self, N: Optional[int] = None, monitor: Optional[ConvergenceMonitor] = None) -> Iterator[Term]:
+        # Yields the terms from the first one on, solving each only when it is asked for.
+        # Without N or a monitor the stream never ends.
+        order = self._check_initial()
+        n = 0
+        while N is None or n < N:
+            if n == len(self._holders):
+                self._extend(order)
+            term = Term(n, self._holders[n])
+            yield term
+            n += 1
+            if monitor is not None and monitor.update(term):
+                return
+
+    async def astream(self, N: Optional[int] = None, monitor: Optional[ConvergenceMonitor] = None,
+                      executor: Optional[Executor] = None) -> AsyncIterator[Term]:
+        # Each term is solved in the executor, the event loop keeps serving current() in between
+        loop = get_running_loop()
+        terms = self.stream(N, monitor)
+        while True:
+            term = await loop.run_in_executor(executor, next, terms, None)
+            if term is None:
+                return
+            yield term
+
+    def solve_until(self, monitor: ConvergenceMonitor, max_terms: int = 1000) -> IterativeConstant:
+        for _ in self.stream(max_terms, monitor):
+            pass
+        if not monitor.converged:
+            raise ValueError(f"{self.name} did not converge in {max_terms} terms, "
+                             f"the tail is estimated at {monitor.tail:.2e}")
+        return IterativeConstant(initial_holders=self._holders[:monitor.length], name=self.name)
+
+    def solve_numeric(self, N: int, scalers: ndarray) -> NumericConstant:
+        # Runs the same recurrence in float64 with every scaler value at once, the scaler is never symbolic
+        order = self._check_initial()
+
+        backend = self.backend
+        scalers = asarray(scalers, dtype=float64)
+        values = zeros((len(scalers), max(N, len(self._coefficients))), dtype=float64)
+        for i, constants in enumerate(self._coefficients):
+            values[:, i] = evaluate_constants(constants, backend, scalers)
+
+        def evaluate(constants: list) -> ndarray:
+            return evaluate_constants(constants, backend, scalers)
+
+        def factors(derivative_order: int) -> ndarray:
+            return array([falling_factorial(m + derivative_order, derivative_order) for m in range(N)], dtype=float64)
+
+        derivatives = [(derivative_order, evaluate(scale), power)
+                       for derivative_order, scale, power in self._derivatives]
+        products = [(order_1, order_2, factors(order_1), factors(order_2), evaluate(scale), power)
+                    for order_1, order_2, scale, power in self._products]
+        sources = [(source, evaluate(scale), power) for source, scale, power in self._sources]
+
+        # Columns from unknown on are still zero, so full sums over the products only collect known terms
+        for unknown in range(len(self._coefficients), N):
+            n = unknown - order
+            known = zeros(len(scalers), dtype=float64)
+            leading = zeros(len(scalers), dtype=float64)
+
+            for derivative_order, scale, power in derivatives:
+                m = n - power
+                if m < 0:
+                    continue
+                index = m + derivative_order
+                factor = falling_factorial(index, derivative_order)
+                if index == unknown:
+                    leading += factor * scale
+                else:
+                    known += factor * scale * values[:, index]
+
+            for order_1, order_2, factors_1, factors_2, scale, power in products:
+                m = n - power
+                if m < 0:
+                    continue
+                d_1 = values[:, order_1:order_1 + m + 1] * factors_1[:m + 1]
+                d_2 = values[:, order_2:order_2 + m + 1] * factors_2[:m + 1]
+                known += scale * einsum("ij,ij->i", d_1, d_2[:, ::-1])
+
+                i_1, i_2 = unknown - order_1, unknown - order_2
+                if 0 <= i_1 <= m and 0 <= i_2 <= m and i_1 + i_2 == m:
+                    raise ValueError(f"Term {unknown} of {self.name} appears squared in the product "
+                                     f"y^({order_1}) y^({order_2})")
+                if 0 <= i_1 <= m:
+                    leading += scale * falling_factorial(unknown, order_1) * d_2[:, m - i_1]
+                if 0 <= i_2 <= m:
+                    leading += scale * falling_factorial(unknown, order_2) * d_1[:, m - i_2]
+
+            right = zeros(len(scalers), dtype=float64)
+            for source, scale, power in sources:
+                m = n - power
+                if m >= 0 and not source.is_known_zero(m):
+                    right += scale * evaluate(self._source_constants(source, m))
+
+            if not leading.all():
+                raise ValueError(f"Leading coefficient of term {unknown} of {self.name} is zero")
+            values[:, unknown] = (right - known) / leading
+
+        return NumericConstant(values[:, :N], name=self.name, scalers=scalers)
@@ -1,11 +1,53 @@
 from __future__ import annotations
-from typing import Union
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, Union
+from collections import OrderedDict
 
 import numba
-from numpy import array, ndarray, empty, float64, empty_like
+from numba import prange
+from numpy import (array, ndarray, empty, zeros, arange, ones, moveaxis, float32, float64, asarray, result_type,
+                   concatenate, may_share_memory, dtype as as_dtype)
+from numpy.linalg import solve, LinAlgError
 
 
-@numba.jit(nopython=True)
+try:
+    from numba.core.caching import FunctionCache, CompileResultCacheImpl
+except ImportError:
+    # numba internals, without them the kernels fall back to the plain on-disk cache
+    FunctionCache = CompileResultCacheImpl = None
+
+
+if FunctionCache is not None:
+
+    class _ModuleCacheImpl(CompileResultCacheImpl):
+
+        def __init__(self, py_func):
+            self._module = py_func.__module__
+            super().__init__(py_func)
+
+        def get_filename_base(self, fullname: str, abiflags: str) -> str:
+            # Cached kernels remember the module they were compiled in, so the package imported
+            # as src.recursive_math and as recursive_math keeps separate entries next to the same file
+            return super().get_filename_base(f"{self._module}.{fullname}", abiflags)
+
+    class _ModuleCache(FunctionCache):
+        _impl_class = _ModuleCacheImpl
+
+
+def cached_jit(**options):
+    # numba.jit(cache=True) with the cache kept apart for every name the package is imported under
+    def decorate(function):
+        if FunctionCache is not None:
+            try:
+                dispatcher = numba.jit(**options)(function)
+                dispatcher._cache = _ModuleCache(function)
+                return dispatcher
+            except AttributeError:
+                pass
+        return numba.jit(cache=True, **options)(function)
+    return decorate
+
+
+@cached_jit(nopython=True)
 def evaluate_polynomial(x: float, constants: ndarray) -> float:
     constants = constants[::-1]
 
@@ -15,7 +57,7 @@ def evaluate_polynomial(x: float, constants: ndarray) -> float:
     return value
 
 
-@numba.jit(nopython=True)
+@cached_jit(nopython=True)
 def evaluate_polynomials(scaler_value: float, matrix: ndarray) -> ndarray:
     results = empty(matrix.shape[0], dtype=float64)
     for i in range(len(matrix)):
@@ -23,61 +65,600 @@ def evaluate_polynomials(scaler_value: float, matrix: ndarray) -> ndarray:
     return results
 
 
-@numba.jit(nopython=True)
-def n_evaluate_polynomial(x: ndarray, constants: ndarray) -> ndarray:
-    constants = constants[::-1]
+@cached_jit(nopython=True, parallel=True)
+def n_evaluate_polynomial_into(x: ndarray, constants: ndarray, out: ndarray) -> ndarray:
+    last = len(constants) - 1
+    for k in prange(len(x)):
+        x_k = x[k]
+        value = constants[last]
+        for i in range(last - 1, -1, -1):
+            value = value * x_k + constants[i]
+        out[k] = value
+    return out
 
-    value = empty_like(x)
-    value[:] = constants[0]
 
-    for i in range(1, len(constants)):
-        value = value * x + constants[i]
-    return value
+def n_evaluate_polynomial(x: ndarray, constants: ndarray, out: ndarray = None, dtype=None) -> ndarray:
+    if out is not None:
+        dtype = out.dtype
+    elif dtype is None:
+        dtype = result_type(x.dtype, constants.dtype)
+    else:
+        dtype = as_dtype(dtype)
+
+    if out is None:
+        out = empty(x.shape, dtype=dtype)
+    elif out.shape != x.shape:
+        raise ValueError(f"Output shape {out.shape} does not match input shape {x.shape}")
+    elif not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError("Output array has to be C-contiguous and writeable")
+
+    flat_out = out.reshape(-1)
+
+    if len(constants) == 0:
+        flat_out[:] = 0
+        return out
+
+    n_evaluate_polynomial_into(x.reshape(-1).astype(dtype, copy=False), constants.astype(dtype, copy=False), flat_out)
+    return out
+
+
+@cached_jit(nopython=True)
+def evaluate_rational(x: float, numerator: ndarray, denominator: ndarray) -> float:
+    return evaluate_polynomial(x, numerator) / evaluate_polynomial(x, denominator)
+
+
+@cached_jit(nopython=True, parallel=True)
+def n_evaluate_rational_into(x: ndarray, numerator: ndarray, denominator: ndarray, out: ndarray) -> ndarray:
+    last_p = len(numerator) - 1
+    last_q = len(denominator) - 1
+    for k in prange(len(x)):
+        x_k = x[k]
+        p = numerator[last_p]
+        for i in range(last_p - 1, -1, -1):
+            p = p * x_k + numerator[i]
+        q = denominator[last_q]
+        for i in range(last_q - 1, -1, -1):
+            q = q * x_k + denominator[i]
+        out[k] = p / q
+    return out
+
+
+@cached_jit(nopython=True)
+def _two_sum(a: float, b: float) -> Tuple[float, float]:
+    s = a + b
+    v = s - a
+    return s, (a - (s - v)) + (b - v)
+
+
+@cached_jit(nopython=True)
+def _fast_two_sum(a: float, b: float) -> Tuple[float, float]:
+    s = a + b
+    return s, b - (s - a)
+
+
+@cached_jit(nopython=True)
+def _two_product(a: float, b: float) -> Tuple[float, float]:
+    # Dekker's product, the error term is exact without an fma
+    p = a * b
+    c = 134217729.0 * a
+    a_hi = c - (c - a)
+    a_lo = a - a_hi
+    c = 134217729.0 * b
+    b_hi = c - (c - b)
+    b_lo = b - b_hi
+    return p, ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+
+@cached_jit(nopython=True)
+def dd_multiply_add(hi: float, lo: float, x_hi: float, x_lo: float, c_hi: float, c_lo: float) -> Tuple[float, float]:
+    # (hi + lo) (x_hi + x_lo) + (c_hi + c_lo) with about 32 significant digits
+    p, e = _two_product(hi, x_hi)
+    e += hi * x_lo + lo * x_hi
+    p, e = _fast_two_sum(p, e)
+    s, f = _two_sum(p, c_hi)
+    f += e + c_lo
+    return _fast_two_sum(s, f)
+
+
+@cached_jit(nopython=True, parallel=True)
+def n_evaluate_double_double_into(x: ndarray, hi: ndarray, lo: ndarray, parity: int, out: ndarray) -> ndarray:
+    # parity is -1 without one, the powers of x^2 are then formed in double-double as well
+    last = len(hi) - 1
+    for k in prange(len(x)):
+        x_hi = x[k]
+        x_lo = 0.0
+        if parity >= 0:
+            x_hi, x_lo = _two_product(x[k], x[k])
+        value_hi = hi[last]
+        value_lo = lo[last]
+        for i in range(last - 1, -1, -1):
+            value_hi, value_lo = dd_multiply_add(value_hi, value_lo, x_hi, x_lo, hi[i], lo[i])
+        if parity == 1:
+            value_hi, value_lo = dd_multiply_add(value_hi, value_lo, x[k], 0.0, 0.0, 0.0)
+        out[k] = value_hi + value_lo
+    return out
+
+
+@cached_jit(nopython=True)
+def evaluate_polynomials_double_double(scaler_value: float, hi: ndarray, lo: ndarray) -> Tuple[ndarray, ndarray]:
+    rows, columns = hi.shape
+    results_hi = empty(rows, dtype=float64)
+    results_lo = empty(rows, dtype=float64)
+    for i in range(rows):
+        value_hi = hi[i, columns - 1]
+        value_lo = lo[i, columns - 1]
+        for j in range(columns - 2, -1, -1):
+            value_hi, value_lo = dd_multiply_add(value_hi, value_lo, scaler_value, 0.0, hi[i, j], lo[i, j])
+        results_hi[i] = value_hi
+        results_lo[i] = value_lo
+    return results_hi, results_lo
+
+
+@cached_jit(nopython=True, parallel=True)
+def evaluate_polynomials_many(scaler_values: ndarray, matrix: ndarray) -> ndarray:
+    rows, columns = matrix.shape
+    results = empty((len(scaler_values), rows), dtype=float64)
+    for b in prange(len(scaler_values)):
+        scaler_value = scaler_values[b]
+        for i in range(rows):
+            value = matrix[i, columns - 1]
+            for j in range(columns - 2, -1, -1):
+                value = value * scaler_value + matrix[i, j]
+            results[b, i] = value
+    return results
+
+
+@cached_jit(nopython=True, parallel=True)
+def evaluate_grid(scaler_values: ndarray, x: ndarray, matrix: ndarray) -> ndarray:
+    rows, columns = matrix.shape
+    results = empty((len(scaler_values), len(x)), dtype=float64)
+    for b in prange(len(scaler_values)):
+        scaler_value = scaler_values[b]
+        constants = empty(rows, dtype=float64)
+        for i in range(rows):
+            value = matrix[i, columns - 1]
+            for j in range(columns - 2, -1, -1):
+                value = value * scaler_value + matrix[i, j]
+            constants[i] = value
+
+        for k in range(len(x)):
+            value = constants[rows - 1]
+            for i in range(rows - 2, -1, -1):
+                value = value * x[k] + constants[i]
+            results[b, k] = value
+    return results
+
+
+def _falling_factors(length: int, order: int) -> ndarray:
+    # (m + 1)(m + 2)...(m + order) for m = 0, ..., length - 1
+    factors = ones(length, dtype=float64)
+    for j in range(1, order + 1):
+        factors *= arange(j, length + j, dtype=float64)
+    return factors
+
+
+def _expand(constants: ndarray, parity: Optional[int]) -> ndarray:
+    if parity is None:
+        return asarray(constants, dtype=float64)
+    dense = zeros((parity + 2 * len(constants) - 1,) + constants.shape[1:], dtype=float64)
+    dense[parity::2] = constants
+    return dense
+
+
+def _compress(dense: ndarray, parity: Optional[int]) -> ndarray:
+    return dense if parity is None else dense[parity::2]
+
+
+def _split_arrays(a: ndarray) -> Tuple[ndarray, ndarray]:
+    c = 134217729.0 * a
+    a_hi = c - (c - a)
+    return a_hi, a - a_hi
+
+
+def _two_product_arrays(a: ndarray, b: ndarray) -> Tuple[ndarray, ndarray]:
+    # Same as _two_product, elementwise
+    p = a * b
+    a_hi, a_lo = _split_arrays(a)
+    b_hi, b_lo = _split_arrays(b)
+    return p, ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+
+def _scale_double_double(hi: ndarray, lo: ndarray, factors: ndarray, divide: bool) -> Tuple[ndarray, ndarray]:
+    # Multiplies or divides hi + lo by the factors, the rounding error of hi goes into the low part
+    if divide:
+        q = hi / factors
+        p, e = _two_product_arrays(q, factors)
+        r = ((hi - p) - e + lo) / factors
+    else:
+        q, e = _two_product_arrays(hi, factors)
+        r = e + lo * factors
+    s = q + r
+    return s, r - (s - q)
+
+
+def _differentiate(constants: ndarray, parity: Optional[int], order: int,
+                   lo: Optional[ndarray] = None) -> Tuple[ndarray, Optional[int], Optional[ndarray]]:
+    # Rows are powers of x, every other axis is carried along
+    dense = _expand(constants, parity)
+    new_parity = None if parity is None else (parity - order) % 2
+    if len(dense) <= order:
+        zero = zeros((1,) + dense.shape[1:], dtype=float64)
+        return zero, new_parity, None if lo is None else zero.copy()
+    factors = _falling_factors(len(dense) - order, order).reshape((-1,) + (1,) * (dense.ndim - 1))
+    if lo is None:
+        return _compress(dense[order:] * factors, new_parity), new_parity, None
+
+    hi, lo = _scale_double_double(dense[order:], _expand(lo, parity)[order:], factors, divide=False)
+    return _compress(hi, new_parity), new_parity, _compress(lo, new_parity)
+
+
+def _integrate(constants: ndarray, parity: Optional[int], order: int,
+               lo: Optional[ndarray] = None) -> Tuple[ndarray, Optional[int], Optional[ndarray]]:
+    # Integration constants are zero
+    dense = _expand(constants, parity)
+    new_parity = None if parity is None else (parity + order) % 2
+    factors = _falling_factors(len(dense), order).reshape((-1,) + (1,) * (dense.ndim - 1))
+    integrated = zeros((len(dense) + order,) + dense.shape[1:], dtype=float64)
+    if lo is None:
+        integrated[order:] = dense / factors
+        return _compress(integrated, new_parity), new_parity, None
+
+    integrated_lo = zeros(integrated.shape, dtype=float64)
+    integrated[order:], integrated_lo[order:] = _scale_double_double(dense, _expand(lo, parity), factors, divide=True)
+    return _compress(integrated, new_parity), new_parity, _compress(integrated_lo, new_parity)
+
+
+def pade(constants: ndarray, m: int, k: int) -> Tuple[ndarray, ndarray]:
+    # Rows of constants are separate series c_0, c_1, ..., the approximants p / q with q_0 = 1 agree with them
+    # up to x^(m + k), where sum_j q_j c_(m + i - j) = 0 for i = 1, ..., k gives the denominator
+    constants = asarray(constants, dtype=float64)
+    if constants.shape[-1] < m + k + 1:
+        raise ValueError(f"Pade approximant [{m}/{k}] needs {m + k + 1} terms, got {constants.shape[-1]}")
+    c = concatenate([zeros(constants.shape[:-1] + (k,)), constants[..., :m + k + 1]], axis=-1)
+
+    # c[..., k + n] is c_n, with zeros for negative n
+    rows = arange(1, k + 1)[:, None]
+    columns = arange(1, k + 1)[None, :]
+    matrix = c[..., k + m + rows - columns]
+    try:
+        q = solve(matrix, -c[..., k + m + 1:k + m + k + 1, None])[..., 0]
+    except LinAlgError:
+        raise ValueError(f"Pade approximant [{m}/{k}] does not exist for these coefficients") from None
+    denominator = concatenate([ones(constants.shape[:-1] + (1,)), q], axis=-1)
+
+    numerator = zeros(constants.shape[:-1] + (m + 1,))
+    for j in range(min(m, k) + 1):
+        numerator[..., j:] += denominator[..., j, None] * c[..., k:k + m + 1 - j]
+    return numerator, denominator
+
+
+class RationalSeries:
+
+    def __init__(self, numerator: ndarray, denominator: ndarray):
+        self.numerator: ndarray = asarray(numerator, dtype=float64)
+        self.denominator: ndarray = asarray(denominator, dtype=float64)
+
+    def __str__(self) -> str:
+        return f"{self.numerator} / {self.denominator}"
+
+    def __eq__(self, series: RationalSeries) -> bool:
+        if isinstance(series, RationalSeries):
+            return (self.numerator.tolist() == series.numerator.tolist() and
+                    self.denominator.tolist() == series.denominator.tolist())
+        return NotImplemented
+
+    def evaluate(self, x: Union[float, ndarray], out: ndarray = None) -> Union[float, ndarray]:
+        if not isinstance(x, ndarray):
+            return evaluate_rational(x, self.numerator, self.denominator)
+
+        if out is None:
+            out = empty(x.shape, dtype=float64)
+        elif out.shape != x.shape:
+            raise ValueError(f"Output shape {out.shape} does not match input shape {x.shape}")
+        elif out.dtype != float64 or not out.flags.c_contiguous or not out.flags.writeable:
+            raise ValueError("Output array has to be float64, C-contiguous and writeable")
+        n_evaluate_rational_into(x.reshape(-1).astype(float64, copy=False), self.numerator, self.denominator,
+                                 out.reshape(-1))
+        return out
+
+
+def _same_lo(a: Optional[ndarray], b: Optional[ndarray]) -> bool:
+    if a is None or b is None:
+        return a is None and b is None
+    return a.tolist() == b.tolist()
 
 
 class Series:
 
-    def __init__(self, constants: ndarray):
+    def __init__(self, constants: ndarray, parity: Optional[int] = None, lo: Optional[ndarray] = None):
         self.constants: ndarray = constants
+        # With a parity the constants are those of x^parity, x^(parity + 2), ..., evaluated as x^parity p(x^2)
+        self.parity: Optional[int] = parity
+        # Low parts of double-double constants, evaluated with the double-double kernels when present
+        self.lo: Optional[ndarray] = lo
 
     def __str__(self) -> str:
         return str(self.constants)
 
     def __eq__(self, series: Series) -> bool:
         if isinstance(series, Series):
-            return self.constants.tolist() == series.constants.tolist()
+            return (self.parity == series.parity and self.constants.tolist() == series.constants.tolist() and
+                    _same_lo(self.lo, series.lo))
         return NotImplemented
 
-    def evaluate(self, x: Union[float, ndarray]) -> Union[float, ndarray]:
+    def _evaluate_double_double(self, x: Union[float, ndarray], out: ndarray = None) -> Union[float, ndarray]:
+        parity = -1 if self.parity is None else self.parity
+        if not isinstance(x, ndarray):
+            return n_evaluate_double_double_into(array([x], dtype=float64), self.constants, self.lo, parity,
+                                                 empty(1))[0]
+
+        if out is None:
+            out = empty(x.shape, dtype=float64)
+        elif out.shape != x.shape:
+            raise ValueError(f"Output shape {out.shape} does not match input shape {x.shape}")
+        elif out.dtype != float64 or not out.flags.c_contiguous or not out.flags.writeable:
+            raise ValueError("Output array has to be float64, C-contiguous and writeable")
+        n_evaluate_double_double_into(x.reshape(-1).astype(float64, copy=False), self.constants, self.lo, parity,
+                                      out.reshape(-1))
+        return out
+
+    def evaluate(self, x: Union[float, ndarray], out: ndarray = None, dtype=None) -> Union[float, ndarray]:
+        if self.lo is not None:
+            return self._evaluate_double_double(x, out=out)
+        if self.parity is None:
+            if isinstance(x, ndarray):
+                return n_evaluate_polynomial(x, self.constants, out=out, dtype=dtype)
+            return evaluate_polynomial(x, self.constants)
+
         if isinstance(x, ndarray):
-            return n_evaluate_polynomial(x, self.constants)
-        return evaluate_polynomial(x, self.constants)
+            result = n_evaluate_polynomial(x * x, self.constants, out=out, dtype=dtype)
+            if self.parity:
+                result *= x
+            return result
+        result = evaluate_polynomial(x * x, self.constants)
+        return result * x if self.parity else result
+
+    def derivative(self, order: int = 1) -> Series:
+        return Series(*_differentiate(self.constants, self.parity, order, lo=self.lo))
+
+    def to_pade(self, m: int, k: int) -> RationalSeries:
+        # Numerator of degree m and denominator of degree k from the first m + k + 1 terms
+        if self.lo is not None:
+            raise ValueError("to_pade is only available in double precision")
+        return RationalSeries(*pade(_expand(self.constants, self.parity), m, k))
+
+    def integral(self, order: int = 1) -> Series:
+        return Series(*_integrate(self.constants, self.parity, order, lo=self.lo))
+
+
+def horner_axis(constants: ndarray, axis: int, value: float) -> ndarray:
+    # Evaluates the polynomial along one axis for every entry of the others at once
+    constants = moveaxis(constants, axis, -1)
+    result = array(constants[..., -1], dtype=float64)
+    for j in range(constants.shape[-1] - 2, -1, -1):
+        result *= value
+        result += constants[..., j]
+    return result
+
+
+class ReduceCache:
+
+    def __init__(self, capacity: int = 128, max_bytes: Optional[int] = None, quantum: Optional[float] = None):
+        if capacity < 1:
+            raise ValueError(f"Cache capacity has to be positive, got {capacity}")
+        self.capacity: int = capacity
+        self.max_bytes: Optional[int] = max_bytes
+        # Scaler values are rounded to multiples of quantum, so nearby values share an entry
+        self.quantum: Optional[float] = quantum
+        self.entries: OrderedDict = OrderedDict()
+        self.bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def quantize(self, value: float) -> float:
+        if self.quantum is None:
+            return float(value)
+        return round(value / self.quantum) * self.quantum
+
+    def key(self, scaler_value: Union[float, Dict[str, float]]) -> Tuple[Hashable, Union[float, Dict[str, float]]]:
+        # The quantized values are also the ones the tensor is reduced at
+        if isinstance(scaler_value, dict):
+            scaler_value = {name: self.quantize(value) for name, value in scaler_value.items()}
+            return tuple(sorted(scaler_value.items())), scaler_value
+        scaler_value = self.quantize(scaler_value)
+        return scaler_value, scaler_value
+
+    def get(self, key: Hashable) -> Optional[Union[Series, Tensor]]:
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return result
+
+    @staticmethod
+    def size(result: Union[Series, Tensor]) -> int:
+        return result.constants.nbytes + (0 if result.lo is None else result.lo.nbytes)
+
+    def put(self, key: Hashable, result: Union[Series, Tensor]):
+        size = self.size(result)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        self.entries[key] = result
+        self.bytes += size
+        while len(self.entries) > self.capacity or (self.max_bytes is not None and self.bytes > self.max_bytes):
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= self.size(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self.entries), "bytes": self.bytes}
 
 
 class Tensor:
 
-    def __init__(self, constants: ndarray):
+    def __init__(self, constants: ndarray, names: Sequence[str] = None, parity: Optional[int] = None,
+                 lo: Optional[ndarray] = None):
         self.constants: ndarray = constants
+        # Scaler of every axis after the first, only needed when there is more than one
+        self.names: Optional[Tuple[str, ...]] = None if names is None else tuple(names)
+        # Same as for Series, the rows are then only the terms matching the parity
+        self.parity: Optional[int] = parity
+        # Same as for Series, reduce keeps the low parts when it is given a single value
+        self.lo: Optional[ndarray] = lo
+        self.cache: Optional[ReduceCache] = None
+
+    def enable_cache(self, capacity: int = 128, max_bytes: Optional[int] = None,
+                     quantum: Optional[float] = None) -> Tensor:
+        # Results are shared between calls and read-only, the constants must not change while the cache is on
+        self.cache = ReduceCache(capacity=capacity, max_bytes=max_bytes, quantum=quantum)
+        return self
+
+    def disable_cache(self) -> Tensor:
+        self.cache = None
+        return self
+
+    def cache_stats(self) -> Optional[Dict[str, int]]:
+        return None if self.cache is None else self.cache.stats()
 
     def __str__(self) -> str:
         return str(self.constants)
 
     def __eq__(self, tensor: Tensor) -> bool:
         if isinstance(tensor, Tensor):
-            return self.constants.tolist() == tensor.constants.tolist()
+            return (self.names == tensor.names and self.parity == tensor.parity and
+                    self.constants.tolist() == tensor.constants.tolist() and _same_lo(self.lo, tensor.lo))
         return NotImplemented
 
-    def reduce(self, scaler_value: float) -> Series:
-        return Series(evaluate_polynomials(scaler_value, self.constants))
+    def reduce(self, scaler_value: Union[float, Dict[str, float]]) -> Union[Series, Tensor]:
+        cache = self.cache
+        if cache is None:
+            return self._reduce(scaler_value)
+
+        key, scaler_value = cache.key(scaler_value)
+        result = cache.get(key)
+        if result is None:
+            result = self._reduce(scaler_value)
+            if may_share_memory(result.constants, self.constants):
+                # Nothing was reduced, freezing the result would freeze the constants of this tensor
+                result.constants = result.constants.copy()
+                if result.lo is not None:
+                    result.lo = result.lo.copy()
+            result.constants.flags.writeable = False
+            if result.lo is not None:
+                result.lo.flags.writeable = False
+            cache.put(key, result)
+        return result
+
+    def _reduce(self, scaler_value: Union[float, Dict[str, float]]) -> Union[Series, Tensor]:
+        if isinstance(scaler_value, dict):
+            return self._reduce_named(scaler_value)
+        if self.constants.ndim != 2:
+            raise ValueError(f"Tensor has scalers {self.names}, reduce it with a dictionary of values")
+        if self.lo is not None:
+            hi, lo = evaluate_polynomials_double_double(float(scaler_value), self.constants, self.lo)
+            return Series(hi, parity=self.parity, lo=lo)
+        return Series(evaluate_polynomials(scaler_value, self.constants), parity=self.parity)
+
+    def _check_double(self, operation: str):
+        if self.lo is not None:
+            raise ValueError(f"{operation} is only available in double precision, reduce at a single value instead")
+
+    def _check_single_scaler(self, operation: str):
+        if self.constants.ndim != 2:
+            raise ValueError(f"{operation} needs a single scaler, reduce the tensor with scalers {self.names} first")
+
+    def _reduce_named(self, scaler_values: Dict[str, float]) -> Union[Series, Tensor]:
+        self._check_double("Reducing by name")
+        names = self.names
+        if names is None:
+            raise ValueError("Tensor scalers have no names")
+        for name in scaler_values:
+            if name not in names:
+                raise ValueError(f"Unknown scaler {name}, expected one of {names}")
+
+        constants = self.constants
+        remaining = []
+        # Reduce from the last axis so the axis of every remaining scaler stays the same
+        for axis in range(len(names), 0, -1):
+            name = names[axis - 1]
+            if name in scaler_values:
+                constants = horner_axis(constants, axis, scaler_values[name])
+            else:
+                remaining.insert(0, name)
+
+        if not remaining:
+            return Series(constants, parity=self.parity)
+        return Tensor(constants, names=remaining, parity=self.parity)
+
+    def reduce_many(self, scaler_values: ndarray) -> ndarray:
+        # One row of coefficients of x per scaler value, with the known zero terms of a parity filled in
+        self._check_double("reduce_many")
+        self._check_single_scaler("reduce_many")
+        scaler_values = asarray(scaler_values, dtype=float64)
+        rows = evaluate_polynomials_many(scaler_values, asarray(self.constants, dtype=float64))
+        if self.parity is None:
+            return rows
+        return _expand(rows.T, self.parity).T.copy()
+
+    def evaluate_grid(self, scaler_values: ndarray, x: ndarray) -> ndarray:
+        self._check_double("evaluate_grid")
+        self._check_single_scaler("evaluate_grid")
+        scaler_values = asarray(scaler_values, dtype=float64)
+        x = asarray(x, dtype=float64)
+        if self.parity is None:
+            return evaluate_grid(scaler_values, x, asarray(self.constants, dtype=float64))
+
+        results = evaluate_grid(scaler_values, x * x, asarray(self.constants, dtype=float64))
+        if self.parity:
+            results *= x
+        return results
 
     def flatten(self) -> Series:
         for c in self.constants:
             if len(c) != 1:
                 raise ValueError(f"Cannot flatten {self}")
-        return Series(evaluate_polynomials(1, self.constants))
+        return Series(evaluate_polynomials(1, self.constants), parity=self.parity,
+                      lo=None if self.lo is None else self.lo[:, 0].copy())
+
+    def to_pade(self, scaler_values: Union[float, ndarray], m: int, k: int) -> Union[RationalSeries,
+                                                                                      List[RationalSeries]]:
+        # One approximant for each scaler value, the linear systems for all of them are solved together
+        self._check_double("to_pade")
+        self._check_single_scaler("to_pade")
+        if not isinstance(scaler_values, ndarray):
+            return self.reduce(scaler_values).to_pade(m, k)
+
+        numerators, denominators = pade(self.reduce_many(scaler_values), m, k)
+        return [RationalSeries(numerator, denominator) for numerator, denominator in zip(numerators, denominators)]
+
+    def derivative(self, order: int = 1) -> Tensor:
+        constants, parity, lo = _differentiate(self.constants, self.parity, order, lo=self.lo)
+        return Tensor(constants, names=self.names, parity=parity, lo=lo)
+
+    def integral(self, order: int = 1) -> Tensor:
+        constants, parity, lo = _integrate(self.constants, self.parity, order, lo=self.lo)
+        return Tensor(constants, names=self.names, parity=parity, lo=lo)
 
 
-# Force warmup numba functions to have them compile before use
-evaluate_polynomial(0, array([0]))
-n_evaluate_polynomial(array([0]), array([0]))
-evaluate_polynomials(0, array([[0], [0]]))
+def warmup():
+    # Kernels compile on first use and are cached on disk, this pays for it up front for the common signatures
+    evaluate_polynomial(0.0, array([0.0]))
+    evaluate_polynomial(0, array([0]))
+    n_evaluate_polynomial(array([0.0]), array([0.0]))
+    n_evaluate_polynomial(array([0.0]), array([0.0]), dtype=float32)
+    evaluate_polynomials(0, array([[0], [0]]))
+    evaluate_polynomials(0.0, array([[0.0], [0.0]]))
+    evaluate_polynomials_many(array([0.0]), array([[0.0], [0.0]]))
+    evaluate_grid(array([0.0]), array([0.0]), array([[0.0], [0.0]]))
+    evaluate_rational(0.0, array([0.0]), array([1.0]))
+    n_evaluate_rational_into(array([0.0]), array([0.0]), array([1.0]), empty(1))
+    n_evaluate_double_double_into(array([0.0]), array([0.0]), array([0.0]), -1, empty(1))
+    evaluate_polynomials_double_double(0.0, array([[0.0]]), array([[0.0]]))
@@ -0,0 +1,199 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple, Union
+import json
+import struct
+
+from numpy import ndarray, array, asarray, empty, memmap, fromfile, frombuffer, cumsum, int64, uint8, float64
+from numpy import dtype as as_dtype
+from numpy.lib.format import write_array_header_1_0, header_data_from_array_1_0
+
+from .backends import from_config
+from .chebyshev import ChebyshevTable
+from .iterative_constants import IterativeConstant, ScalerHolder
+from .series import Series, Tensor
+
+
+MAGIC = b"RMATHBIN"
+VERSION = 1
+
+# Every block starts on a 64 byte boundary, the .npy header keeps the data aligned as well
+ALIGNMENT = 64
+
+# Magic, version, index offset and index length, padded to ALIGNMENT
+_PRELUDE = struct.Struct("<8sIQQ")
+
+Storable = Union[IterativeConstant, Tensor, Series, ChebyshevTable]
+
+
+def _encode_integers(values: List[int]) -> Tuple[ndarray, ndarray]:
+    encoded = [value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True) for value in values]
+    lengths = array([len(value) for value in encoded], dtype=int64)
+    return lengths, frombuffer(b"".join(encoded), dtype=uint8)
+
+
+def _decode_integers(lengths: ndarray, blob: ndarray) -> List[int]:
+    data = blob.tobytes()
+    ends = cumsum(lengths).tolist()
+    starts = [0] + ends[:-1]
+    return [int.from_bytes(data[start:end], "little", signed=True) for start, end in zip(starts, ends)]
+
+
+class _Writer:
+
+    def __init__(self, file):
+        self.file = file
+        self.blocks: Dict[str, dict] = {}
+        file.write(b"\x00" * ALIGNMENT)
+
+    def _align(self):
+        position = self.file.tell()
+        self.file.write(b"\x00" * (-position % ALIGNMENT))
+
+    def add(self, name: str, values: ndarray):
+        values = asarray(values, order="C")
+        self._align()
+        npy_offset = self.file.tell()
+        write_array_header_1_0(self.file, header_data_from_array_1_0(values))
+        self.blocks[name] = {
+            "dtype": values.dtype.str,
+            "shape": list(values.shape),
+            "offset": self.file.tell(),
+            "npy_offset": npy_offset,
+        }
+        self.file.write(values.tobytes())
+
+    def close(self, header: dict):
+        self._align()
+        header = dict(header, blocks=self.blocks)
+        index = json.dumps(header).encode()
+        index_offset = self.file.tell()
+        self.file.write(index)
+        self.file.seek(0)
+        self.file.write(_PRELUDE.pack(MAGIC, VERSION, index_offset, len(index)))
+
+
+def _read_header(path: str) -> dict:
+    with open(path, "rb") as file:
+        prelude = file.read(_PRELUDE.size)
+        if len(prelude) < _PRELUDE.size:
+            raise ValueError(f"{path} is not a recursive-math file")
+        magic, version, index_offset, index_length = _PRELUDE.unpack(prelude)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a recursive-math file")
+        if version > VERSION:
+            raise ValueError(f"{path} has format version {version}, only up to {VERSION} is supported")
+        file.seek(index_offset)
+        return json.loads(file.read(index_length))
+
+
+def _read_block(path: str, block: dict, mmap: bool) -> ndarray:
+    dtype = as_dtype(block["dtype"])
+    shape = tuple(block["shape"])
+    count = 1
+    for size in shape:
+        count *= size
+
+    if count == 0:
+        return empty(shape, dtype=dtype)
+    if mmap:
+        # A plain read-only view of the mapping, the page cache is shared between processes
+        return asarray(memmap(path, dtype=dtype, mode="r", offset=block["offset"], shape=shape))
+    return fromfile(path, dtype=dtype, count=count, offset=block["offset"]).reshape(shape)
+
+
+def _check_holders(value: IterativeConstant) -> List[ScalerHolder]:
+    # Every holder is encoded with the backend and stored under the name of the first one
+    holders = value.holders
+    if not holders:
+        raise ValueError(f"Cannot save {value.name}, it has no holders")
+    first = holders[0]
+    for holder in holders:
+        if not isinstance(holder, ScalerHolder):
+            raise TypeError(f"Cannot save {type(holder).__name__} coefficients")
+        if holder.backend != first.backend:
+            raise ValueError(f"Holders of {value.name} use both {first.backend} and {holder.backend}")
+        if holder.name != first.name:
+            raise ValueError(f"Holders of {value.name} are in terms of both {first.name} and {holder.name}")
+    return holders
+
+
+def save(value: Storable, path: str, freeze: bool = True):
+    if isinstance(value, IterativeConstant):
+        holders = _check_holders(value)
+    elif not isinstance(value, (Series, Tensor, ChebyshevTable)):
+        raise TypeError(f"Cannot save {type(value).__name__}")
+
+    with open(path, "wb") as file:
+        writer = _Writer(file)
+
+        if isinstance(value, (Series, Tensor)):
+            writer.add("frozen", asarray(value.constants, dtype=float64))
+            if value.lo is not None:
+                # The low parts of double-double coefficients
+                writer.add("frozen_lo", asarray(value.lo, dtype=float64))
+            if isinstance(value, Series):
+                writer.close({"kind": "series", "parity": value.parity})
+            else:
+                writer.close({"kind": "tensor", "names": value.names, "parity": value.parity})
+            return
+        if isinstance(value, ChebyshevTable):
+            writer.add("coefficients", value.coefficients)
+            writer.close({"kind": "chebyshev", "b_interval": value.b_interval, "x_interval": value.x_interval})
+            return
+
+        backend = holders[0].backend
+        integers = []
+        for holder in holders:
+            for constant in holder.constants:
+                integers.extend(backend.to_exact(constant))
+        lengths, blob = _encode_integers(integers)
+
+        writer.add("holder_lengths", array([len(holder) for holder in holders], dtype=int64))
+        writer.add("integer_lengths", lengths)
+        writer.add("integers", blob)
+        if freeze:
+            writer.add("frozen", value.freeze().constants.astype(float64))
+        writer.close({
+            "kind": "iterative_constant",
+            "name": value.name,
+            "holder_name": holders[0].name,
+            "backend": backend.config(),
+            "parity": value.parity,
+        })
+
+
+def load(path: str, mmap: bool = True) -> Storable:
+    header = _read_header(path)
+    blocks = header["blocks"]
+    if header["kind"] == "chebyshev":
+        return ChebyshevTable(_read_block(path, blocks["coefficients"], mmap), header["b_interval"],
+                              header["x_interval"])
+    if header["kind"] != "iterative_constant":
+        return load_frozen(path, mmap=mmap)
+
+    backend = from_config(header["backend"])
+    holder_lengths = _read_block(path, blocks["holder_lengths"], mmap).tolist()
+    integers = _decode_integers(_read_block(path, blocks["integer_lengths"], mmap),
+                                _read_block(path, blocks["integers"], mmap))
+
+    holders = []
+    position = 0
+    for length in holder_lengths:
+        pairs = integers[position:position + 2 * length]
+        constants = [backend.from_exact(a, b) for a, b in zip(pairs[::2], pairs[1::2])]
+        holders.append(ScalerHolder._from_native(constants, name=header["holder_name"], backend=backend))
+        position += 2 * length
+    return IterativeConstant(initial_holders=holders, name=header["name"], parity=header.get("parity"))
+
+
+def load_frozen(path: str, mmap: bool = True) -> Union[Tensor, Series]:
+    header = _read_header(path)
+    if "frozen" not in header["blocks"]:
+        raise ValueError(f"{path} was saved without frozen coefficients")
+
+    blocks = header["blocks"]
+    constants = _read_block(path, blocks["frozen"], mmap)
+    lo = _read_block(path, blocks["frozen_lo"], mmap) if "frozen_lo" in blocks else None
+    if header["kind"] == "series":
+        return Series(constants, parity=header.get("parity"), lo=lo)
+    return Tensor(constants, names=header.get("names"), parity=header.get("parity"), lo=lo)
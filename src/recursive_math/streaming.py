@@ -0,0 +1,69 @@
+from __future__ import annotations
+from typing import List, Tuple, Union
+
+from numpy import ndarray, asarray, atleast_1d, zeros_like, float64, inf, abs as np_abs
+
+from .iterative_constants import ScalerHolder
+
+
+class Term:
+
+    def __init__(self, index: int, holder: ScalerHolder):
+        # A coefficient as soon as it is generated, exactly and in float64
+        self.index: int = index
+        self.holder: ScalerHolder = holder
+        self.floats: ndarray = holder.backend.to_floats(holder.constants)
+
+    def __repr__(self) -> str:
+        return f"Term({self.index}, {self.holder})"
+
+
+class ConvergenceMonitor:
+
+    def __init__(self, x: Union[float, ndarray], scalers: Union[float, ndarray], rel_tol: float = 1e-15,
+                 abs_tol: float = 0.0, window: int = 4):
+        # x and scalers are sample points of the region the series has to be accurate in
+        self.x: ndarray = atleast_1d(asarray(x, dtype=float64))
+        self.scalers: ndarray = atleast_1d(asarray(scalers, dtype=float64))
+        self.radius: float = float(np_abs(self.x).max())
+        self.rel_tol: float = rel_tol
+        self.abs_tol: float = abs_tol
+        self.window: int = window
+
+        self.sums: ndarray = zeros_like(self.scalers[:, None] * self.x[None, :])
+        self.length: int = 0
+        self.tail: float = inf
+        self._magnitudes: List[Tuple[int, float]] = []
+
+    def update(self, term: Term) -> bool:
+        values = zeros_like(self.scalers)
+        for constant in term.floats[::-1]:
+            values *= self.scalers
+            values += constant
+        self.sums += values[:, None] * self.x[None, :] ** term.index
+
+        # Zero terms, from parity or a vanishing coefficient, say nothing about the decay
+        magnitude = float(np_abs(values).max()) * self.radius ** term.index
+        if magnitude > 0:
+            self._magnitudes = (self._magnitudes + [(term.index, magnitude)])[-self.window - 1:]
+        self.length = term.index + 1
+        self.tail = self.estimate()
+        return self.converged
+
+    def estimate(self) -> float:
+        # The last terms are fitted by a geometric decay, the largest ratio of the window bounds the rest
+        if self.radius == 0 and self.length > 0:
+            return 0.0
+        magnitudes = self._magnitudes
+        if len(magnitudes) <= self.window:
+            return inf
+
+        ratio = max((b / a) ** (1 / (j - i)) for (i, a), (j, b) in zip(magnitudes, magnitudes[1:]))
+        if ratio >= 1:
+            return inf
+        index, magnitude = magnitudes[-1]
+        return magnitude * ratio ** (self.length - index) / (1 - ratio)
+
+    @property
+    def converged(self) -> bool:
+        return self.tail <= max(self.abs_tol, self.rel_tol * float(np_abs(self.sums).max()))
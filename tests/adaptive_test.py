@@ -0,0 +1,48 @@
+import unittest
+from fractions import Fraction
+
+from src.recursive_math import (IterativeConstant, ScalerHolder, BallBackend, Ball, FractionBackend, DecimalBackend,
+                                generate_adaptive, is_accurate)
+from src.recursive_math.examples import readme_solver
+
+
+class AdaptiveTest(unittest.TestCase):
+
+    def test_float64_bounds(self):
+        a_n = generate_adaptive(lambda backend: readme_solver(20, backend))
+        exact = readme_solver(20, FractionBackend())
+
+        self.assertTrue(is_accurate(a_n))
+        for ball_holder, holder in zip(a_n.holders, exact.holders):
+            norm = max(abs(value) for value in holder.constants)
+            for ball, value in zip(ball_holder.constants, holder.constants):
+                error = abs(Fraction(ball.mid, ball_holder.backend.one) - value)
+                self.assertLessEqual(error, norm * Fraction(2.0 ** -53))
+
+    def test_escalation(self):
+        used = []
+
+        def build(backend: BallBackend) -> IterativeConstant:
+            used.append(backend.bits)
+            return readme_solver(10, backend)
+
+        generate_adaptive(build, bits=16, rel_tol=2.0 ** -70)
+        self.assertEqual(used, [16, 32, 64, 128])
+
+        with self.assertRaises(ValueError):
+            generate_adaptive(build, bits=16, max_bits=32, rel_tol=2.0 ** -70)
+
+    def test_zero_midpoints(self):
+        backend = BallBackend(bits=64)
+        holders = [ScalerHolder._from_native([Ball(0, rad)], name="B", backend=backend) for rad in [1, 2 ** 40]]
+
+        self.assertTrue(is_accurate(IterativeConstant(initial_holders=holders[:1], name="a")))
+        self.assertFalse(is_accurate(IterativeConstant(initial_holders=holders, name="a")))
+
+    def test_needs_ball_backend(self):
+        with self.assertRaises(TypeError):
+            is_accurate(readme_solver(4, DecimalBackend()))
+
+
+if __name__ == '__main__':
+    unittest.main()
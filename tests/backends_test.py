@@ -0,0 +1,135 @@
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+from random import Random
+
+from src.recursive_math import (IterativeConstant, ScalerHolder, MultiScalerHolder, Sin, DecimalBackend,
+                                FractionBackend, FixedPointBackend, BallBackend)
+from src.recursive_math.examples import readme_solver
+
+
+def contains(backend: BallBackend, ball, value: Fraction) -> bool:
+    return abs(Fraction(ball.mid, backend.one) - value) <= backend.radius(ball)
+
+
+class BackendsTest(unittest.TestCase):
+
+    def test_default_backend(self):
+        a0 = ScalerHolder(initial_constants=[1, 2], name="Bo")
+
+        self.assertEqual(a0.backend, DecimalBackend())
+        self.assertIsInstance(a0.get(1), Decimal)
+
+    def test_fraction_exact(self):
+        backend = FractionBackend()
+        a0 = ScalerHolder(initial_constants=[1, 2], name="Bo", backend=backend)
+
+        a0 = a0.scale(Fraction(1, 3)).multiply(a0)
+
+        self.assertEqual(a0.constants[:3], [Fraction(1, 3), Fraction(4, 3), Fraction(4, 3)])
+
+    def test_fixed_point_scale(self):
+        backend = FixedPointBackend(bits=64)
+        a0 = ScalerHolder(initial_constants=[1, Fraction(1, 4)], name="Bo", backend=backend)
+
+        a0 = a0.scale(6)
+
+        self.assertEqual(a0.freeze().constants.tolist(), [6.0, 1.5])
+
+    def test_fixed_point_copy(self):
+        backend = FixedPointBackend(bits=64)
+        a0 = ScalerHolder(initial_constants=[3], name="Bo", backend=backend)
+
+        a0 = a0.copy()[:1]
+
+        self.assertEqual(a0.freeze().constants.tolist(), [3.0])
+
+    def test_backends_agree(self):
+        results = []
+        for backend in [DecimalBackend(), FractionBackend(), FixedPointBackend(bits=128)]:
+            a = ScalerHolder(initial_constants=[1, -2, 3], name="Bo", backend=backend)
+            a_n = IterativeConstant(initial_holders=[a, a.scale(Fraction(1, 7)), a], name="a")
+            a0 = a_n.poly_scale(Fraction(1, 2)).conv(a_n, i=0, n=2, n_index=2)
+            results.append(a0.freeze().constants.tolist())
+
+        for result in results[1:]:
+            for value, expected in zip(result, results[0]):
+                self.assertAlmostEqual(value, expected, places=12)
+
+    def test_mismatched_backends(self):
+        a0 = ScalerHolder(initial_constants=[1], name="Bo", backend=FractionBackend())
+        a1 = ScalerHolder(initial_constants=[1], name="Bo", backend=FixedPointBackend())
+
+        with self.assertRaises(TypeError):
+            a0.add(a1)
+
+    def test_sin_fraction(self):
+        f_n = Sin(name="f", holder_name="Bo", backend=FractionBackend())
+        for _ in range(7):
+            f_n.next_term()
+
+        self.assertEqual(f_n.get(7).get(0), Fraction(-1, 5040))
+
+    def test_decimal_precision(self):
+        backend = DecimalBackend(precision=10)
+        a0 = ScalerHolder(initial_constants=[Fraction(1, 3)], name="Bo", backend=backend)
+
+        a0 = a0.multiply(a0)
+
+        self.assertEqual(a0.get(0), Decimal("0.1111111111"))
+        self.assertEqual(repr(backend), "DecimalBackend(precision=10)")
+        self.assertNotEqual(backend, DecimalBackend())
+        self.assertEqual(backend.epsilon(), Decimal("1e-10"))
+
+        # Additions round to the backend precision as well, not to the global one
+        a1 = a0.add(ScalerHolder(initial_constants=[Decimal("1e-20")], name="Bo", backend=backend))
+        self.assertEqual(a1.get(0), Decimal("0.1111111111"))
+
+        backend = DecimalBackend(precision=20)
+        a_n = readme_solver(12, backend)
+        for i in range(len(a_n)):
+            for constant in a_n.get(i).constants:
+                self.assertLessEqual(len(constant.as_tuple().digits), 20)
+
+    def test_decimal_precision_products(self):
+        # The sums inside a product round to the backend precision too
+        backend = DecimalBackend(precision=10)
+        a0 = ScalerHolder(initial_constants=[1, 1], name="Bo", backend=backend)
+        a1 = ScalerHolder(initial_constants=[Decimal("1e10"), Decimal("1e-10")], name="Bo", backend=backend)
+        self.assertEqual(a0.multiply(a1).get(1), Decimal("1.000000000e10"))
+
+        b0 = MultiScalerHolder(initial_terms={(0, 0): 1, (1, 0): 1}, names=("B", "C"), backend=backend)
+        b1 = MultiScalerHolder(initial_terms={(0, 0): Decimal("1e-10"), (1, 0): Decimal("1e10")}, names=("B", "C"),
+                               backend=backend)
+        self.assertEqual(b0.multiply(b1).get((1, 0)), Decimal("1.000000000e10"))
+
+    def test_ball_enclosure(self):
+        backend = BallBackend(bits=16)
+        random = Random(0)
+        for _ in range(50):
+            x = Fraction(random.randint(-999, 999), random.randint(1, 999))
+            y = Fraction(random.randint(-999, 999), random.randint(1, 999)) or Fraction(1)
+            a, b = backend.convert(x), backend.convert(y)
+
+            self.assertTrue(contains(backend, a, x))
+            self.assertTrue(contains(backend, backend.multiply(a, b), x * y))
+            self.assertTrue(contains(backend, backend.divide(a, b), x / y))
+            self.assertTrue(contains(backend, a - b * 3, x - y * 3))
+
+    def test_ball_polynomials(self):
+        backend = BallBackend(bits=8)
+        random = Random(1)
+        a = [Fraction(random.randint(-99, 99), random.randint(1, 99)) for _ in range(20)]
+        b = [Fraction(random.randint(-99, 99), random.randint(1, 99)) for _ in range(12)]
+
+        products = backend.multiply_polynomials([backend.convert(x) for x in a], [backend.convert(y) for y in b])
+
+        exact = FractionBackend().multiply_polynomials(a, b)
+        for ball, value in zip(products, exact):
+            self.assertTrue(contains(backend, ball, value))
+        self.assertEqual(backend.multiply(backend.convert(2), backend.convert(3)).rad, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import unittest
+from math import isnan
+from tempfile import TemporaryDirectory
+
+from numpy import array, linspace, meshgrid, abs as np_abs
+from numpy.random import default_rng
+
+from src.recursive_math import ChebyshevTable, DecimalBackend, Tensor, save, load
+from src.recursive_math.examples import readme_solver
+
+
+class ChebyshevTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tensor = readme_solver(30, DecimalBackend()).freeze()
+
+    def test_accuracy(self):
+        table = ChebyshevTable.from_tensor(self.tensor, (-1, 1), (-0.5, 0.5), tolerance=1e-10)
+
+        rng = default_rng(0)
+        b, x = rng.uniform(-1, 1, 200), rng.uniform(-0.5, 0.5, 200)
+        expected = array([self.tensor.reduce(b_i).evaluate(x_i) for b_i, x_i in zip(b, x)])
+        self.assertLess(np_abs(table.evaluate(b, x) - expected).max(), 1e-10)
+        self.assertAlmostEqual(table.evaluate(1.0, 0.5), self.tensor.reduce(1.0).evaluate(0.5), places=10)
+
+    def test_grid(self):
+        # Broadcasting the queries matches evaluate_grid
+        table = ChebyshevTable.from_tensor(self.tensor, (0, 2), (-0.5, 0.5), tolerance=1e-8)
+        b, x = linspace(0, 2, 5), linspace(-0.5, 0.5, 7)
+        grid = self.tensor.evaluate_grid(b, x)
+        self.assertLess(np_abs(table.evaluate(*meshgrid(b, x, indexing="ij")) - grid).max(), 1e-8)
+
+    def test_outside(self):
+        table = ChebyshevTable.fit(self.tensor, (-1, 1), (-0.5, 0.5), cells=(2, 2))
+        self.assertEqual(table.cells, (2, 2))
+        self.assertTrue(isnan(table.evaluate(1.5, 0.0)))
+        self.assertTrue(isnan(table.evaluate(0.0, -0.6)))
+        self.assertFalse(isnan(table.evaluate(1.0, 0.5)))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            ChebyshevTable.from_tensor(self.tensor, (-1, 1), (-0.5, 0.5), tolerance=1e-30, max_cells=4)
+        with self.assertRaises(ValueError):
+            ChebyshevTable.from_tensor(Tensor(array([[[1.0]]]), names=["B", "C"]), (0, 1), (0, 1))
+
+    def test_save(self):
+        table = ChebyshevTable.from_tensor(self.tensor, (-1, 1), (-0.5, 0.5), tolerance=1e-8)
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.rm")
+            save(table, path)
+            loaded = load(path, mmap=False)
+
+        self.assertEqual(loaded.b_interval, table.b_interval)
+        self.assertEqual(loaded.coefficients.tolist(), table.coefficients.tolist())
+        self.assertEqual(loaded.evaluate(0.3, 0.1), table.evaluate(0.3, 0.1))
+
+
+if __name__ == '__main__':
+    unittest.main()
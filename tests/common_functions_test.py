@@ -1,8 +1,10 @@
 import unittest
 from decimal import Decimal
-from math import pi
+from fractions import Fraction
+from math import pi, exp, sinh, cosh, log1p, sqrt
 
-from src.recursive_math import Sin, Cos, ScalerHolder
+from src.recursive_math import (Sin, Cos, Exp, Sinh, Cosh, Log1p, Binomial, FunctionSource, ScalerHolder,
+                                FractionBackend)
 
 
 class CommonFunctionsTests(unittest.TestCase):
@@ -71,6 +73,72 @@ class CommonFunctionsTests(unittest.TestCase):
 
         self.assertEqual(round(a0, 15), -1)
 
+    def test_sin_generate(self):
+        f_n = Sin(name="f", holder_name="Bo")
+        g_n = Sin(name="f", holder_name="Bo")
+        for _ in range(12):
+            f_n = f_n.next_term()
+
+        g_n = g_n.generate(13)
+
+        self.assertEqual(len(g_n), 13)
+        self.assertEqual(f_n, g_n)
+
+    def test_next_term_ownership(self):
+        f_n = Exp(name="f", holder_name="Bo", backend=FractionBackend())
+        g_n = f_n.next_term()
+        self.assertEqual((len(f_n), len(g_n)), (2, 2))
+
+        h_n = g_n.generate(5)
+        f_n.next_term()
+        e_n = g_n.append(ScalerHolder(initial_constants=[7], name="Bo", backend=FractionBackend()))
+
+        self.assertEqual((len(f_n), len(g_n), len(h_n), len(e_n)), (3, 5, 5, 6))
+        self.assertEqual(h_n.get(4).get(0), Fraction(1, 24))
+        self.assertEqual(e_n.get(5).get(0), 7)
+        self.assertEqual(f_n, Exp(name="f", holder_name="Bo", backend=FractionBackend()).generate(3))
+
+    def test_exp(self):
+        f_n = Exp(name="f", holder_name="Bo", backend=FractionBackend())
+        f_n = f_n.generate(10)
+
+        self.assertEqual(f_n.get(9).get(0), Fraction(1, 362880))
+
+    def test_float_coefficients(self):
+        x = 0.3
+        for source, expected in [(Exp, exp(x)), (Sinh, sinh(x)), (Cosh, cosh(x)), (Log1p, log1p(x))]:
+            f_n = source(name="f", holder_name="Bo")
+            constants = f_n.float_coefficients(60)
+
+            value = sum(c * x ** n for n, c in enumerate(constants))
+            self.assertAlmostEqual(value, expected, places=14)
+
+    def test_binomial(self):
+        f_n = Binomial(Fraction(1, 2), name="f", holder_name="Bo")
+
+        constants = f_n.coefficients(4)
+
+        self.assertEqual(constants, [1, Fraction(1, 2), Fraction(-1, 8), Fraction(1, 16)])
+        value = sum(float(c) * 0.2 ** n for n, c in enumerate(f_n.coefficients(40)))
+        self.assertAlmostEqual(value, sqrt(1.2), places=14)
+
+    def test_function_source(self):
+        f_n = FunctionSource(lambda n: Fraction(1, n + 1), name="f", holder_name="Bo", max_n=3)
+        f_n = f_n.generate(6)
+
+        a2 = ScalerHolder(initial_constants=[Decimal(1) / Decimal(3)], name="Bo")
+        self.assertEqual(f_n.get(2), a2)
+        self.assertEqual(f_n.get(5), ScalerHolder(initial_constants=[0], name="Bo"))
+
+    def test_sin_parity(self):
+        f_n = Sin(name="f", holder_name="Bo").generate(10)
+
+        self.assertEqual(f_n.parity, 1)
+        self.assertIs(f_n.get(2), f_n.get(4))
+        self.assertEqual(f_n.freeze().constants.shape, (5, 1))
+        self.assertEqual(Cos(name="g", holder_name="Bo").parity, 0)
+        self.assertIsNone(Exp(name="e", holder_name="Bo").parity)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from fractions import Fraction
+from random import Random
+
+from src.recursive_math import IterativeConstant, ScalerHolder, Convolution, FractionBackend
+from src.recursive_math.convolution import multiply_series
+from src.recursive_math.examples import readme_loop
+
+
+def random_holders(random: Random, count: int):
+    holders = []
+    for _ in range(count):
+        constants = [Fraction(random.randint(-9, 9), random.randint(1, 9)) for _ in range(random.randint(1, 4))]
+        holders.append(ScalerHolder(initial_constants=constants, name="Bo", backend=FractionBackend()))
+    return holders
+
+
+class ConvolutionTest(unittest.TestCase):
+
+    def test_matches_conv(self):
+        random = Random(0)
+        a_n = IterativeConstant(initial_holders=random_holders(random, 20), name="a")
+        b_n = IterativeConstant(initial_holders=random_holders(random, 20), name="b")
+
+        for i, j in [(0, 0), (1, 0), (2, 3)]:
+            for block_size in [1, 4]:
+                d_n = Convolution(a_n, b_n, i=i, j=j, block_size=block_size)
+                for n in range(i + j, 20):
+                    a0 = d_n.get(n)
+                    a2 = a_n.conv(b_n, i=i, n=n - j, n_index=n)
+                    self.assertEqual(a0.constants, a2.constants)
+
+    def test_block_size(self):
+        a = ScalerHolder(initial_constants=[1], name="Bo")
+        a_n = IterativeConstant(initial_holders=[a], name="a")
+
+        with self.assertRaises(ValueError):
+            Convolution(a_n, a_n, block_size=3)
+
+    def test_below_lower_bounds(self):
+        a = ScalerHolder(initial_constants=[1], name="Bo")
+        a_n = IterativeConstant(initial_holders=[a, a], name="a")
+
+        a0 = Convolution(a_n, a_n, i=1, j=1).get(1)
+
+        a2 = ScalerHolder(initial_constants=[0], name="Bo")
+        self.assertEqual(a0, a2)
+
+    def test_multiply_series(self):
+        random = Random(1)
+        a = random_holders(random, 6)
+        b = random_holders(random, 5)
+
+        products = multiply_series(a, b)
+
+        for n in range(len(products)):
+            expected = ScalerHolder(initial_constants=[0], name="Bo", backend=FractionBackend())
+            for i in range(max(0, n - len(b) + 1), min(n, len(a) - 1) + 1):
+                expected = expected.add(a[i].multiply(b[n - i]))
+            self.assertEqual(products[n], expected.constants)
+
+    def test_recurrence(self):
+        a0 = readme_loop(24, FractionBackend(), block_size=4)
+        a2 = readme_loop(24, FractionBackend())
+
+        for h0, h2 in zip(a0.holders, a2.holders):
+            self.assertEqual(h0.constants, h2.constants)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import json
+import unittest
+
+from src.recursive_math import IterativeConstant, ScalerHolder, Profiler, Convolution, FractionBackend
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def test_disabled_is_untouched(self):
+        add = ScalerHolder.__dict__["add"]
+        with Profiler():
+            self.assertIsNot(add, ScalerHolder.__dict__["add"])
+        self.assertIs(add, ScalerHolder.__dict__["add"])
+
+    def test_records(self):
+        a = ScalerHolder(initial_constants=[1, 2, 3], name="Bo")
+        a0 = IterativeConstant(initial_holders=[a, a, a], name="a")
+
+        with Profiler() as profiler:
+            a0.conv(a0, i=0, n=2, n_index=2)
+        a.multiply(a)
+
+        report = profiler.report()
+        self.assertEqual(1, report["IterativeConstant.conv"]["count"])
+        self.assertEqual(3, report["IterativeConstant.conv"]["max_holders"])
+        self.assertEqual(3, report["ScalerHolder.multiply"]["count"])
+        self.assertEqual(4, report["ScalerHolder.multiply"]["max_degree"])
+        self.assertEqual(2, report["ScalerHolder.multiply"]["max_digits"])
+        self.assertEqual(report, json.loads(profiler.to_json()))
+        self.assertIn("ScalerHolder.add", profiler.summary())
+
+    def test_convolution(self):
+        a = ScalerHolder(initial_constants=[1, 2], name="Bo", backend=FractionBackend())
+        a0 = IterativeConstant(initial_holders=[a, a, a], name="a")
+
+        with Profiler(digits=False) as profiler:
+            c = Convolution(a0, a0)
+            for n in range(3):
+                c.get(n)
+
+        report = profiler.report()
+        self.assertEqual(3, report["Convolution.get"]["count"])
+        self.assertEqual(0, report["Convolution.get"]["max_digits"])
+
+    def test_nested(self):
+        a = ScalerHolder(initial_constants=[1, 2, 3], name="Bo")
+        with Profiler() as outer:
+            with Profiler() as inner:
+                a.scale(2)
+            a.scale(2)
+        self.assertEqual(1, inner.report()["ScalerHolder.scale"]["count"])
+        self.assertEqual(2, outer.report()["ScalerHolder.scale"]["count"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,11 @@
 import unittest
 from decimal import Decimal
+from fractions import Fraction
 
 from numpy import array
 
-from src.recursive_math import IterativeConstant, ScalerHolder, Series, Tensor
+from src.recursive_math import (IterativeConstant, ScalerHolder, Series, Tensor, DecimalBackend, FractionBackend,
+                                FixedPointBackend, BallBackend, Sin)
 
 
 class BaseOperatorsTest(unittest.TestCase):
@@ -89,6 +91,23 @@ class BaseOperatorsTest(unittest.TestCase):
         a2 = ScalerHolder(initial_constants=[1, -2, 3], name="Bo")
         self.assertEqual(a0, a2)
 
+    def test_scaler_slots(self):
+        a0 = ScalerHolder(initial_constants=[1, 2, 3], name="Bo", backend=DecimalBackend(precision=20))
+        a1 = a0.multiply(a0)
+
+        self.assertFalse(hasattr(a1, "__dict__"))
+        self.assertIs(a1.epsilon, a0.epsilon)
+        self.assertEqual(a1.epsilon, Decimal("1e-20"))
+        with self.assertRaises(AttributeError):
+            a1.degree = 4
+
+    def test_scaler_condense(self):
+        a0 = ScalerHolder(initial_constants=[Decimal("-0.25"), Decimal("0E+2"), Decimal(3), Decimal("0E-1001")],
+                          name="B")
+
+        self.assertEqual(str(a0), "-2.500e-1 B⁰ + 0.000e+0 B¹ + 3.000e+0 B²")
+        self.assertEqual(str(a0.scale(0)), "0.000e+0 B⁰")
+
     def test_scaler_slice(self):
         a0 = ScalerHolder(initial_constants=[1, 2, 3], name="Bo")
 
@@ -140,6 +159,60 @@ class BaseOperatorsTest(unittest.TestCase):
         self.assertTrue(len(b_n.holders) == 1)
         self.assertEqual(a0, a2)
 
+    def test_iterator_append_branches(self):
+        a = ScalerHolder(initial_constants=[1], name="Bo")
+        b = ScalerHolder(initial_constants=[2], name="Bo")
+        b_n = IterativeConstant(initial_holders=[a], name="a")
+
+        b_1 = b_n.append(a)
+        b_2 = b_n.append(b)
+        b_3 = b_1.append(b)
+
+        self.assertEqual(len(b_n), 1)
+        self.assertEqual(b_1.get(1), a)
+        self.assertEqual(b_2.get(1), b)
+        self.assertEqual(len(b_3.holders), 3)
+        self.assertEqual(b_1.get(-1), a)
+        with self.assertRaises(IndexError):
+            b_1.get(2)
+
+    def test_iterator_append_shares_holders(self):
+        a = ScalerHolder(initial_constants=[1], name="Bo")
+        b_n = IterativeConstant(initial_holders=[a], name="a")
+
+        b_1 = b_n.append(a.scale(2))
+        b_2 = b_1.append(a.scale(3))
+
+        self.assertIs(b_2.get(1), b_1.get(1))
+        self.assertIs(b_2.get(0), a)
+
+    def test_iterator_slice_view(self):
+        a = ScalerHolder(initial_constants=[1], name="Bo")
+        b_n = IterativeConstant(initial_holders=[a, a, a], name="a")
+
+        b_0 = b_n[:2]
+        b_n = b_n.append(a).update(0, a.scale(5))
+
+        self.assertEqual(len(b_0), 2)
+        self.assertEqual(b_0.get(0), a)
+        self.assertEqual(len(b_0.append(a.scale(2))), 3)
+        self.assertEqual(len(b_n), 4)
+
+    def test_iterator_holders_copy(self):
+        a = ScalerHolder(initial_constants=[1], name="Bo")
+        b_n = IterativeConstant(initial_holders=[a, a], name="a")
+        b_1 = b_n.append(a.scale(2))
+        b_0 = b_1[:2]
+
+        b_1.holders[0] = a.scale(3)
+        b_1.holders.append(a)
+        b_0.holders.append(a)
+
+        self.assertEqual(len(b_1), 3)
+        self.assertEqual(len(b_0), 2)
+        self.assertIs(b_1.get(0), a)
+        self.assertEqual(b_n.holders, [a, a])
+
     def test_iterator_simple_conv(self):
         a0 = ScalerHolder(initial_constants=[1], name="Bo")
         a1 = ScalerHolder(initial_constants=[2], name="Bo")
@@ -195,5 +268,183 @@ class BaseOperatorsTest(unittest.TestCase):
         self.assertEqual(a0, a2)
 
 
+class EqualityTest(unittest.TestCase):
+
+    def test_exact_equality(self):
+        a0 = ScalerHolder(initial_constants=[1, Decimal("1.00001")], name="Bo")
+        a1 = ScalerHolder(initial_constants=[1, Decimal("1.00002")], name="Bo")
+        a2 = ScalerHolder(initial_constants=[1, Decimal("1.00001"), 0, 0], name="Bo")
+
+        self.assertNotEqual(a0, a1)
+        self.assertEqual(a0, a2)
+        self.assertEqual(hash(a0), hash(a2))
+        self.assertEqual(a0.digest(), a2.digest())
+        self.assertNotEqual(a0.digest(), a1.digest())
+        self.assertNotEqual(a0, ScalerHolder(initial_constants=[1, Decimal("1.00001")], name="B1"))
+
+    def test_equality_between_backends(self):
+        a0 = ScalerHolder(initial_constants=[Fraction(1, 4), 3], name="Bo")
+        a1 = ScalerHolder(initial_constants=[Fraction(1, 4), 3], name="Bo", backend=FractionBackend())
+        a2 = ScalerHolder(initial_constants=[Fraction(1, 4), 3], name="Bo", backend=FixedPointBackend(bits=16))
+
+        self.assertEqual(a0, a1)
+        self.assertEqual(a1, a2)
+        self.assertEqual(len({a0, a1, a2}), 1)
+        self.assertEqual(a0.digest(), a2.digest())
+
+    def test_isclose(self):
+        a0 = ScalerHolder(initial_constants=[1, 2], name="Bo")
+        a1 = ScalerHolder(initial_constants=[1, Fraction(2) + Fraction(1, 10 ** 12)], name="Bo",
+                          backend=FractionBackend())
+
+        self.assertNotEqual(a0, a1)
+        self.assertTrue(a0.isclose(a1))
+        self.assertFalse(a0.isclose(a1, rel_tol=1e-15))
+        self.assertTrue(a0.isclose(a1, rel_tol=0, abs_tol=1e-11))
+
+    def test_iterator_equality(self):
+        a = ScalerHolder(initial_constants=[1, 2, 3], name="Bo")
+        b = ScalerHolder(initial_constants=[1, 2, 3, 0], name="Bo")
+        a_n = IterativeConstant(initial_holders=[a, a], name="a")
+        b_n = IterativeConstant(initial_holders=[a, b], name="a")
+
+        self.assertEqual(a_n, b_n)
+        self.assertEqual({a_n: 1}[b_n], 1)
+        self.assertEqual(a_n.digest(), b_n.digest())
+        self.assertNotEqual(a_n, b_n.append(a))
+        self.assertTrue(a_n.isclose(b_n))
+
+
+class ParityTest(unittest.TestCase):
+
+    def test_parity(self):
+        zero = ScalerHolder(initial_constants=[0], name="Bo")
+        a = ScalerHolder(initial_constants=[1, 2], name="Bo")
+        a_n = IterativeConstant(initial_holders=[a, zero, a], name="a", parity=0)
+
+        self.assertTrue(a_n.is_known_zero(1))
+        self.assertEqual(a_n.append(zero).parity, 0)
+        self.assertIsNone(a_n.append(a).parity)
+        self.assertEqual(a_n[:2].parity, 0)
+        self.assertEqual(a_n.scale(2).parity, 0)
+        with self.assertRaises(ValueError):
+            IterativeConstant(initial_holders=[a, a], name="a", parity=0)
+
+    def test_parity_conv(self):
+        zero = ScalerHolder(initial_constants=[0], name="Bo")
+        a = ScalerHolder(initial_constants=[1, 2], name="Bo")
+        b = ScalerHolder(initial_constants=[3], name="Bo")
+        a_n = IterativeConstant(initial_holders=[zero, a, zero, a], name="a", parity=1)
+        b_n = IterativeConstant(initial_holders=[b, zero, b, zero], name="a", parity=0)
+        dense = IterativeConstant(initial_holders=b_n.holders, name="a")
+
+        for n in range(4):
+            self.assertEqual(a_n.conv(b_n, i=0, n=n, n_index=n), a_n.conv(dense, i=0, n=n, n_index=n))
+        self.assertEqual(a_n.conv(b_n, i=0, n=3, n_index=3), ScalerHolder(initial_constants=[6, 12], name="Bo"))
+
+    def test_parity_add(self):
+        zero = ScalerHolder(initial_constants=[0], name="Bo")
+        a = ScalerHolder(initial_constants=[1], name="Bo")
+        a_n = IterativeConstant(initial_holders=[zero, a, zero, a], name="a", parity=1)
+        b_n = IterativeConstant(initial_holders=[a, zero, a], name="a", parity=0)
+
+        c_n = a_n.add(b_n)
+        self.assertIsNone(c_n.parity)
+        self.assertEqual(c_n, IterativeConstant(initial_holders=[a, a, a, a], name="a"))
+        self.assertEqual(a_n.add(a_n).parity, 1)
+
+    def test_parity_freeze_no_rows(self):
+        tensor = Sin(name="f", holder_name="B").freeze()
+
+        self.assertEqual(tensor.constants.tolist(), [[0.0]])
+        self.assertEqual(tensor.reduce(1.0).evaluate(0.5), 0.0)
+
+    def test_parity_freeze(self):
+        zero = ScalerHolder(initial_constants=[0], name="Bo")
+        a = ScalerHolder(initial_constants=[1, 2], name="Bo")
+        a_n = IterativeConstant(initial_holders=[zero, a, zero, a.scale(3)], name="a", parity=1)
+
+        tensor = a_n.freeze()
+        self.assertEqual(tensor, Tensor(array([[1.0, 2.0], [3.0, 6.0]]), parity=1))
+
+        # (1 + 2B)(x + 3x^3) at B = 1, x = 2
+        self.assertEqual(tensor.reduce(1.0).evaluate(2.0), 78.0)
+        self.assertEqual(tensor.reduce(1.0).evaluate(array([2.0, -1.0])).tolist(), [78.0, -12.0])
+        self.assertEqual(tensor.evaluate_grid(array([1.0]), array([2.0])).tolist(), [[78.0]])
+
+
+class TermwiseTest(unittest.TestCase):
+
+    def setUp(self):
+        a = ScalerHolder(initial_constants=[1, 2], name="Bo", backend=FractionBackend())
+        self.a_n = IterativeConstant(initial_holders=[a.scale(n + 1) for n in range(5)], name="a")
+
+    def test_derivative(self):
+        a_n = self.a_n
+        b_n = a_n.derivative(2)
+        self.assertEqual(len(b_n), 3)
+        for n in range(3):
+            self.assertEqual(b_n.get(n), a_n.get(n + 2).scale((n + 1) * (n + 2)))
+        self.assertEqual(a_n.derivative(1), a_n.shift(1).rational_scale([1, 1]))
+        self.assertEqual(a_n.integral(2).derivative(2), a_n)
+        self.assertTrue(a_n.integral(2).get(1).is_zero())
+
+    def test_shift(self):
+        a_n = self.a_n
+        self.assertEqual(a_n.shift(2).get(0), a_n.get(2))
+        self.assertEqual(len(a_n.shift(-1)), 6)
+        self.assertTrue(a_n.shift(-1).get(0).is_zero())
+        self.assertEqual(a_n.shift(-1).shift(1), a_n)
+
+    def test_rational_scale(self):
+        a_n = self.a_n
+        c_n = a_n.rational_scale([1], [1, 1])
+        self.assertEqual(c_n.get(3), a_n.get(3).scale(Fraction(1, 4)))
+        with self.assertRaises(ZeroDivisionError):
+            a_n.rational_scale([1], [-2, 1])
+
+    def test_linear_combination(self):
+        a_n = self.a_n
+        c_n = IterativeConstant.linear_combination([a_n, a_n.derivative(1)], [1, -2])
+        self.assertEqual(len(c_n), 5)
+        self.assertEqual(c_n.get(0), a_n.get(0).add(a_n.get(1).scale(-2)))
+        self.assertEqual(c_n.get(4), a_n.get(4))
+
+    def test_parity(self):
+        zero = ScalerHolder(initial_constants=[0], name="Bo")
+        a = ScalerHolder(initial_constants=[1], name="Bo")
+        a_n = IterativeConstant(initial_holders=[zero, a, zero, a], name="a", parity=1)
+
+        self.assertEqual(a_n.derivative(1).parity, 0)
+        self.assertEqual(a_n.integral(1).parity, 0)
+        self.assertEqual(a_n.shift(-2).parity, 1)
+        self.assertIsNone(IterativeConstant.linear_combination([a_n, a_n.shift(1)], [1, 1]).parity)
+
+
+class FreezeTest(unittest.TestCase):
+
+    def test_bulk_freeze(self):
+        for backend in [DecimalBackend(), FractionBackend(), FixedPointBackend(bits=128), BallBackend(bits=128)]:
+            holders = [ScalerHolder(initial_constants=[Fraction(1, 3), Fraction(-2, 7), 5], name="B", backend=backend),
+                       ScalerHolder(initial_constants=[Fraction(10 ** 30, 3)], name="B", backend=backend)]
+            a_n = IterativeConstant(initial_holders=holders, name="a")
+
+            tensor = a_n.freeze()
+            self.assertEqual(tensor.constants.tolist(), [[1 / 3, -2 / 7, 5.0], [10 ** 30 / 3, 0.0, 0.0]])
+            self.assertEqual(tensor.constants.tolist(), [holder.freeze().constants.tolist() + [0.0] * (3 - len(holder))
+                                                         for holder in holders])
+
+    def test_double_double(self):
+        third = ScalerHolder(initial_constants=[Fraction(1, 3), 1], name="B", backend=FractionBackend())
+        a_n = IterativeConstant(initial_holders=[third, third.scale(-1)], name="a")
+
+        tensor = a_n.freeze(precision="double-double")
+        self.assertEqual(tensor.constants.tolist(), a_n.freeze().constants.tolist())
+        for hi, lo, expected in zip(tensor.constants[:, 0], tensor.lo[:, 0], [Fraction(1, 3), Fraction(-1, 3)]):
+            self.assertLess(abs(Fraction(hi) + Fraction(lo) - expected), Fraction(1, 10 ** 32))
+        with self.assertRaises(ValueError):
+            a_n.freeze(precision="quad")
+
+
 if __name__ == '__main__':
     unittest.main()
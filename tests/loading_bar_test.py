@@ -9,7 +9,7 @@ class LoadingBarTest(unittest.TestCase):
 
     def test_loading_bar(self):
 
-        total = 76
+        total = 32
         with tqdm(total=total, desc="Testing loading bar") as pbar:
             Progress.set_pbar(pbar)
             Progress.reset_counter()
@@ -34,7 +34,26 @@ class LoadingBarTest(unittest.TestCase):
         a0.scale(2)
 
         counter = Progress.get_counter()
-        self.assertEqual(8, counter)
+        self.assertEqual(5, counter)
+
+    def test_counter_without_pbar(self):
+        # Nothing is counted unless a bar is set or counting is enabled
+        Progress.set_pbar(None)
+        Progress.reset_counter()
+        a = ScalerHolder(initial_constants=[1, 2, 3], name="Bo")
+        a.scale(2)
+        self.assertEqual(Progress.get_counter(), 0)
+
+        Progress.enable()
+        try:
+            a.scale(2)
+            self.assertEqual(Progress.pbar, None)
+            self.assertEqual(Progress.get_counter(), 1)
+        finally:
+            Progress.disable()
+
+        a.scale(2)
+        self.assertEqual(Progress.get_counter(), 1)
 
 
 if __name__ == '__main__':
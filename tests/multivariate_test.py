@@ -0,0 +1,87 @@
+import unittest
+from fractions import Fraction
+
+from numpy import array
+
+from src.recursive_math import IterativeConstant, ScalerHolder, MultiScalerHolder, Series, Tensor, FractionBackend
+
+
+def holder(terms):
+    return MultiScalerHolder(initial_terms=terms, names=("B", "C"), backend=FractionBackend())
+
+
+class MultiScalerHolderTest(unittest.TestCase):
+
+    def test_add(self):
+        a0 = holder({(0, 0): 1, (1, 0): 2}).add(holder({(1, 0): 1, (0, 2): 3}))
+
+        a2 = holder({(0, 0): 1, (1, 0): 3, (0, 2): 3})
+        self.assertEqual(a0, a2)
+
+    def test_multiply(self):
+        # (1 + B)(1 + C) = 1 + B + C + BC
+        a0 = holder({(0, 0): 1, (1, 0): 1}).multiply(holder({(0, 0): 1, (0, 1): 1}))
+
+        a2 = holder({(0, 0): 1, (1, 0): 1, (0, 1): 1, (1, 1): 1})
+        self.assertEqual(a0, a2)
+        self.assertEqual(a0.degree("B"), 1)
+
+    def test_scale(self):
+        a0 = holder({(0, 1): 2, (2, 0): 0}).scale(Fraction(1, 2))
+
+        self.assertEqual(a0, holder({(0, 1): 1}))
+        self.assertEqual(a0.get((0, 1)), 1)
+        self.assertEqual(a0.get((5, 5)), 0)
+        self.assertEqual(a0.increase_scaler("B"), holder({(1, 1): 1}))
+
+    def test_incompatible(self):
+        a0 = holder({(0, 0): 1})
+        a1 = MultiScalerHolder(initial_terms={(0, 0): 1}, names=("B", "D"), backend=FractionBackend())
+        with self.assertRaises(TypeError):
+            a0.add(a1)
+        with self.assertRaises(ValueError):
+            holder({(0,): 1})
+
+    def test_from_scaler_holder(self):
+        a = ScalerHolder(initial_constants=[1, 0, 3], name="C", backend=FractionBackend())
+
+        self.assertEqual(MultiScalerHolder.from_scaler_holder(a, names=("B", "C")), holder({(0, 0): 1, (0, 2): 3}))
+
+    def test_conv(self):
+        a = holder({(0, 0): 1, (1, 0): 1})
+        b = holder({(0, 1): 2})
+        a_n = IterativeConstant(initial_holders=[a, b], name="a")
+
+        a0 = a_n.conv(a_n, i=0, n=1, n_index=1)
+
+        a2 = holder({(0, 1): 4, (1, 1): 4})
+        self.assertEqual(a0, a2)
+
+    def test_freeze_reduce(self):
+        # a_0 = 1 + B C, a_1 = 2 + C^2
+        a_n = IterativeConstant(initial_holders=[holder({(0, 0): 1, (1, 1): 1}), holder({(0, 0): 2, (0, 2): 1})],
+                                name="a")
+        tensor = a_n.freeze()
+
+        self.assertEqual(tensor.constants.shape, (2, 2, 3))
+        self.assertEqual(tensor.names, ("B", "C"))
+        self.assertEqual(tensor.reduce({"B": 2.0, "C": 3.0}), Series(array([7.0, 11.0])))
+
+        partial = tensor.reduce({"C": 3.0})
+        self.assertEqual(partial, Tensor(array([[1.0, 3.0], [11.0, 0.0]]), names=("B",)))
+        self.assertEqual(partial.reduce(2.0), Series(array([7.0, 11.0])))
+
+        with self.assertRaises(ValueError):
+            tensor.reduce(2.0)
+        with self.assertRaises(ValueError):
+            tensor.reduce({"D": 2.0})
+        with self.assertRaises(ValueError):
+            tensor.reduce_many(array([2.0]))
+        with self.assertRaises(ValueError):
+            tensor.evaluate_grid(array([2.0]), array([0.5]))
+        with self.assertRaises(ValueError):
+            tensor.to_pade(2.0, 1, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
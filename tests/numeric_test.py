@@ -0,0 +1,55 @@
+import unittest
+
+from numpy import linspace, array, abs as np_abs, allclose
+
+from src.recursive_math import IterativeConstant, NumericConstant, Recurrence, ScalerHolder, DecimalBackend
+from src.recursive_math.examples import readme_equation, readme_solver, readme_numeric_loop
+
+
+class NumericTest(unittest.TestCase):
+
+    def assertMatches(self, a_n: NumericConstant, symbolic: IterativeConstant):
+        tensor = symbolic.freeze()
+        for scaler, series in zip(a_n.scalers, a_n.series()):
+            expected = tensor.reduce(float(scaler)).constants
+            self.assertLess(np_abs(series.constants - expected).max(), 1e-13 * np_abs(expected).max())
+
+    def test_solve_numeric(self):
+        scalers = linspace(-2, 2, 9)
+        a_n = readme_solver(30, DecimalBackend())
+        numeric = readme_equation(DecimalBackend()).solve_numeric(30, scalers)
+
+        self.assertEqual(numeric.values.shape, (9, 30))
+        self.assertMatches(numeric, a_n)
+
+    def test_operations(self):
+        scalers = linspace(-1, 3, 5)
+        a_n = readme_numeric_loop(20, scalers)
+        self.assertEqual(len(a_n), 22)
+        self.assertMatches(a_n[:22], readme_solver(22, DecimalBackend()))
+
+        doubled = a_n.add(a_n)
+        self.assertTrue(allclose(doubled.values, a_n.scale(2).values))
+        self.assertTrue(allclose(a_n.increase_scaler().get(3), a_n.get(3) * scalers))
+
+    def test_shared_storage(self):
+        scalers = array([1.0, 2.0])
+        a_n = NumericConstant(array([[1.0], [2.0]]), name="a", scalers=scalers)
+        b_n = a_n.append(3.0)
+        c_n = a_n.append(array([4.0, 5.0]))
+
+        self.assertEqual(b_n.values.tolist(), [[1.0, 3.0], [2.0, 3.0]])
+        self.assertEqual(c_n.values.tolist(), [[1.0, 4.0], [2.0, 5.0]])
+        self.assertEqual(len(a_n), 1)
+
+        with self.assertRaises(TypeError):
+            a_n.add(NumericConstant(array([[1.0]]), name="a", scalers=array([1.0])))
+
+    def test_zero_leading(self):
+        recurrence = Recurrence(name="a", holder_name="B", initial=[1]).derivative(1, scale=ScalerHolder([0, 1], name="B"))
+        with self.assertRaises(ValueError):
+            recurrence.solve_numeric(5, array([1.0, 0.0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
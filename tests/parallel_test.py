@@ -0,0 +1,81 @@
+import unittest
+
+from src.recursive_math import (IterativeConstant, ScalerHolder, MultiScalerHolder, Sin, Cos, DecimalBackend,
+                                FractionBackend, BallBackend, ParallelExecutor)
+from src.recursive_math.examples import readme_solver
+
+
+def fraction_solver(N: int) -> IterativeConstant:
+    return readme_solver(N, FractionBackend())
+
+
+def sin_series(N: int) -> IterativeConstant:
+    sin_x = Sin(name="f", holder_name="B", backend=FractionBackend())
+    for _ in range(N):
+        sin_x = sin_x.next_term()
+    return sin_x
+
+
+def multi_series(N: int) -> IterativeConstant:
+    holders = [MultiScalerHolder(initial_terms={(n, 1): 1}, names=("B", "C")) for n in range(N)]
+    return IterativeConstant(initial_holders=holders, name="a")
+
+
+class ParallelTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ParallelExecutor(max_workers=2, chunk_size=3)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def test_conv(self):
+        for backend in [DecimalBackend(), FractionBackend(), BallBackend(bits=64)]:
+            a_n = readme_solver(15, backend)
+            for n in [1, 7, 14]:
+                serial = a_n.conv(a_n, i=0, n=n, n_index=n)
+                parallel = a_n.conv(a_n, i=0, n=n, n_index=n, executor=self.executor)
+                if isinstance(backend, DecimalBackend):
+                    # Decimal sums are rounded, so summing chunk by chunk can change the last digit
+                    self.assertTrue(parallel.isclose(serial, rel_tol=1e-300))
+                else:
+                    self.assertEqual(parallel, serial)
+                self.assertEqual(parallel.backend, backend)
+
+    def test_conv_parity(self):
+        sin_x = Sin(name="f", holder_name="B")
+        cos_x = Cos(name="f", holder_name="B")
+        for _ in range(12):
+            sin_x, cos_x = sin_x.next_term(), cos_x.next_term()
+
+        serial = sin_x.conv(cos_x, i=0, n=11, n_index=11)
+        self.assertEqual(sin_x.conv(cos_x, i=0, n=11, n_index=11, executor=self.executor), serial)
+        self.assertTrue(sin_x.conv(cos_x, i=0, n=10, n_index=10, executor=self.executor).is_zero())
+
+    def test_multiply(self):
+        decimal = DecimalBackend(precision=50)
+        pairs = [(ScalerHolder([1, 2, 3], name="B"), ScalerHolder([4, 5], name="B")),
+                 (ScalerHolder([1, 3], name="B", backend=decimal), ScalerHolder([7], name="B", backend=decimal))]
+        pairs += [(ScalerHolder([i, 1], name="C"), ScalerHolder([1, -i], name="C")) for i in range(5)]
+
+        products = self.executor.multiply(pairs)
+        self.assertEqual(products, [a.multiply(b) for a, b in pairs])
+        self.assertEqual(products[1].backend, decimal)
+
+        with self.assertRaises(TypeError):
+            self.executor.multiply([(ScalerHolder([1], name="B"), ScalerHolder([1], name="C"))])
+
+    def test_generate(self):
+        a_n, sin_x = self.executor.generate(fraction_solver, [10])[0], self.executor.generate(sin_series, [9])[0]
+        self.assertEqual(a_n, fraction_solver(10))
+        self.assertEqual(sin_x, sin_series(9))
+        self.assertEqual(sin_x.parity, 1)
+
+        with self.assertRaises(TypeError):
+            self.executor.generate(multi_series, [3])
+
+
+if __name__ == '__main__':
+    unittest.main()
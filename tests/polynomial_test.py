@@ -0,0 +1,93 @@
+import unittest
+from random import Random
+from decimal import Decimal, Context, MAX_PREC, MAX_EMAX, MIN_EMIN, getcontext
+from fractions import Fraction
+
+from src.recursive_math import ScalerHolder, DecimalBackend, FractionBackend, FixedPointBackend
+from src.recursive_math.backends import SCHOOLBOOK_CUTOFF
+from src.recursive_math.polynomial import schoolbook, karatsuba, kronecker, multiply_integers
+
+
+def integer_multiply(a, b):
+    return a * b
+
+
+def integer_add(a, b):
+    return a + b
+
+
+class PolynomialTest(unittest.TestCase):
+
+    def test_integer_methods_agree(self):
+        random = Random(0)
+        for len_a, len_b in [(1, 1), (3, 40), (12, 12), (13, 31), (64, 64), (100, 7)]:
+            a = [random.randint(-10 ** 40, 10 ** 40) for _ in range(len_a)]
+            b = [random.randint(-10 ** 20, 10 ** 20) for _ in range(len_b)]
+
+            expected = schoolbook(a, b, integer_multiply, integer_add, 0)
+            self.assertEqual(karatsuba(a, b), expected)
+            self.assertEqual(kronecker(a, b), expected)
+            self.assertEqual(multiply_integers(a, b), expected)
+
+    def test_kronecker_zeros(self):
+        self.assertEqual(kronecker([0, 0, 0], [0, 5]), [0, 0, 0, 0])
+        self.assertEqual(kronecker([0] * 30, [10 ** 40] * 30), [0] * 59)
+
+        a0 = ScalerHolder(initial_constants=[Fraction(1, 3) + i for i in range(30)], name="B")
+        self.assertTrue(a0.scale(0).multiply(a0).is_zero())
+
+    def test_product_length(self):
+        a0 = ScalerHolder(initial_constants=[1, 2, 3, 4], name="Bo")
+        a1 = ScalerHolder(initial_constants=[2], name="Bo")
+
+        a0 = a0.multiply(a1)
+
+        self.assertEqual(len(a0), 4)
+
+    def test_large_fraction_product(self):
+        backend = FractionBackend()
+        constants = [Fraction(i + 1, i + 2) for i in range(40)]
+        a0 = ScalerHolder(initial_constants=constants, name="Bo", backend=backend)
+
+        a0 = a0.multiply(a0)
+
+        self.assertEqual(a0.constants, schoolbook(constants, constants, integer_multiply, integer_add, Fraction(0)))
+
+    def test_large_decimal_product(self):
+        constants = [Decimal(i + 1) / Decimal(7) for i in range(40)]
+        a0 = ScalerHolder(initial_constants=constants, name="Bo", backend=DecimalBackend())
+
+        a0 = a0.multiply(a0)
+
+        expected = schoolbook(constants, constants, integer_multiply, integer_add, Decimal(0))
+        for value, expected_value in zip(a0.constants, expected):
+            self.assertLess(abs(value - expected_value), Decimal(10) ** -900)
+
+    def test_decimal_rounding(self):
+        # From SCHOOLBOOK_CUTOFF on, every Decimal coefficient is the exact sum of products rounded once,
+        # short operands keep rounding every product and partial sum
+        random = Random(1)
+        exact = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+        for backend, context in [(DecimalBackend(), getcontext()), (DecimalBackend(precision=30), None)]:
+            context = context or backend.context
+            for length in [SCHOOLBOOK_CUTOFF, 40]:
+                constants = [context.divide(Decimal(random.randint(1, 10 ** 6)), Decimal(random.randint(1, 10 ** 6)))
+                             for _ in range(length)]
+                a0 = ScalerHolder(initial_constants=constants, name="Bo", backend=backend).multiply(
+                    ScalerHolder(initial_constants=constants[::-1], name="Bo", backend=backend))
+
+                expected = [context.plus(value) for value in
+                            schoolbook(constants, constants[::-1], exact.multiply, exact.add, Decimal(0))]
+                self.assertEqual(a0.constants, expected)
+
+    def test_large_fixed_point_product(self):
+        backend = FixedPointBackend(bits=64)
+        a0 = ScalerHolder(initial_constants=[Fraction(1, 2)] * 40, name="Bo", backend=backend)
+
+        a0 = a0.multiply(a0)
+
+        self.assertEqual(a0.freeze().constants.tolist()[:3], [0.25, 0.5, 0.75])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from fractions import Fraction
+
+from src.recursive_math import (Recurrence, IterativeConstant, ScalerHolder, Sin, FractionBackend,
+                                FixedPointBackend)
+from src.recursive_math.examples import readme_equation, readme_loop, exp_equation
+
+
+class RecurrenceTest(unittest.TestCase):
+
+    def test_matches_loop(self):
+        a_n = readme_equation(FractionBackend()).solve(14)
+        self.assertEqual(len(a_n), 14)
+        self.assertEqual(a_n, readme_loop(12, FractionBackend(), block_size=4))
+
+    def test_resume(self):
+        recurrence = readme_equation(FractionBackend())
+        recurrence.solve(6)
+        a_n = recurrence.solve(12)
+        self.assertEqual(a_n, readme_equation(FractionBackend()).solve(12))
+
+        resumed = Recurrence(name="a", holder_name="B", initial=a_n[:8], backend=FractionBackend())
+        sin_x = Sin(name="f", holder_name="B", backend=FractionBackend())
+        b = ScalerHolder(initial_constants=[0, 1], name="B", backend=FractionBackend())
+        resumed = resumed.product(0, 2).derivative(1, scale=2).source(sin_x, scale=b)
+        self.assertEqual(a_n, resumed.solve(12))
+
+    def test_exp(self):
+        a_n = exp_equation(FractionBackend()).solve(8)
+        self.assertEqual(a_n.get(7).get(0), Fraction(1, 5040))
+
+    def test_square(self):
+        # y y' = 1 with y(0) = 1 gives y = sqrt(1 + 2x)
+        backend = FractionBackend()
+        one = IterativeConstant(initial_holders=[ScalerHolder([1], name="B", backend=backend)] +
+                                [ScalerHolder([0], name="B", backend=backend)] * 5, name="one")
+        a_n = Recurrence(name="a", holder_name="B", initial=[1], backend=backend).product(0, 1).source(one)
+        a_n = a_n.solve(4)
+        self.assertEqual([a_n.get(i).get(0) for i in range(4)], [1, 1, Fraction(-1, 2), Fraction(1, 2)])
+
+    def test_fixed_point(self):
+        a_n = readme_equation(FixedPointBackend(bits=128)).solve(14)
+        self.assertTrue(a_n.isclose(readme_loop(12, FractionBackend(), block_size=4), rel_tol=1e-30))
+
+    def test_leading_coefficient(self):
+        backend = FractionBackend()
+        a_0 = ScalerHolder(initial_constants=[1, 1], name="B", backend=backend)
+        recurrence = Recurrence(name="a", holder_name="B", initial=[a_0, 1], backend=backend).product(0, 2)
+        with self.assertRaises(ValueError):
+            recurrence.solve(3)
+
+        recurrence = Recurrence(name="a", holder_name="B", initial=[1], backend=backend).product(1, 1)
+        with self.assertRaises(ValueError):
+            recurrence.solve(3)
+
+        with self.assertRaises(ValueError):
+            Recurrence(name="a", holder_name="B", initial=[1], backend=backend).derivative(2).solve(3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,56 @@
+import os
+import subprocess
+import sys
 import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
-from numpy import array
+from fractions import Fraction
+from math import factorial, exp, sin as math_sin
 
-from src.recursive_math import Series, Tensor
+from numpy import array, empty, float32, linspace, log1p, abs as np_abs
+
+from src.recursive_math import Series, Tensor, RationalSeries, Exp, Sin, Log1p, warmup
+from src.recursive_math import series
+from src.recursive_math.series import evaluate_polynomial, evaluate_grid, cached_jit
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Compiles a kernel that calls another one, and a parallel one
+KERNELS = """
+from numpy import ones
+from {package}.series import evaluate_polynomials, n_evaluate_polynomial
+print(evaluate_polynomials(0.5, ones((3, 2)))[0], n_evaluate_polynomial(ones(2), ones(3))[0])
+"""
+
+
+class KernelCacheTest(unittest.TestCase):
+
+    def test_import_names(self):
+        # The disk cache is shared, a kernel cached under one package name has to load under the other
+        with TemporaryDirectory() as cache:
+            for package in ["src.recursive_math", "recursive_math", "src.recursive_math", "recursive_math"]:
+                path = ROOT if package.startswith("src.") else os.path.join(ROOT, "src")
+                env = dict(os.environ, NUMBA_CACHE_DIR=cache, PYTHONPATH=path)
+                result = subprocess.run([sys.executable, "-c", KERNELS.format(package=package)], env=env, cwd=cache,
+                                        capture_output=True, text=True)
+                self.assertEqual(result.returncode, 0, result.stderr)
+                self.assertEqual(result.stdout.split(), ["1.5", "3.0"])
+
+    def test_fallback(self):
+        # Without the numba internals the kernels still compile, with the plain on-disk cache
+        def double(x):
+            return 2 * x
+
+        def missing(function):
+            raise AttributeError("_cache")
+
+        for name, value in [("FunctionCache", None), ("_ModuleCache", missing)]:
+            with patch.object(series, name, value):
+                kernel = cached_jit(nopython=True)(double)
+            self.assertNotIsInstance(kernel._cache, series._ModuleCache)
+            self.assertEqual(kernel(1.5), 3.0)
 
 
 class SeriesTest(unittest.TestCase):
@@ -23,6 +71,30 @@ class SeriesTest(unittest.TestCase):
         a2 = 85
         self.assertEqual(a0, a2)
 
+    def test_series_poly_out(self):
+        a = Series(array([7.0, 21.0, 9.0]))
+        x = array([[0.0, 1.0], [2.0, -1.0]])
+        out = empty((2, 2))
+
+        a0 = a.evaluate(x, out=out)
+
+        self.assertIs(a0, out)
+        self.assertEqual(a0.tolist(), [[7.0, 37.0], [85.0, -5.0]])
+
+    def test_series_poly_float32(self):
+        a = Series(array([7.0, 21.0, 9.0]))
+
+        a0 = a.evaluate(array([2.0, 0.5]), dtype=float32)
+
+        self.assertEqual(a0.dtype, float32)
+        self.assertEqual(a0.tolist(), [85.0, 19.75])
+
+    def test_series_poly_bad_out(self):
+        a = Series(array([7.0, 21.0, 9.0]))
+
+        with self.assertRaises(ValueError):
+            a.evaluate(array([2.0, 0.5]), out=empty(3))
+
     def test_tensor_polys(self):
         a0 = Tensor(array([[1.0, 2.0, 7.0],
                            [1.0, 2.0, 3.0],
@@ -33,6 +105,187 @@ class SeriesTest(unittest.TestCase):
         a2 = Series(array([10, 6, 10]))
         self.assertEqual(a0, a2)
 
+    def test_tensor_reduce_many(self):
+        a = Tensor(array([[1.0, 2.0, 7.0],
+                          [1.0, 2.0, 3.0],
+                          [1.0, 0.0, 0.0]]))
+
+        a0 = a.reduce_many(array([1.0, 2.0]))
+
+        a2 = array([a.reduce(1.0).constants, a.reduce(2.0).constants])
+        self.assertEqual(a0.tolist(), a2.tolist())
+
+        # Parity rows come back as every power of x
+        tensor = Sin(name="f", holder_name="B").generate(6).freeze()
+        a0 = tensor.reduce_many(array([0.5]))
+        self.assertEqual(a0.shape, (1, 6))
+        self.assertEqual(a0[0].tolist(), [0.0, 1.0, 0.0, -1 / 6, 0.0, 1 / 120])
+
+    def test_tensor_evaluate_grid(self):
+        a = Tensor(array([[1.0, 2.0, 7.0],
+                          [1.0, 2.0, 3.0],
+                          [1.0, 0.0, 0.0]]))
+        x = array([0.0, 0.5, 2.0])
+
+        a0 = a.evaluate_grid(array([1.0, -3.0]), x)
+
+        a2 = array([a.reduce(1.0).evaluate(x), a.reduce(-3.0).evaluate(x)])
+        self.assertEqual(a0.shape, (2, 3))
+        self.assertEqual(a0.tolist(), a2.tolist())
+
+    def test_derivative(self):
+        # 1 + 2x + 3x^2 + 4x^3
+        a = Series(array([1.0, 2.0, 3.0, 4.0]))
+        self.assertEqual(a.derivative().constants.tolist(), [2.0, 6.0, 12.0])
+        self.assertEqual(a.derivative(2).constants.tolist(), [6.0, 24.0])
+        self.assertEqual(a.derivative(4).constants.tolist(), [0.0])
+        self.assertEqual(a.integral().constants.tolist(), [0.0, 1.0, 1.0, 1.0, 1.0])
+        self.assertEqual(a.integral(2).derivative(2), a)
+
+    def test_derivative_parity(self):
+        # x - x^3 / 6 + x^5 / 120 stored as its odd terms
+        a = Series(array([1.0, -1 / 6, 1 / 120]), parity=1)
+        x = array([0.5, -1.5])
+
+        derivative = a.derivative()
+        self.assertEqual(derivative.parity, 0)
+        self.assertEqual(derivative.constants.tolist(), [1.0, -0.5, 1 / 24])
+        self.assertEqual(a.integral().parity, 0)
+        self.assertEqual(a.integral().derivative().evaluate(x).tolist(), a.evaluate(x).tolist())
+
+    def test_tensor_derivative(self):
+        a = Tensor(array([[1.0, 2.0],
+                          [3.0, 4.0],
+                          [5.0, 6.0]]), names=["B"])
+
+        derivative = a.derivative()
+        self.assertEqual(derivative.names, ("B",))
+        self.assertEqual(derivative.reduce(2.0).constants.tolist(), a.reduce(2.0).derivative().constants.tolist())
+        self.assertEqual(a.integral().derivative(), a)
+
+    def test_pade(self):
+        exp = Series(array([1 / factorial(i) for i in range(8)]))
+        rational = exp.to_pade(2, 2)
+        self.assertTrue(np_abs(rational.numerator - array([1.0, 1 / 2, 1 / 12])).max() < 1e-15)
+        self.assertTrue(np_abs(rational.denominator - array([1.0, -1 / 2, 1 / 12])).max() < 1e-15)
+        self.assertEqual(rational.evaluate(array([0.5, 1.0])).tolist(),
+                         [rational.evaluate(0.5), rational.evaluate(1.0)])
+
+        with self.assertRaises(ValueError):
+            exp.to_pade(4, 4)
+
+    def test_pade_range(self):
+        # log(1 + x) converges only for |x| < 1, the rational approximant keeps going
+        log = Series(Log1p(name="f", holder_name="B").float_coefficients(100))
+        rational = log.to_pade(10, 10)
+        x = linspace(-0.9, 3, 50)
+        self.assertLess(np_abs(rational.evaluate(x) - log1p(x)).max(), 1e-5)
+        self.assertGreater(np_abs(log.evaluate(x) - log1p(x)).max(), 1.0)
+
+    def test_pade_parity(self):
+        # sin(x), stored as its odd terms
+        sin = Series(array([(-1) ** i / factorial(2 * i + 1) for i in range(6)]), parity=1)
+        rational = sin.to_pade(5, 4)
+        self.assertEqual(rational.denominator[1], 0.0)
+        self.assertLess(abs(rational.evaluate(1.0) - math_sin(1.0)), 1e-7)
+
+    def test_tensor_pade(self):
+        # 1 / (1 - B x) for every B
+        tensor = Tensor(array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]))
+        rationals = tensor.to_pade(array([0.5, 2.0]), 1, 1)
+
+        self.assertEqual(len(rationals), 2)
+        self.assertEqual(rationals[1], tensor.to_pade(2.0, 1, 1))
+        self.assertEqual(rationals[1], RationalSeries(array([1.0, 0.0]), array([1.0, -2.0])))
+        self.assertAlmostEqual(rationals[0].evaluate(1.0), 2.0)
+
+    def test_reduce_cache(self):
+        a = Tensor(array([[1.0, 2.0], [3.0, 4.0]])).enable_cache(capacity=2)
+        series = a.reduce(1.0)
+
+        self.assertIs(a.reduce(1.0), series)
+        self.assertEqual(series, Tensor(a.constants).reduce(1.0))
+        self.assertFalse(series.constants.flags.writeable)
+        self.assertEqual(a.cache_stats(), {"hits": 1, "misses": 1, "evictions": 0, "entries": 1, "bytes": 16})
+
+        a.reduce(2.0)
+        a.reduce(3.0)
+        self.assertIsNot(a.reduce(1.0), series)
+        self.assertEqual(a.cache_stats()["evictions"], 2)
+
+        self.assertIsNone(a.disable_cache().cache_stats())
+        self.assertTrue(a.reduce(1.0).constants.flags.writeable)
+
+    def test_reduce_cache_limits(self):
+        a = Tensor(array([[1.0, 2.0], [3.0, 4.0]]), names=["B"]).enable_cache(max_bytes=40, quantum=0.5)
+
+        # 1.1 and 0.9 are both reduced at 1.0
+        self.assertIs(a.reduce(1.1), a.reduce(0.9))
+        self.assertEqual(a.reduce(1.1), Tensor(a.constants).reduce(1.0))
+        self.assertEqual(a.reduce({"B": 1.2}), Tensor(a.constants, names=["B"]).reduce({"B": 1.0}))
+
+        for value in [2.0, 3.0]:
+            a.reduce(value)
+        self.assertLessEqual(a.cache_stats()["bytes"], 40)
+        self.assertEqual(a.cache_stats()["entries"], 2)
+
+    def test_reduce_cache_unreduced(self):
+        # Reducing no scaler returns the same constants, caching them must not make the tensor read-only
+        a = Tensor(array([[1.0, 2.0], [3.0, 4.0]]), names=["B"]).enable_cache()
+        tensor = a.reduce({})
+
+        self.assertEqual(tensor, Tensor(a.constants, names=["B"]))
+        self.assertFalse(tensor.constants.flags.writeable)
+        self.assertTrue(a.constants.flags.writeable)
+
+    def test_double_double(self):
+        # exp(-20) from its Taylor series cancels terms up to 4e7, float64 keeps no correct digit
+        tensor = Exp(name="f", holder_name="B").generate(120).freeze(precision="double-double")
+        series = tensor.reduce(1.0)
+        x = array([-20.0, -5.0, 3.0])
+
+        self.assertLess(abs(series.evaluate(-20.0) / exp(-20.0) - 1), 1e-14)
+        self.assertGreater(abs(Tensor(tensor.constants).reduce(1.0).evaluate(-20.0) / exp(-20.0) - 1), 1e-3)
+        self.assertEqual(series.evaluate(x).tolist(), [series.evaluate(value) for value in x])
+        out = empty(3)
+        self.assertIs(series.evaluate(x, out=out), out)
+
+        with self.assertRaises(ValueError):
+            tensor.evaluate_grid(array([1.0]), x)
+
+    def test_double_double_parity(self):
+        tensor = Sin(name="f", holder_name="B", max_n=None).generate(120).freeze(precision="double-double")
+        self.assertEqual(tensor.parity, 1)
+        self.assertLess(abs(tensor.reduce(0.0).evaluate(20.0) - math_sin(20.0)), 1e-15)
+        self.assertEqual(tensor.reduce(0.0), tensor.reduce(0.0))
+        self.assertNotEqual(tensor.reduce(0.0), Tensor(tensor.constants, parity=1).reduce(0.0))
+
+    def test_double_double_calculus(self):
+        tensor = Exp(name="f", holder_name="B").generate(60).freeze(precision="double-double")
+        series = tensor.reduce(1.0)
+        for result in [series.derivative(), series.integral(), tensor.derivative(2).reduce(1.0)]:
+            self.assertIsNotNone(result.lo)
+        self.assertIsNotNone(tensor.integral().lo)
+
+        # The rounding error of the scaled high parts is kept, 1/n! stays exact to about 32 digits
+        derivative, integral = series.derivative(), series.integral()
+        for n in range(50):
+            self.assertLess(abs((Fraction(derivative.constants[n]) + Fraction(derivative.lo[n])) * factorial(n) - 1),
+                            1e-30)
+            self.assertLess(abs((Fraction(integral.constants[n + 1]) + Fraction(integral.lo[n + 1])) *
+                                factorial(n + 1) - 1), 1e-30)
+        self.assertLess(abs(series.derivative().evaluate(-10.0) / exp(-10.0) - 1), 1e-14)
+
+        with self.assertRaises(ValueError):
+            series.to_pade(2, 2)
+        with self.assertRaises(ValueError):
+            tensor.to_pade(1.0, 2, 2)
+
+    def test_warmup(self):
+        warmup()
+        self.assertTrue(evaluate_polynomial.signatures)
+        self.assertTrue(evaluate_grid.signatures)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,92 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from fractions import Fraction
+
+from numpy import array, linspace
+
+from src.recursive_math import (IterativeConstant, ScalerHolder, Series, Tensor, Exp, DecimalBackend, FractionBackend,
+                                FixedPointBackend, save, load, load_frozen)
+
+
+def constant(backend):
+    holders = [
+        ScalerHolder(initial_constants=[1, Fraction(1, 3)], name="B", backend=backend),
+        ScalerHolder(initial_constants=[Fraction(-2, 7), 0, 5], name="B", backend=backend),
+        ScalerHolder(initial_constants=[-10 ** 40], name="B", backend=backend),
+    ]
+    return IterativeConstant(initial_holders=holders, name="a")
+
+
+class StorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "coefficients.rm")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_exact_round_trip(self):
+        for backend in [DecimalBackend(), FractionBackend(), FixedPointBackend(bits=64)]:
+            a = constant(backend)
+            save(a, self.path)
+            loaded = load(self.path)
+
+            self.assertEqual(a.name, loaded.name)
+            self.assertEqual(backend, loaded.get(0).backend)
+            self.assertEqual([h.constants for h in a.holders], [h.constants for h in loaded.holders])
+            self.assertEqual(a.freeze(), load_frozen(self.path))
+
+    def test_resume(self):
+        a = constant(FractionBackend())
+        save(a, self.path, freeze=False)
+        loaded = load(self.path, mmap=False)
+        loaded = loaded.append(loaded.get(1).multiply(loaded.get(2)))
+        self.assertEqual(Fraction(2 * 10 ** 40, 7), loaded.get(3).constants[0])
+        self.assertRaises(ValueError, load_frozen, self.path)
+
+    def test_tensor(self):
+        tensor = Tensor(array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]))
+        save(tensor, self.path)
+        loaded = load(self.path)
+
+        self.assertEqual(tensor, loaded)
+        self.assertFalse(loaded.constants.flags.writeable)
+        self.assertEqual(0, loaded.constants.ctypes.data % 64)
+        x = linspace(0, 1, 5)
+        self.assertEqual(tensor.reduce(0.5).evaluate(x).tolist(), loaded.reduce(0.5).evaluate(x).tolist())
+
+    def test_series(self):
+        series = Series(array([1.0, -1.0, 0.5]))
+        save(series, self.path)
+        self.assertEqual(series, load(self.path, mmap=False))
+
+    def test_double_double(self):
+        tensor = Exp(name="f", holder_name="B", backend=FractionBackend()).generate(30).freeze(precision="double-double")
+        for value in [tensor, tensor.reduce(1.0)]:
+            save(value, self.path)
+            loaded = load(self.path)
+
+            self.assertEqual(value, loaded)
+            self.assertEqual(value.lo.tolist(), loaded.lo.tolist())
+        self.assertEqual(loaded.evaluate(1.0), tensor.reduce(1.0).evaluate(1.0))
+
+    def test_invalid_constant(self):
+        self.assertRaises(ValueError, save, IterativeConstant(initial_holders=[], name="a"), self.path)
+
+        holders = constant(FractionBackend()).holders + constant(DecimalBackend()).holders
+        self.assertRaises(ValueError, save, IterativeConstant(initial_holders=holders, name="a"), self.path)
+
+        holders = [ScalerHolder(initial_constants=[1], name=name) for name in ["B", "C"]]
+        self.assertRaises(ValueError, save, IterativeConstant._from_storage(holders, None, name="a"), self.path)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_not_storage(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a coefficient file")
+        self.assertRaises(ValueError, load, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
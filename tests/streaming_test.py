@@ -0,0 +1,62 @@
+import asyncio
+import math
+import unittest
+
+from numpy import linspace
+
+from src.recursive_math import ConvergenceMonitor, DecimalBackend, FractionBackend
+from src.recursive_math.examples import readme_equation, exp_equation
+
+
+class StreamingTest(unittest.TestCase):
+
+    def test_stream_matches_solve(self):
+        recurrence = readme_equation(FractionBackend())
+        terms = list(recurrence.stream(10))
+        self.assertEqual([term.index for term in terms], list(range(10)))
+        a_n = readme_equation(FractionBackend()).solve(10)
+        for term in terms:
+            self.assertEqual(term.holder, a_n.get(term.index))
+            self.assertEqual(list(term.floats), [float(c) for c in a_n.get(term.index).constants])
+
+        # Streaming again reuses the solved terms and goes on from there
+        self.assertEqual(len(list(recurrence.stream(12))), 12)
+        self.assertEqual(recurrence.current(), readme_equation(FractionBackend()).solve(12))
+
+    def test_stops_on_convergence(self):
+        monitor = ConvergenceMonitor(2.0, 0.0, rel_tol=1e-15)
+        a_n = exp_equation(DecimalBackend(precision=50)).solve_until(monitor)
+        self.assertLess(len(a_n), 30)
+        self.assertTrue(math.isclose(monitor.sums[0, 0], math.exp(2), rel_tol=1e-14))
+        self.assertTrue(math.isclose(a_n.freeze().reduce(0.0).evaluate(1.5), math.exp(1.5), rel_tol=1e-14))
+
+        monitor = ConvergenceMonitor(linspace(-0.2, 0.2, 5), linspace(-1, 1, 5), rel_tol=1e-13)
+        backend = DecimalBackend(precision=50)
+        tensor = readme_equation(backend).solve_until(monitor).freeze()
+        reference = readme_equation(backend).solve(200).freeze()
+        for scaler in linspace(-1, 1, 9):
+            self.assertAlmostEqual(tensor.reduce(scaler).evaluate(0.2), reference.reduce(scaler).evaluate(0.2),
+                                   places=12)
+
+    def test_divergent_region(self):
+        # The README series does not converge at x = 0.5 once |B| is close to 1
+        monitor = ConvergenceMonitor(0.5, linspace(-1, 1, 5))
+        with self.assertRaises(ValueError):
+            readme_equation(DecimalBackend(precision=50)).solve_until(monitor, max_terms=40)
+        self.assertEqual(monitor.length, 40)
+
+    def test_astream(self):
+        recurrence = readme_equation(FractionBackend())
+
+        async def collect():
+            partial = []
+            async for term in recurrence.astream(8):
+                partial.append(len(recurrence.current()))
+            return partial
+
+        self.assertEqual(asyncio.run(collect()), [2] + list(range(2, 9)))
+        self.assertEqual(recurrence.current(), readme_equation(FractionBackend()).solve(8))
+
+
+if __name__ == '__main__':
+    unittest.main()